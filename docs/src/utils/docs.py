@@ -2,6 +2,7 @@ import os
 import re
 import markdown
 from nexy.core.config import Config
+from nexy.utils.highlight import cached_extensions
 
 def find_doc_file(language, path_parts):
     base_path = "_docs"
@@ -58,7 +59,8 @@ def get_doc_content(lang, slug):
             # Clean and render
             clean_content = re.sub(r"^---.*?---", "", content, flags=re.DOTALL)
             conf = Config()
-            html = markdown.markdown(clean_content, extensions=conf.MARKDOWN_EXTENSIONS + ["toc"])
+            extensions, configs = cached_extensions(conf.MARKDOWN_EXTENSIONS + ["toc"])
+            html = markdown.markdown(clean_content, extensions=extensions, extension_configs=configs)
             return {"html": html, "title": title}
             
     return {"html": "<h1>404 - Page Not Found</h1>", "title": "Not Found"}
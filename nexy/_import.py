@@ -1,5 +1,5 @@
 from pathlib import Path
-from typing import Any, Callable
+from typing import Any, Callable, Optional
 
 from nexy.utils.imports.images import Image
 from nexy.utils.imports.css import CSS
@@ -9,8 +9,10 @@ from nexy.utils.imports.ncc import NCC
 
 class Import:
     """Wrapper that delegates to the specific NCC generator."""
-    def __init__(self, path: str, framework: str, symbol: str) -> None:
-        self.generator = NCC(path, framework, symbol)
+    def __init__(self, path: str, framework: str, symbol: str,
+                 url: Optional[str] = None, key: Optional[str] = None) -> None:
+        # url / key: constants written by the compiler in the generated module
+        self.generator = NCC(path, framework, symbol, url=url, key=key)
 
     def __call__(self, **kwargs: Any) -> str:
         return self.generator.generate(kwargs)
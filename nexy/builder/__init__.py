@@ -1,7 +1,10 @@
 from nexy.builder.discovery import Discovery
 from nexy.utils.console import console
 from nexy.compiler import Compiler
+from nexy.core.assets import StyleAssets
 from nexy.core.config import Config
+from nexy.errors import NexyCompileError
+from nexy.template import compile_templates
 
 
 class Builder:
@@ -9,6 +12,7 @@ class Builder:
         self.discovery = Discovery()
         self.compiler = Compiler()
         self.config = Config()
+        self.templates: list[str] = []
 
         exclude_dirs = getattr(self.config, "excludeDirs", [])
         for name in exclude_dirs:
@@ -16,14 +20,33 @@ class Builder:
 
     def build(self,showlog: bool = False) -> None:
         files = self.discovery.scan(self.config.PROJECT_ROOT)
+        self.templates = []
+        # Feuilles de style republiées par la compilation de chaque composant
+        StyleAssets.clean()
         for file in files:
             input_path = file.as_posix()
             try:
                 self.compiler.compile(input=input_path)
+                self.templates.extend(self.compiler.templates)
                 if showlog:
                     console.print(f"[green]nsc[/green] » compiled [reset][dim]{input_path}[/dim] [green]✓[/green]")
             except Exception as e:
                 console.print(f"[red]nsc[/red] » error compiling [reset][dim]{input_path}[/dim] [red]✗[/red]")
                 console.print(f"[red]nsc[/red] » {e}")
 
+    def precompile(self, showlog: bool = False) -> None:
+        """
+        Compile les templates générés en modules Python pour `nexy start`.
+        Un échec fait échouer le build : la production ne doit pas démarrer sans ses modules.
+        """
+        try:
+            compiled = compile_templates(self.templates)
+        except NexyCompileError as e:
+            console.print("[red]nsc[/red] » error precompiling templates [red]✗[/red]")
+            console.print(f"[red]nsc[/red] » {e}")
+            raise
+        if showlog:
+            console.print(f"[green]nsc[/green] » precompiled [reset][dim]{len(compiled)} templates[/dim] [green]✓[/green]")
+
+
 __all__ = ["Builder"]
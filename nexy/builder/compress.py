@@ -0,0 +1,68 @@
+import gzip
+from pathlib import Path
+from typing import Callable, Iterable, List, Optional, Tuple
+
+from nexy.core.config import Config
+
+try:
+    import brotli
+except ImportError:  # Extra optionnel : pip install "nexy[brotli]"
+    brotli = None
+
+
+class AssetCompressor:
+    """
+    Écrit à côté de chaque asset compressible ses versions `.gz` et `.br` (si brotli est installé).
+
+    Le serveur choisit ensuite la variante selon `Accept-Encoding` : aucune compression
+    n'a lieu pendant les requêtes.
+    """
+
+    def __init__(self, min_size: Optional[int] = None) -> None:
+        self.min_size = Config.COMPRESS_MIN_SIZE if min_size is None else min_size
+
+    @staticmethod
+    def encoders() -> List[Tuple[str, Callable[[bytes], bytes]]]:
+        """(extension, fonction de compression) disponibles."""
+        found = [(".gz", lambda data: gzip.compress(data, compresslevel=9, mtime=0))]
+        if brotli is not None:
+            found.append((".br", lambda data: brotli.compress(data, quality=11)))
+        return found
+
+    def _compressible(self, path: Path) -> bool:
+        return path.suffix.lower() in Config.COMPRESSIBLE_EXTENSIONS and path.stat().st_size >= self.min_size
+
+    def compress_file(self, path: Path) -> List[Path]:
+        """Variantes écrites pour un fichier ; une variante plus grosse que l'original est ignorée."""
+        written: List[Path] = []
+        data: Optional[bytes] = None
+        mtime = path.stat().st_mtime
+        for suffix, encode in self.encoders():
+            target = path.with_name(path.name + suffix)
+            if target.is_file() and target.stat().st_mtime >= mtime:
+                # Déjà à jour (assets adressés par leur contenu)
+                written.append(target)
+                continue
+            data = path.read_bytes() if data is None else data
+            encoded = encode(data)
+            if len(encoded) >= len(data):
+                target.unlink(missing_ok=True)
+                continue
+            target.write_bytes(encoded)
+            written.append(target)
+        return written
+
+    def compress(self, directories: Iterable[str]) -> List[Path]:
+        """Compresse tous les assets des dossiers donnés (ignorés s'ils n'existent pas)."""
+        written: List[Path] = []
+        for directory in directories:
+            root = Path(directory)
+            if not root.is_dir():
+                continue
+            for path in sorted(root.rglob("*")):
+                if path.is_file() and self._compressible(path):
+                    written.extend(self.compress_file(path))
+        return written
+
+
+__all__ = ["AssetCompressor"]
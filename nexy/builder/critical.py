@@ -0,0 +1,226 @@
+import asyncio
+import json
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from nexy.core.assets import StyleAssets
+from nexy.core.config import Config
+from nexy.utils.console import console
+
+_COMMENT_RE = re.compile(r"/\*.*?\*/", re.S)
+_LINK_RE = re.compile(r"<link\b[^>]*>", re.I)
+_HREF_RE = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.I)
+_STYLESHEET_RE = re.compile(r'\brel\s*=\s*["\']?stylesheet\b', re.I)
+_PSEUDO_RE = re.compile(r"::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?")
+_ATTRIBUTE_RE = re.compile(r"\[[^\]]*\]")
+_CLASS_RE = re.compile(r"\.((?:[\w-]|\\.)+)")
+_ID_RE = re.compile(r"#((?:[\w-]|\\.)+)")
+_TYPE_RE = re.compile(r"(?:^|[\s>+~])([a-zA-Z][\w-]*)")
+_KEYFRAMES_RE = re.compile(r"@(?:-\w+-)?keyframes\s+([\w-]+)")
+
+# At-rules dont le contenu est une liste de règles à filtrer
+_GROUP_RULES = ("@media", "@supports", "@layer", "@container")
+# Toujours conservées : elles ne coûtent rien tant qu'aucune règle ne s'en sert
+_KEEP_RULES = ("@font-face", "@property", "@charset", "@layer")
+
+
+class _DocumentScanner(HTMLParser):
+    """Balises, ids et classes présents dans le HTML rendu."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.tags: Set[str] = {"html", "body", "*"}
+        self.ids: Set[str] = set()
+        self.classes: Set[str] = set()
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        self.tags.add(tag.lower())
+        for name, value in attrs:
+            if name == "id" and value:
+                self.ids.add(value)
+            elif name == "class" and value:
+                self.classes.update(value.split())
+
+
+class CriticalCSS:
+    """
+    Étape de build : le CSS critique de chaque route.
+
+    Chaque page exportable est rendue en mémoire ; seules les règles de ses feuilles de
+    style dont les sélecteurs correspondent au HTML produit sont conservées. En production,
+    `StyleAssets.hoist` les insère dans le <head> et charge les feuilles complètes en différé.
+    """
+
+    def __init__(self, target: Optional[str] = None) -> None:
+        self.target = Path(target or Config.CRITICAL_CSS_PATH)
+
+    def clean(self) -> None:
+        """Supprime le manifeste d'un build précédent."""
+        self.target.unlink(missing_ok=True)
+        StyleAssets.critical_manifest.cache_clear()
+
+    # --- CSS ---
+
+    @staticmethod
+    def _blocks(css: str) -> Iterator[Tuple[str, Optional[str]]]:
+        """(prélude, contenu) des blocs de premier niveau ; contenu None pour `@import ...;`."""
+        i, length = 0, len(css)
+        while i < length:
+            start = i
+            while i < length and css[i] not in "{;":
+                i += 1
+            prelude = css[start:i].strip()
+            if i >= length:
+                return
+            if css[i] == ";":
+                i += 1
+                if prelude:
+                    yield prelude, None
+                continue
+            depth, i = 1, i + 1
+            body_start = i
+            while i < length and depth:
+                if css[i] == "{":
+                    depth += 1
+                elif css[i] == "}":
+                    depth -= 1
+                elif css[i] in "\"'":
+                    quote, i = css[i], i + 1
+                    while i < length and css[i] != quote:
+                        i += 2 if css[i] == "\\" else 1
+                i += 1
+            yield prelude, css[body_start : i - 1]
+
+    @staticmethod
+    def _split_selectors(prelude: str) -> List[str]:
+        selectors: List[str] = []
+        current: List[str] = []
+        depth = 0
+        for char in prelude:
+            if char in "([":
+                depth += 1
+            elif char in ")]":
+                depth -= 1
+            if char == "," and not depth:
+                selectors.append("".join(current))
+                current = []
+            else:
+                current.append(char)
+        selectors.append("".join(current))
+        return [s.strip() for s in selectors if s.strip()]
+
+    @staticmethod
+    def _matches(selector: str, document: _DocumentScanner) -> bool:
+        """Un sélecteur est conservé si toutes ses balises, classes et ids existent dans la page."""
+        selector = _ATTRIBUTE_RE.sub("", _PSEUDO_RE.sub("", selector))
+
+        def unescape(name: str) -> str:
+            return re.sub(r"\\(.)", r"\1", name)
+
+        return (
+            all(unescape(c) in document.classes for c in _CLASS_RE.findall(selector))
+            and all(unescape(i) in document.ids for i in _ID_RE.findall(selector))
+            and all(
+                t.lower() in document.tags
+                for t in _TYPE_RE.findall(_CLASS_RE.sub("", _ID_RE.sub("", selector)))
+            )
+        )
+
+    @classmethod
+    def _filter(cls, css: str, document: _DocumentScanner) -> str:
+        kept: List[str] = []
+        keyframes: Dict[str, str] = {}
+        for prelude, body in cls._blocks(css):
+            lowered = prelude.lower()
+            if body is None:
+                if lowered.startswith(_KEEP_RULES):
+                    kept.append(f"{prelude};")
+                continue
+            if lowered.startswith(_GROUP_RULES):
+                inner = cls._filter(body, document)
+                if inner:
+                    kept.append(f"{prelude}{{{inner}}}")
+            elif match := _KEYFRAMES_RE.match(lowered):
+                keyframes[match.group(1)] = f"{prelude}{{{body}}}"
+            elif lowered.startswith(_KEEP_RULES) or (
+                not prelude.startswith("@")
+                and any(cls._matches(s, document) for s in cls._split_selectors(prelude))
+            ):
+                kept.append(f"{prelude}{{{body.strip()}}}")
+        result = "".join(kept)
+        # Animations utilisées par les règles conservées
+        used = [
+            rule for name, rule in keyframes.items() if re.search(rf"\b{re.escape(name)}\b", result)
+        ]
+        return result + "".join(used)
+
+    @classmethod
+    def extract(cls, html: str, css: str) -> str:
+        """Sous-ensemble de `css` utilisé par `html`."""
+        document = _DocumentScanner()
+        document.feed(html)
+        return cls._filter(_COMMENT_RE.sub("", css), document)
+
+    # --- pages ---
+
+    @staticmethod
+    def stylesheets(html: str) -> List[str]:
+        """URL des feuilles de style chargées par la page (assets des composants, Vite, public/)."""
+        hrefs: List[str] = []
+        for tag in _LINK_RE.findall(html):
+            href = _HREF_RE.search(tag)
+            if _STYLESHEET_RE.search(tag) and href and href.group(1) not in hrefs:
+                hrefs.append(href.group(1))
+        return hrefs
+
+    @staticmethod
+    def _read(href: str) -> Optional[str]:
+        """Contenu d'une feuille servie par l'application (les URL externes sont ignorées)."""
+        mounts = {f"{Config.STYLE_ASSETS_URL}/": Config.STYLE_ASSETS_PATH, "/public/": "public"}
+        for prefix, directory in mounts.items():
+            if href.startswith(prefix):
+                try:
+                    return (Path(directory) / href[len(prefix) :].split("?")[0]).read_text(
+                        encoding="utf-8"
+                    )
+                except OSError:
+                    return None
+        return None
+
+    def build(self, showlog: bool = False) -> Dict[str, Dict[str, object]]:
+        """Rend chaque page exportable (ISR comprises) et écrit le manifeste source -> CSS."""
+        from nexy.builder.static import StaticExporter, fetch
+        from nexy.routers.app import AppServer
+
+        exporter = StaticExporter()
+        self.clean()
+        app = AppServer().run()
+
+        # Une route dynamique : l'union de ses pages exportées
+        pages: Dict[str, List[str]] = {}
+        for source, url in exporter.pages(revalidated=True):
+            status, headers, body = asyncio.run(fetch(app, url))
+            if status == 200 and headers.get("content-type", "").startswith("text/html"):
+                pages.setdefault(source, []).append(body.decode("utf-8", "replace"))
+
+        manifest: Dict[str, Dict[str, object]] = {}
+        for source, documents in pages.items():
+            html = "".join(documents)
+            hrefs = [href for href in self.stylesheets(html) if self._read(href) is not None]
+            if not hrefs:
+                continue
+            css = "".join(self.extract(html, self._read(href) or "") for href in hrefs)
+            manifest[source] = {"css": css, "stylesheets": hrefs}
+            if showlog:
+                size = f"[dim]{source}[/dim] ({len(css)} B)"
+                console.print(f"[green]nsc[/green] » critical css [reset]{size} [green]✓[/green]")
+
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        self.target.write_text(json.dumps(manifest), encoding="utf-8")
+        StyleAssets.critical_manifest.cache_clear()
+        return manifest
+
+
+__all__ = ["CriticalCSS"]
@@ -0,0 +1,117 @@
+import hashlib
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from nexy.compiler.generator.graph import ComponentGraph
+from nexy.core.config import Config
+from nexy.core.string import Pathname
+from nexy.frontend.hydration import SCHEDULE_SCRIPT
+from nexy.routers.fbrouter.discovery import RouteDiscovery
+from nexy.utils.console import console
+
+GLOBAL_STYLES = "src/globale.css"
+
+# Remplace le glob de runtime.ts : seuls les îlots enregistrés par l'entrée de la route sont chargeables
+ISLANDS_RUNTIME = """import { __NEXY_KEYS } from '@nexy/keys.auto.ts';
+type Importer = () => Promise<unknown>
+const importers: Record<string, Importer> = {}
+const w: any = window as any;
+w.__nexy_import = (p: string) => {
+  let key = p;
+  if (!key.startsWith('/')) key = (__NEXY_KEYS as any)[key] || '/' + key;
+  const imp = importers[key];
+  if (!imp) return Promise.reject(new Error('Component not found: ' + p));
+  return imp();
+}
+export const register = (map: Record<string, Importer>) => { Object.assign(importers, map) }
+""" + SCHEDULE_SCRIPT
+
+
+class IslandManifest:
+    """
+    Étape de build : le JavaScript de chaque route.
+
+    Les composants client (îlots) qu'une page rend, elle-même ou via ses layouts et ses
+    composants, sont relevés dans le graphe des composants. Chaque page qui en rend reçoit
+    une entrée Vite qui ne charge que ces îlots et les runtimes de leurs frameworks ;
+    `Vite()` n'injecte que les fichiers de la route servie. Une page sans îlot n'embarque aucun JS.
+    """
+
+    def __init__(self, target: Optional[str] = None, entries: Optional[str] = None) -> None:
+        self.target = Path(target or Config.ISLANDS_MANIFEST_PATH)
+        self.entries = Path(entries or Config.ISLANDS_ENTRIES_PATH)
+        self.graph = ComponentGraph()
+
+    def clean(self) -> None:
+        """Supprime le manifeste et les entrées d'un build précédent."""
+        self.target.unlink(missing_ok=True)
+        shutil.rmtree(self.entries, ignore_errors=True)
+
+    @staticmethod
+    def pages() -> Iterator[Tuple[str, str]]:
+        """(source, chemin de la route) des pages .nexy / .mdx, comme FBRouter les enregistre."""
+        for path in RouteDiscovery().scan():
+            if path.suffix not in Config.TARGET_EXTENSIONS or path.name.lower() in ("error.nexy", "notfound.nexy"):
+                continue
+            source = path.as_posix()
+            yield source, Pathname(source.replace(Config.ROUTER_PATH, "").split(".")[0]).process()
+
+    @staticmethod
+    def entry_name(pathname: str) -> str:
+        """/blog/{slug} -> blog_slug-<hash> : lisible, et unique même si deux routes se ressemblent."""
+        slug = re.sub(r"[^A-Za-z0-9]+", "_", pathname).strip("_") or "index"
+        return f"{slug}-{hashlib.sha1(pathname.encode('utf-8')).hexdigest()[:8]}"
+
+    def entry(self, islands: List[Tuple[str, str]]) -> str:
+        """Module d'entrée d'une route : ses îlots, puis les runtimes de leurs frameworks."""
+        runtimes = [
+            framework for framework in dict.fromkeys(framework.lower() for _, framework in islands)
+            if (self.entries.parent / f"{framework}.nexy.ts").is_file()
+        ]
+        inits = {name: "init_" + re.sub(r"\W", "_", name) for name in runtimes}
+        lines = ["import { register } from '@nexy/islands.ts';"]
+        lines.extend(f"import {init} from '@nexy/{name}.nexy.ts';" for name, init in inits.items())
+        lines.append("register({")
+        for path, _ in islands:
+            url = "/" + path.lstrip("/")
+            lines.append(f"  {json.dumps(url)}: () => import({json.dumps(url)}),")
+        lines.append("});")
+        lines.extend(f"{init}();" for init in inits.values())
+        lines.append("export {};")
+        return "\n".join(lines) + "\n"
+
+    def build(self, showlog: bool = False) -> Dict[str, Any]:
+        """Écrit les entrées Vite des routes et le manifeste route -> entrée lu par vite.ts et `Vite()`."""
+        self.clean()
+        self.entries.mkdir(parents=True, exist_ok=True)
+        (self.entries.parent / "islands.ts").write_text(ISLANDS_RUNTIME, encoding="utf-8")
+
+        entries: Dict[str, str] = {}
+        routes: Dict[str, Dict[str, Any]] = {}
+        for source, pathname in self.pages():
+            islands = self.graph.islands(source)
+            entry: Optional[str] = None
+            if islands:
+                name = self.entry_name(pathname)
+                path = self.entries / f"{name}.ts"
+                path.write_text(self.entry(islands), encoding="utf-8")
+                entry = entries[name] = path.as_posix()
+            routes[pathname] = {"source": source, "entry": entry, "islands": [island for island, _ in islands]}
+            if showlog:
+                count = f"{len(islands)} island(s)" if islands else "no JS"
+                console.print(f"[green]nsc[/green] » islands [reset][dim]{pathname}[/dim] ({count}) [green]✓[/green]")
+
+        manifest = {
+            "styles": GLOBAL_STYLES if Path(GLOBAL_STYLES).is_file() else None,
+            "entries": entries,
+            "routes": routes,
+        }
+        self.target.parent.mkdir(parents=True, exist_ok=True)
+        self.target.write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return manifest
+
+
+__all__ = ["IslandManifest"]
@@ -0,0 +1,164 @@
+import asyncio
+import inspect
+import json
+import re
+import shutil
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import quote, unquote
+
+from nexy.builder.compress import AssetCompressor
+from nexy.core.config import Config
+from nexy.utils.console import console
+
+MANIFEST = "manifest.json"
+# En-têtes de la réponse rendue conservés pour la page servie depuis le disque (politique `cache`)
+KEPT_HEADERS = ("cache-control", "vary")
+_PARAM_RE = re.compile(r"\{(\w+)(:path)?\}")
+
+
+async def fetch(app: Any, url: str) -> Tuple[int, Dict[str, str], bytes]:
+    """
+    Requête GET en mémoire sur l'application ASGI ; `url` est encodée, comme sur le réseau.
+    Sert à l'export statique et à l'extraction du CSS critique.
+    """
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1",
+        "method": "GET", "scheme": "http", "path": unquote(url), "raw_path": url.encode(),
+        "query_string": b"", "root_path": "", "headers": [(b"host", b"localhost")],
+        "client": ("127.0.0.1", 0), "server": ("localhost", 80),
+    }
+    status, headers, body = 500, {}, bytearray()
+    requested = False
+    finished = asyncio.Event()
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal requested
+        if not requested:
+            requested = True
+            return {"type": "http.request", "body": b"", "more_body": False}
+        # Comme un vrai serveur : la déconnexion n'arrive qu'une fois la réponse envoyée
+        await finished.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status, headers
+        if message["type"] == "http.response.start":
+            status = message["status"]
+            headers = {k.decode().lower(): v.decode() for k, v in message.get("headers", [])}
+        elif message["type"] == "http.response.body":
+            body.extend(message.get("body", b""))
+            if not message.get("more_body", False):
+                finished.set()
+
+    await app(scope, receive, send)
+    return status, headers, bytes(body)
+
+
+class StaticExporter:
+    """
+    `nexy build --static` : prérend les routes Nexy (.nexy, .mdx) en fichiers HTML.
+
+    Les pages sont rendues par l'application elle-même (appel ASGI en mémoire), puis
+    écrites dans Config.STATIC_EXPORT_PATH (avec leurs variantes .gz / .br) et un
+    manifeste url -> fichier que `AppServer` sert directement en production.
+    """
+
+    def __init__(self, target: Optional[str] = None) -> None:
+        self.target = Path(target or Config.STATIC_EXPORT_PATH)
+
+    def clean(self) -> None:
+        """Supprime un export précédent (un build non statique ne doit pas servir d'anciennes pages)."""
+        shutil.rmtree(self.target, ignore_errors=True)
+
+    @staticmethod
+    def _params(module: Any) -> List[Dict[str, Any]]:
+        """Paramètres des routes dynamiques, fournis par le hook `static_params` (liste ou fonction)."""
+        hook = getattr(module, "static_params", None)
+        if hook is None:
+            return []
+        params = hook() if callable(hook) else hook
+        if inspect.iscoroutine(params):
+            params = asyncio.run(params)
+        return list(params or [])
+
+    @staticmethod
+    def _fill(pathname: str, params: Dict[str, Any]) -> str:
+        """/blog/{slug} + {"slug": "hello"} -> /blog/hello"""
+        return _PARAM_RE.sub(
+            lambda m: quote(str(params[m.group(1)]), safe="/" if m.group(2) else ""),
+            pathname,
+        )
+
+    def pages(self, revalidated: bool = False) -> Iterable[Tuple[str, str]]:
+        """
+        (source, url) de chaque page exportable : routes statiques et routes dynamiques listées par `static_params`.
+        `revalidated` ajoute les pages ISR, que l'export laisse au serveur mais qui ont aussi un CSS critique.
+        """
+        from nexy.routers.fbrouter import FBRouter
+
+        for meta in FBRouter().modules_meta:
+            module = meta["module"]
+            if meta["type"] != "component" or module is None:
+                continue
+            if getattr(module, "revalidate", None) and not revalidated:
+                # Page régénérée périodiquement : elle reste rendue par le serveur
+                continue
+            pathname = meta["pathname"]
+            if not _PARAM_RE.search(pathname):
+                yield meta["source"], pathname
+                continue
+            for params in self._params(module):
+                yield meta["source"], self._fill(pathname, params)
+
+    def urls(self) -> Iterable[str]:
+        """Toutes les URL exportables."""
+        return (url for _, url in self.pages())
+
+    @staticmethod
+    def file_for(url: str) -> str:
+        """/ -> index.html, /blog -> blog/index.html"""
+        path = url.strip("/")
+        return f"{path}/index.html" if path else "index.html"
+
+    def export(self, showlog: bool = False) -> Dict[str, Dict[str, Any]]:
+        """Rend et écrit toutes les pages exportables ; retourne le manifeste url -> {fichier, en-têtes}."""
+        from nexy.routers.app import AppServer
+
+        self.clean()
+        app = AppServer().run()
+        manifest: Dict[str, Dict[str, Any]] = {}
+
+        for url in self.urls():
+            status, headers, body = asyncio.run(fetch(app, url))
+            if status != 200 or not headers.get("content-type", "").startswith("text/html"):
+                console.print(f"[yellow]nsc[/yellow] » skipped [reset][dim]{url}[/dim] ({status})")
+                continue
+            name = self.file_for(url)
+            output = self.target / name
+            output.parent.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(body)
+            kept = {key: value for key, value in headers.items() if key in KEPT_HEADERS}
+            # Clé décodée, comme request.url.path : /blog/b%20c est cherché en /blog/b c
+            manifest[unquote(url)] = {"file": name, "headers": kept}
+            if showlog:
+                console.print(f"[green]nsc[/green] » exported [reset][dim]{url}[/dim] [green]✓[/green]")
+
+        self.target.mkdir(parents=True, exist_ok=True)
+        # Variantes .gz / .br servies selon Accept-Encoding, comme les autres assets du build
+        AssetCompressor().compress([str(self.target)])
+        (self.target / MANIFEST).write_text(json.dumps(manifest, indent=2), encoding="utf-8")
+        return manifest
+
+    @classmethod
+    def load(cls, target: Optional[str] = None) -> Dict[str, Tuple[Path, Dict[str, str]]]:
+        """Pages exportées (url -> (fichier, en-têtes Cache-Control / Vary)), lues au démarrage du serveur."""
+        directory = Path(target or Config.STATIC_EXPORT_PATH)
+        try:
+            manifest = json.loads((directory / MANIFEST).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+        return {url: (directory / page["file"], page.get("headers") or {}) for url, page in manifest.items()}
+
+
+__all__ = ["StaticExporter", "fetch"]
@@ -1,26 +1,67 @@
 import sys
+import typer
 from nexy.__version__ import __Version__
 from nexy.builder import Builder
+from nexy.builder.compress import AssetCompressor
+from nexy.builder.critical import CriticalCSS
+from nexy.builder.islands import IslandManifest
+from nexy.builder.static import StaticExporter
 from nexy.cli.commands.utilities.console import console
 from nexy.cli.commands.utilities.server import Server
+from nexy.core.assets import StyleAssets
 from nexy.core.config import Config
+from nexy.errors import NexyCompileError
 from nexy.frontend import FrontendGenerator
 from nexy.i18n import t
 
 
-def build() -> None:
+def build(
+    static: bool = typer.Option(
+        False,
+        "--static",
+        help="Prerender Nexy routes to HTML files served without rendering.",
+    )
+) -> None:
     config = Config()
     version = __Version__().get()
     Server.check_nexy_prod()
     console.print(f"nexy@{version} build")
     with console.status("\n[green]nsc[/green] » compile...", spinner="dots"):
         FrontendGenerator().generate(ssg=True)
-        Builder().build(showlog=True)
+        builder = Builder()
+        builder.build(showlog=True)
+        try:
+            builder.precompile(showlog=True)
+        except NexyCompileError:
+            sys.exit(1)
+        # Avant Vite : vite.ts lit les entrées par route dans le manifeste des îlots
+        IslandManifest().build(showlog=True)
     
     if getattr(config, "useVite", False):
         try :
             vite_proc = Server.vite(build=True)
             vite_proc.wait()
+            # Vite vide __nexy__/client : les feuilles de style des composants sont republiées
+            StyleAssets.republish()
         except Exception as e:
             console.print(t("build.vite_failed", f"Vite build failed. {e}").format(error=e))
             sys.exit(1)
+
+    # Après Vite : les assets finaux reçoivent leurs variantes .gz / .br
+    AssetCompressor().compress([Config.STYLE_ASSETS_PATH, "public"])
+
+    critical = CriticalCSS()
+    if getattr(config, "useCriticalCSS", False):
+        # Avant l'export : les pages exportées embarquent leur CSS critique
+        with console.status("\n[green]nsc[/green] » critical css...", spinner="dots"):
+            critical.build(showlog=True)
+    else:
+        critical.clean()
+
+    exporter = StaticExporter()
+    if static:
+        # Après Vite : les pages exportées référencent les assets du build client
+        with console.status("\n[green]nsc[/green] » export...", spinner="dots"):
+            exporter.export(showlog=True)
+    else:
+        exporter.clean()
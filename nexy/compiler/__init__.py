@@ -15,6 +15,8 @@ class Compiler:
     def __init__(self) -> None:
         self.input: str = ""
         self.output: str | None = None
+        # Every template written by the last compile (output included)
+        self.templates: list[str] = []
         self.parser = Parser()
         self.generator = Generator()
         self.source_code: str = ""
@@ -53,6 +55,7 @@ class Compiler:
         try:
             CODE_PARSED: PaserModel = self.parser.process(source_code=self.source_code, current_file=self.input)
             self.generator.generate(self.output, CODE_PARSED, source_path=self.input)
+            self.templates = [self.output, *self.generator.logic.templates]
         except NexyCompileError:
             raise
         except Exception as e:
@@ -1,12 +1,15 @@
 
 import os
+from dataclasses import replace
 from pathlib import Path
 from nexy.core.models import PaserModel
 from .logic import LogicGenerator
+from .minify import HTMLMinifier
 from .template import TemplateGenerator
 from nexy.utils.console import console
 from nexy.errors import NexyCompileError
 from nexy.core.config import Config
+from nexy.utils.mode import is_prod
 
 
 class Generator:
@@ -22,6 +25,13 @@ class Generator:
             directory = os.path.dirname(output)
             if directory:
                 os.makedirs(directory, exist_ok=True)
+            if is_prod():
+                # Les composants statiques importés sont inlinés dans le template au build
+                # (les layouts aplatis le sont aussi, par LayoutFlattener)
+                self.source = self.logic.hoister.apply(self.source)
+            if output.endswith(".html") and HTMLMinifier.enabled(self.logic.config):
+                # Espaces non significatifs retirés une fois pour toutes au build
+                self.source = replace(self.source, template=HTMLMinifier.minify(self.source.template))
             self.logic.generate(template_path=output, source=self.source, source_path=source_path)
             self.template.generate(output=output, source=self.source.template)
             self._generate_init(directory)
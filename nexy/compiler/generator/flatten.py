@@ -0,0 +1,102 @@
+import ast
+import re
+from pathlib import Path
+from typing import List, Optional, Set, Tuple
+
+from nexy.core.models import PaserModel
+from nexy.routers.fbrouter.layout import RouteLayout
+from .graph import ComponentGraph
+from .hoist import StaticHoister
+
+
+class LayoutFlattener:
+    """
+    Merges a page template and its whole layout chain into a single template at build time.
+
+    Each layout keeps its own variables through a `{% with %}` scope fed by the layout's
+    context (`Layout(_nexy_context=True)`), and its `{{ children | safe }}` slot is replaced
+    by the next level. Layouts that use `children` in any other way are not flattened.
+    """
+
+    CHILDREN_RE = re.compile(r"\{\{\s*children\s*(?:\|\s*safe\s*)?\}\}")
+    CHILDREN_NAME_RE = re.compile(r"\bchildren\b")
+    UNSUPPORTED_RE = re.compile(r"\{%-?\s*(?:extends|block|endblock)\b")
+    NSLOT = "<nslot  style='display:contents;'>"
+    UNDEFINED = "__nexy_undefined"
+
+    def __init__(self, graph: ComponentGraph, hoister: Optional[StaticHoister] = None) -> None:
+        self.graph = graph
+        # Static children are inlined in the page and each layout, as in their own compiled templates
+        self.hoister = hoister
+
+    @staticmethod
+    def _strip_newline(template: str) -> str:
+        """Each template rendered on its own loses one trailing newline (keep_trailing_newline=False)."""
+        if template.endswith("\r\n"):
+            return template[:-2]
+        if template.endswith("\n"):
+            return template[:-1]
+        return template
+
+    @classmethod
+    def _accepts_children(cls, layout: PaserModel) -> bool:
+        """The layout only outputs `children` once, through a plain `{{ children }}` slot."""
+        template = layout.template
+        if len(cls.CHILDREN_RE.findall(template)) != 1 or cls.UNSUPPORTED_RE.search(template):
+            return False
+        if cls.CHILDREN_NAME_RE.search(cls.CHILDREN_RE.sub("", template)):
+            return False
+        try:
+            tree = ast.parse(layout.frontmatter)
+        except SyntaxError:
+            return False
+        return not any(isinstance(node, ast.Name) and node.id == "children" for node in ast.walk(tree))
+
+    @classmethod
+    def _scope(cls, source: str, names: List[str], hidden: Set[str]) -> str:
+        """`{% with %}` binding a level's own names and hiding the names of the levels around it."""
+        bindings = [f'{name}={source}["{name}"]' for name in names]
+        bindings += [f"{name}={cls.UNDEFINED}" for name in sorted(hidden - set(names))]
+        return f"{{% with {', '.join(bindings)} %}}" if bindings else "{% with %}"
+
+    def flatten(self, source_path: str, page: PaserModel) -> Optional[Tuple[str, List[Path]]]:
+        """
+        Returns the combined template and the layouts it contains (root first),
+        or None when the page has no layout or one of its layouts cannot be flattened.
+        """
+        chain = list(reversed(RouteLayout.get_chain(source_path)))
+        if not chain:
+            return None
+
+        layouts: List[PaserModel] = []
+        for path in chain:
+            model = self.graph.parse(path.as_posix())
+            if model is None or model.is_async or not self._accepts_children(model):
+                return None
+            layouts.append(self.hoister.apply(model) if self.hoister else model)
+
+        scopes = [[n for n in ComponentGraph.context_names(m) if n != "children"] for m in layouts]
+        outer: List[Set[str]] = [set().union(*scopes[:i]) for i in range(len(scopes) + 1)]
+
+        if self.hoister:
+            page = self.hoister.apply(page)
+        page_scope = self._scope("__page", ComponentGraph.context_names(page), outer[-1])
+        inner = f"{page_scope}{self._strip_newline(page.template)}{{% endwith %}}"
+
+        for i in reversed(range(len(layouts))):
+            template = self._strip_newline(layouts[i].template)
+            slot = f"{self.NSLOT}{inner}</nslot>"
+
+            def fill(_: re.Match[str], slot: str = slot) -> str:
+                # Function, not a replacement string: the slot is inserted verbatim
+                return slot
+
+            body = self.CHILDREN_RE.sub(fill, template)
+            inner = f"{self._scope(f'__l{i}', scopes[i], outer[i])}{body}{{% endwith %}}"
+            if i > 0:
+                # Styles of a nested layout follow its render, inside the parent's slot
+                inner += f"{{{{ __s{i} }}}}"
+        return inner, chain
+
+
+__all__ = ["LayoutFlattener"]
@@ -0,0 +1,181 @@
+import ast
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from nexy.compiler.parser import Parser
+from nexy.compiler.parser.logic import ASTUtils
+from nexy.core.assets import StyleAssets
+from nexy.core.config import Config
+from nexy.core.models import PaserModel
+from nexy.routers.fbrouter.layout import RouteLayout
+
+
+class ComponentGraph:
+    """
+    Build-time view of the components a .nexy/.mdx file depends on:
+    its layout chain and the Nexy components it imports.
+    Each source is parsed once per modification time.
+    """
+
+    def __init__(self) -> None:
+        self.parser = Parser()
+        self._parsed: Dict[str, Tuple[float, Optional[PaserModel]]] = {}
+
+    def parse(self, source_path: str) -> Optional[PaserModel]:
+        """Parses a component source, or returns None when it cannot be read or parsed."""
+        path = Path(source_path)
+        try:
+            mtime = path.stat().st_mtime
+        except OSError:
+            return None
+
+        cached = self._parsed.get(path.as_posix())
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+
+        try:
+            model: Optional[PaserModel] = self.parser.process(
+                source_code=path.read_text(encoding="utf-8"),
+                current_file=path.as_posix(),
+            )
+        except Exception:
+            model = None
+        self._parsed[path.as_posix()] = (mtime, model)
+        return model
+
+    @staticmethod
+    def _source_from_module(module: str) -> Optional[str]:
+        """Maps a compiled module (__nexy__.src.components.user) back to its source file."""
+        prefix = Config.NAMESPACE.replace("/", ".")
+        if not module.startswith(prefix):
+            return None
+        base = module[len(prefix):].replace(".", "/")
+        for ext in Config.TARGET_EXTENSIONS:
+            candidate = Path(f"{base}{ext}")
+            if candidate.is_file():
+                return candidate.as_posix()
+        return None
+
+    @staticmethod
+    def context_names(source: PaserModel) -> List[str]:
+        """Names a component exposes to its template: top-level frontmatter bindings and props."""
+        idents: Set[str] = set()
+        try:
+            tree = ast.parse(source.frontmatter)
+            for node in tree.body:
+                if isinstance(node, ast.ImportFrom):
+                    for alias in node.names:
+                        if alias.name != '*':
+                            idents.add(alias.asname if alias.asname else alias.name)
+                elif isinstance(node, ast.Import):
+                    for alias in node.names:
+                        idents.add(alias.asname if alias.asname else alias.name.split('.')[0])
+                elif isinstance(node, ast.Assign):
+                    for t in node.targets:
+                        if isinstance(t, ast.Name): idents.add(t.id)
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+                    idents.add(node.name)
+        except SyntaxError:
+            pass
+
+        for p in source.props: idents.add(p.name)
+        return [n for n in sorted(idents) if not n.startswith('_')]
+
+    @staticmethod
+    def styles(source: PaserModel) -> str:
+        """<link> tags of the stylesheets a component imports, published as hashed assets."""
+        return StyleAssets.links(source.styles)
+
+    def children(self, source: PaserModel) -> List[str]:
+        """Source paths of the Nexy components imported by a parsed component."""
+        if not source.frontmatter:
+            return []
+        try:
+            tree = ast.parse(source.frontmatter)
+        except SyntaxError:
+            return []
+
+        found: List[str] = []
+        for node in ast.walk(tree):
+            modules: List[str] = []
+            if isinstance(node, ast.ImportFrom) and node.module:
+                modules.append(node.module)
+            elif isinstance(node, ast.Import):
+                modules.extend(alias.name for alias in node.names)
+            for module in modules:
+                path = self._source_from_module(module)
+                if path and path not in found:
+                    found.append(path)
+        return found
+
+    @staticmethod
+    def client_imports(source: PaserModel) -> List[Tuple[str, str]]:
+        """(path, framework) of the client components imported by a parsed component."""
+        try:
+            tree = ast.parse(source.frontmatter)
+        except SyntaxError:
+            return []
+        found: List[Tuple[str, str]] = []
+        for node in ast.walk(tree):
+            loader = ASTUtils.extract_loader_args(node) if isinstance(node, ast.Assign) else None
+            args = loader or {}
+            path = str(args.get("path", ""))
+            if path.lower().endswith(tuple(Config.ISLAND_EXTENSIONS)):
+                found.append((path, str(args.get("framework", ""))))
+        return found
+
+    def islands(self, source_path: str, _visiting: Optional[Set[str]] = None) -> List[Tuple[str, str]]:
+        """
+        (path, framework) of every client component a component may render: its own,
+        and those of its layout chain and of the Nexy components it renders.
+        """
+        visiting = _visiting if _visiting is not None else set()
+        key = Path(source_path).resolve().as_posix()
+        if key in visiting:
+            return []
+        visiting.add(key)
+
+        model = self.parse(source_path)
+        if model is None:
+            return []
+        found = list(dict.fromkeys(self.client_imports(model)))
+        dependencies = self.children(model)
+        layout = self.layout(source_path)
+        if layout:
+            dependencies.append(layout)
+        for dep in dependencies:
+            found.extend(island for island in self.islands(dep, visiting) if island not in found)
+        return found
+
+    def layout(self, source_path: str) -> Optional[str]:
+        """The closest layout wrapping a component (its parent layout for a layout file)."""
+        is_layout = source_path.endswith("layout.nexy")
+        closest = RouteLayout.get_closest_path(source_path, is_layout=is_layout)
+        return closest.as_posix() if closest else None
+
+    def is_async(self, source_path: str, source: Optional[PaserModel] = None,
+                 _visiting: Optional[Set[str]] = None) -> bool:
+        """
+        A component renders asynchronously when its frontmatter awaits, or when its
+        layout or one of the Nexy components it renders is asynchronous.
+        """
+        visiting = _visiting if _visiting is not None else set()
+        key = Path(source_path).resolve().as_posix()
+        if key in visiting:
+            return False
+        visiting.add(key)
+
+        model = source if source is not None else self.parse(source_path)
+        if model is None:
+            return False
+        if model.is_async:
+            return True
+
+        dependencies = self.children(model)
+        layout = self.layout(source_path)
+        if layout:
+            dependencies.append(layout)
+        return any(self.is_async(dep, _visiting=visiting) for dep in dependencies)
+
+
+__all__ = ["ComponentGraph"]
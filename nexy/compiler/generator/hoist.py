@@ -0,0 +1,91 @@
+import ast
+import re
+from dataclasses import replace
+from typing import Dict, Optional
+
+from nexy.compiler.parser.logic import ASTUtils
+from nexy.core.models import PaserModel
+from .graph import ComponentGraph
+
+
+class StaticHoister:
+    """
+    Components without props, logic or template expressions always render the same HTML.
+    It is computed at build time: the component returns a constant and parents inline it.
+    """
+
+    JINJA_RE = re.compile(r"\{\{|\{%|\{#")
+    # `<Footer />` as emitted by TemplateParser
+    CALL_RE = re.compile(r"\{\{\s*([A-Za-z_]\w*)\(\s*\)\s*\}\}")
+
+    def __init__(self, graph: ComponentGraph) -> None:
+        self.graph = graph
+
+    @staticmethod
+    def _only_styles(frontmatter: str) -> bool:
+        """The logic block is empty or only imports stylesheets."""
+        if not frontmatter.strip():
+            return True
+        try:
+            tree = ast.parse(frontmatter)
+        except SyntaxError:
+            return False
+        for node in tree.body:
+            if not isinstance(node, ast.Assign):
+                return False
+            args = ASTUtils.extract_loader_args(node)
+            if not args or not str(args.get("path", "")).endswith(".css"):
+                return False
+        return True
+
+    def is_static(self, source: PaserModel, source_path: str) -> bool:
+        return (
+            source_path.endswith(".nexy")
+            and "src/routes/" not in source_path
+            and not source.props
+            and not source.options
+            and not source.hooks
+            and not self.JINJA_RE.search(source.template)
+            and self._only_styles(source.frontmatter)
+        )
+
+    def render(self, source: PaserModel) -> str:
+        """The HTML a static component returns (its template as Jinja would output it, then its styles)."""
+        template = source.template
+        if template.endswith("\n"):
+            template = template[:-1]
+        return template + ComponentGraph.styles(source)
+
+    def _static_children(self, source: PaserModel) -> Dict[str, str]:
+        """Alias -> HTML of every static Nexy component imported by a component."""
+        try:
+            tree = ast.parse(source.frontmatter)
+        except SyntaxError:
+            return {}
+        found: Dict[str, str] = {}
+        for node in ast.walk(tree):
+            if not isinstance(node, ast.ImportFrom) or not node.module:
+                continue
+            path = ComponentGraph._source_from_module(node.module)
+            child = self.graph.parse(path) if path else None
+            if child is None or path is None or not self.is_static(child, path):
+                continue
+            for alias in node.names:
+                found[alias.asname or alias.name] = self.render(child)
+        return found
+
+    def inline(self, source: PaserModel) -> Optional[str]:
+        """The component template with static children calls replaced by their HTML, or None if unchanged."""
+        children = self._static_children(source)
+        if not children:
+            return None
+        template = self.CALL_RE.sub(lambda m: children.get(m.group(1), m.group(0)), source.template)
+        return template if template != source.template else None
+
+    def apply(self, source: PaserModel) -> PaserModel:
+        """`source` with its static children inlined (unchanged if it has none)."""
+        inlined = self.inline(source)
+        return source if inlined is None else replace(source, template=inlined)
+
+
+__all__ = ["StaticHoister"]
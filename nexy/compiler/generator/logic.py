@@ -1,14 +1,24 @@
-import ast
 import textwrap
 import re
-from pathlib import Path
-from typing import *
+from typing import Any, Optional, Tuple
+from nexy.core.config import Config
 from nexy.core.models import PaserModel
 from nexy.core.string import StringTransform
+from nexy.routers.fbrouter.cache import POLICY_ATTR
 from nexy.routers.fbrouter.layout import RouteLayout
+from nexy.template import render_markdown
+from nexy.utils.mode import is_prod
+from .flatten import LayoutFlattener
+from .graph import ComponentGraph
+from .hoist import StaticHoister
+from .minify import HTMLMinifier
+from .native import NativeCompiler
 
 
 class LogicGenerator:
+    # Syntaxe Jinja2 : un MDX qui n'en contient pas peut être rendu au build
+    STATIC_MARKDOWN_RE = re.compile(r"\{\{|\{%|\{#")
+
     def __init__(self) -> None:
         self.func_name: str = ""
         self.source: PaserModel | None = None
@@ -17,8 +27,15 @@ class LogicGenerator:
         self.FRONTMATTER: str = ""
         self._string_transform = StringTransform()
         self.source_path: str = None
+        self.config = Config()
+        self.graph = ComponentGraph()
+        self.hoister = StaticHoister(self.graph)
+        self.flattener = LayoutFlattener(self.graph, self.hoister)
+        # Templates annexes écrits pendant la génération (ex: layouts aplatis)
+        self.templates: list[str] = []
     
     def generate(self, template_path: str, source: PaserModel, source_path:str = None) -> None:
+        self.templates = []
         self.source = source
         self.source_path = source_path
         self.template_path = template_path
@@ -43,6 +60,77 @@ class LogicGenerator:
             return ""
         return ", ".join([f"{p.name}: {p.type} = {p.default}" for p in self.source.props])
 
+    def _resolve_options(self, is_layout_file: bool) -> dict[str, Any]:
+        """Options déclarées dans le frontmatter, complétées par la configuration globale."""
+        assert self.source is not None
+        options = dict(self.source.options)
+        is_page = "src/routes/" in self.source_path and not is_layout_file
+        if is_page and "stream" not in options and getattr(self.config, "useStreaming", False):
+            options["stream"] = True
+        if not is_page:
+            # Seules les pages sont servies en streaming ou mises en cache (serveur et HTTP) ; les layouts streament via _nexy_stream
+            options.pop("stream", None)
+            options.pop("revalidate", None)
+            options.pop("cache", None)
+        if "src/routes/" in self.source_path:
+            # Pages et layouts ne sont rendus qu'une fois par requête : rien à mémoïser
+            options.pop("memo", None)
+        if options.get("memo") and self.graph.islands(self.source_path):
+            # Chaque rendu d'un îlot reçoit son propre id de montage (<ncc id=...>) : son HTML ne se partage pas
+            options.pop("memo")
+        return options
+
+    def _native_render(self, options: dict[str, Any], is_async: bool, names: list[str]) -> Optional[str]:
+        """Compile le template en Python si le backend natif est demandé et le template compatible."""
+        backend = options.get("backend") or getattr(self.config, "useTemplateBackend", "jinja")
+        if backend != "native" or is_async or not self.template_path.endswith(".html"):
+            return None
+        assert self.source is not None
+        # None : syntaxe hors du sous-ensemble natif, le rendu reste confié à Jinja2
+        return NativeCompiler(names).compile(self.source.template)
+
+    def _prerender_markdown(self) -> Optional[str]:
+        """HTML d'un template MDX sans expression Jinja2, rendu une fois pour toutes au build."""
+        assert self.source is not None
+        template = self.source.template
+        if not self.template_path.endswith(".md") or self.STATIC_MARKDOWN_RE.search(template):
+            return None
+        # Comme Jinja2 (keep_trailing_newline=False), le dernier saut de ligne est retiré
+        if template.endswith("\n"):
+            template = template[:-1]
+        return render_markdown(template)
+
+    def _flatten_layouts(self) -> Optional[Tuple[str, str]]:
+        """
+        En production, fusionne la chaîne de layouts dans un seul template écrit à côté de celui de la page.
+
+        Returns:
+            (imports des layouts, bloc de rendu) ou None si la chaîne ne peut pas être aplatie
+        """
+        if not is_prod() or not self.template_path.endswith(".html"):
+            return None
+        assert self.source is not None
+        flat = self.flattener.flatten(self.source_path, self.source)
+        if flat is None:
+            return None
+        template, chain = flat
+        if HTMLMinifier.enabled(self.config):
+            template = HTMLMinifier.minify(template)
+
+        flat_path = self.template_path.replace(".html", ".flat.html")
+        with open(flat_path, "w", encoding="utf-8") as file:
+            file.write(template)
+        self.templates.append(flat_path)
+
+        header = "".join(f"from {RouteLayout.to_import(path)} import Layout as __Layout{i}\n" for i, path in enumerate(chain))
+        contexts = "\n    ".join(f'__l{i}, __s{i} = __Layout{i}(children="", _nexy_context=True)' for i in range(len(chain)))
+        items = ", ".join(['"__page": context'] + [f'"__l{i}": __l{i}' for i in range(len(chain))] + [f'"__s{i}": __s{i}' for i in range(1, len(chain))])
+        block = f"""{contexts}
+    # Layouts aplatis au build : un seul rendu, quelle que soit la profondeur d'imbrication
+    rendered = str(__Template().render("{flat_path}", {{{items}}}))
+    return __StyleAssets.hoist(rendered + __s0 + styles, "{self.source_path}")"""
+        return header, block
+
     def _component_model(self) -> str:
         assert self.source is not None
         LOGIC = textwrap.indent(self.source.frontmatter, "    ")
@@ -50,40 +138,46 @@ class LogicGenerator:
     
         is_layout_file = self.source_path.endswith("layout.nexy")
         layout_import = RouteLayout.get_closest_import(self.source_path, is_layout=is_layout_file)
+        options = self._resolve_options(is_layout_file)
+        # `cache` sous un attribut dédié : une variable `cache` d'une route reste une donnée
+        options_header = "".join(
+            f"{POLICY_ATTR if key == 'cache' else key} = {value!r}\n" for key, value in options.items()
+        )
+        options_header += "".join(f"\n{hook}\n" for hook in self.source.hooks)
+        memo_decorator = ""
+        if options.get("memo"):
+            # Rendus identiques (mêmes props) partagés le temps d'une requête
+            options_header += "from nexy.routers.context import memo as __memo\n"
+            memo_decorator = "@__memo\n"
         
+        # Asynchrone si le frontmatter attend lui-même, ou si le layout / un composant rendu l'est
+        is_async = self.graph.is_async(self.source_path, self.source)
+        awaiting = "await " if is_async else ""
+
         layout_header = ""
         render_wrapper = "rendered"
+        stream_wrapper = f'__Template().stream("{self.template_path}", context)'
         layout_children = ""
-        
+        if is_async:
+            # Jinja2 asynchrone : la page est rendue avant que le Layout ne commence à streamer
+            stream_wrapper = "iter((rendered,))"
+
         if layout_import:
+            layout_is_async = self.graph.is_async(self.graph.layout(self.source_path) or "")
+            await_layout = "await " if layout_is_async else ""
             layout_header = f"from {layout_import} import Layout as __Layout\n"
-            render_wrapper = "str(__Layout(children=rendered))"
+            render_wrapper = f"str({await_layout}__Layout(children=rendered))"
+            children = "rendered" if is_async else f'__Template().lazy("{self.template_path}", context)'
+            stream_wrapper = f'{await_layout}__Layout(children={children}, _nexy_stream=True)'
         # -----------------------
 
         if is_layout_file :
-            layout_children = f"""children = f"<nslot  style='display:contents;'>{"{children}"}</nslot>" """
-
-        # Extraction des identifiants Python (AST)
-        idents = set()
-        try:
-            tree = ast.parse(self.source.frontmatter)
-            for node in tree.body:
-                if isinstance(node, ast.ImportFrom):
-                    for alias in node.names:
-                        if alias.name != '*':
-                            idents.add(alias.asname if alias.asname else alias.name)
-                elif isinstance(node, ast.Import):
-                    for alias in node.names:
-                        idents.add(alias.asname if alias.asname else alias.name.split('.')[0])
-                elif isinstance(node, ast.Assign):
-                    for t in node.targets:
-                        if isinstance(t, ast.Name): idents.add(t.id)
-                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
-                    idents.add(node.name)
-        except: pass
-
-        for p in self.source.props: idents.add(p.name)
-        names = [n for n in sorted(idents) if not n.startswith('_')]
+            # children reste différé : en streaming, le <head> part avant le rendu de la page
+            layout_children = f"""children = __Lazy(lambda children=children: f"<nslot  style='display:contents;'>{"{children}"}</nslot>")"""
+            layout_flags = "_nexy_stream: bool = False, _nexy_context: bool = False"
+            props = props + ", " + layout_flags if props != "" else layout_flags
+
+        names = ComponentGraph.context_names(self.source)
         
         context_items = ", ".join([f'"{n}": {n}' for n in names])
         Slot = ""
@@ -92,30 +186,100 @@ class LogicGenerator:
             context_items = context_items + ", 'Slot':Slot" if context_items != "" else "'Slot':Slot"   
             props = props+ ", caller:Union[callable, None] = None" if props != "" else "caller:Union[callable, None] = None"
 
-        # Gestion CSS
-        css_blocks = []
-        for css_path in self.source.styles:
-            p = Path(css_path)
-            if p.exists():
-                css_blocks.append(f"<style>\n{p.read_text(encoding='utf-8')}\n</style>")
-        css_injection = "\n".join(css_blocks)
+        # Gestion CSS : feuilles publiées en assets, regroupées une fois par page
+        is_page = "src/routes/" in self.source_path and not is_layout_file
+        finish = (lambda output: f'__StyleAssets.hoist({output}, "{self.source_path}")') if is_page else (lambda output: output)
+        css_injection = ComponentGraph.styles(self.source)
+
+        styles_line = f"styles = {css_injection!r}"
+        if is_layout_file:
+            # Layouts aplatis dans le template de la page (build) : seuls le contexte et les styles servent
+            styles_line += f"""
+    if _nexy_context:
+        return {{{context_items}}}, styles"""
+
+        render_call = f'{awaiting}__Template().{"render_async" if is_async else "render"}("{self.template_path}", context)'
+        context_line = f"context = {{{context_items}}}"
+        native_header = ""
+        native_render = self._native_render(options, is_async, names + (["Slot"] if Slot else []))
+        if native_render:
+            # Backend natif : le template est une fonction Python locale, sans Jinja2 ni contexte
+            context_line = textwrap.indent(native_render, "    ").lstrip()
+            native_header = "from markupsafe import escape as __escape\nfrom nexy.template import native_getattr as __attr, native_getitem as __item\n"
+            render_call = "__render()"
+            if layout_import:
+                stream_wrapper = stream_wrapper.replace(f'__Template().lazy("{self.template_path}", context)', "__Lazy(__render)")
+            else:
+                stream_wrapper = "iter((__render(),))"
+        prerendered = self._prerender_markdown()
+        if prerendered is not None:
+            # MDX statique : HTML produit au build, ni Jinja2 ni Markdown à la requête
+            native_header += f"__PRERENDERED = {prerendered!r}\n"
+            context_line = ""
+            render_call = "__PRERENDERED"
+            if layout_import:
+                stream_wrapper = stream_wrapper.replace(f'__Template().lazy("{self.template_path}", context)', "__PRERENDERED")
+            else:
+                stream_wrapper = "iter((__PRERENDERED,))"
+
+        static = self.hoister.render(self.source) if self.hoister.is_static(self.source, self.source_path) else None
+        if static is not None:
+            # Composant statique (ni props, ni logique, ni expression) : HTML calculé au build
+            native_header = f"__STATIC = {static!r}\n"
+            context_line = ""
+
+        flat = None
+        if layout_import and not (is_layout_file or is_async or native_render or options.get("stream")):
+            flat = self._flatten_layouts()
+        return_type = "str"
+        if static is not None:
+            render_block = "return __STATIC"
+        elif flat:
+            layout_header, render_block = flat
+            render_block = f"""{styles_line}
+    {render_block}"""
+        elif options.get("stream"):
+            return_type = "Iterator[str]"
+            prerender = f"rendered = str({render_call})\n    " if is_async else ""
+            render_block = f"""{styles_line}
+    {prerender}
+    # Rendu en streaming : le Layout envoie son <head> avant le rendu de la page
+    return {finish(f"__chain({stream_wrapper}, (styles,))")}"""
+        else:
+            stream_block = ""
+            if is_layout_file:
+                stream_block = f"""if _nexy_stream:
+        return __chain({stream_wrapper}, (styles,))
+    """
+            render_line = f"rendered = str({render_call})"
+            if is_async:
+                # En asynchrone, le layout est rendu d'un bloc avant d'être streamé
+                if is_layout_file:
+                    render_line += f"""
+    if _nexy_stream:
+        return iter(({render_wrapper} + styles,))"""
+                stream_block = ""
+            render_block = f"""{styles_line}
+    {stream_block}{render_line}
+    
+    # Rendu final (potentiellement enveloppé par le Layout)
+    return {finish(f"{render_wrapper} + styles")}"""
 
         return f"""from typing import *
 from fastapi import *
+from itertools import chain as __chain
 from pathlib import Path as __Path
 from nexy import Template as __Template , Import as __Import
+from nexy.template import LazyRender as __Lazy
+from nexy.core.assets import StyleAssets as __StyleAssets
 from jinja2 import Template as __JinjaTemplate
 NexyElement = Union[callable, __JinjaTemplate]
-{layout_header}
-def {self.func_name}({props}) -> str:
+{native_header}{layout_header}{options_header}
+{memo_decorator}{"async " if is_async else ""}def {self.func_name}({props}) -> {return_type}:
     {Slot}
 {LOGIC}
     {layout_children}
-    context = {{{context_items}}}
-    rendered = str(__Template().render("{self.template_path}", context))
-    styles = \"\"\"{css_injection}\"\"\"
-    
-    # Rendu final (potentiellement enveloppé par le Layout)
-    return {render_wrapper} + styles
+    {context_line}
+    {render_block}
 """
     
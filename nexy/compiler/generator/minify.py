@@ -0,0 +1,100 @@
+import re
+from typing import Any, List, Tuple
+
+from nexy.utils.mode import is_prod
+
+# Whitespace around these tags never renders
+BLOCK_TAGS = frozenset({
+    "!doctype", "address", "article", "aside", "base", "blockquote", "body", "br", "caption",
+    "col", "colgroup", "dd", "details", "dialog", "div", "dl", "dt", "fieldset", "figcaption",
+    "figure", "footer", "form", "h1", "h2", "h3", "h4", "h5", "h6", "head", "header", "hgroup",
+    "hr", "html", "legend", "li", "link", "main", "menu", "meta", "nav", "noscript", "ol",
+    "optgroup", "option", "p", "param", "script", "section", "source", "style", "summary",
+    "table", "tbody", "td", "template", "tfoot", "th", "thead", "title", "tr", "track", "ul"
+})
+
+_TOKEN_RE = re.compile(
+    r"(?P<raw>\{%-?\s*raw\s*-?%\}.*?\{%-?\s*endraw\s*-?%\})"
+    r"|(?P<jinja>\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})"
+    r"|(?P<verbatim><(?P<vtag>pre|textarea|script|style)\b.*?</(?P=vtag)\s*>)"
+    r"|(?P<comment><!--.*?-->)"
+    r"|(?P<tag></?[A-Za-z!][^>]*>)",
+    re.S | re.I,
+)
+_TAG_NAME_RE = re.compile(r"</?([A-Za-z!][\w-]*)")
+_SPACE_RE = re.compile(r"\s+")
+
+
+class HTMLMinifier:
+    """
+    Collapses insignificant whitespace of a generated HTML template.
+
+    Runs of whitespace in text become one space, and disappear next to block-level tags.
+    <pre>, <textarea>, <script>, <style> and every Jinja tag are left untouched.
+    """
+
+    @staticmethod
+    def enabled(config: Any) -> bool:
+        """Production builds only: dev templates stay readable."""
+        return is_prod() and getattr(config, "useMinifyHTML", True)
+
+    @staticmethod
+    def _tokens(template: str) -> List[Tuple[str, str]]:
+        """(kind, text) pairs; kind is "text" for everything outside a tag."""
+        tokens: List[Tuple[str, str]] = []
+        position = 0
+        for match in _TOKEN_RE.finditer(template):
+            if match.start() > position:
+                tokens.append(("text", template[position:match.start()]))
+            kind = "verbatim" if match.lastgroup == "vtag" else str(match.lastgroup)
+            tokens.append((kind, match.group(0)))
+            position = match.end()
+        if position < len(template):
+            tokens.append(("text", template[position:]))
+        return tokens
+
+    @staticmethod
+    def _is_block(token: Tuple[str, str]) -> bool:
+        kind, text = token
+        if kind == "verbatim":
+            return True
+        if kind != "tag":
+            return False
+        name = _TAG_NAME_RE.match(text)
+        return name is not None and name.group(1).lower() in BLOCK_TAGS
+
+    @classmethod
+    def _neighbour_is_block(cls, tokens: List[Tuple[str, str]], index: int, step: int) -> bool:
+        """Closest visible token before/after a text; Jinja tags and comments render nothing."""
+        index += step
+        while 0 <= index < len(tokens):
+            kind, text = tokens[index]
+            if kind == "comment" or (kind == "jinja" and not text.startswith("{{")):
+                index += step
+                continue
+            return cls._is_block(tokens[index])
+        return True
+
+    @classmethod
+    def minify(cls, template: str) -> str:
+        tokens = cls._tokens(template)
+        output: List[str] = []
+        for index, (kind, text) in enumerate(tokens):
+            if kind == "comment":
+                # Conditional comments are markup for old browsers
+                if text.startswith("<!--[if"):
+                    output.append(text)
+                continue
+            if kind != "text":
+                output.append(text)
+                continue
+            text = _SPACE_RE.sub(" ", text)
+            if text.startswith(" ") and cls._neighbour_is_block(tokens, index, -1):
+                text = text[1:]
+            if text.endswith(" ") and cls._neighbour_is_block(tokens, index, 1):
+                text = text[:-1]
+            output.append(text)
+        return "".join(output)
+
+
+__all__ = ["HTMLMinifier"]
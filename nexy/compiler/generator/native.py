@@ -0,0 +1,239 @@
+import ast
+import re
+from typing import Any, Iterable, List, Optional, Set
+
+
+class NativeUnsupportedError(Exception):
+    """Raised when a template uses syntax outside the natively compiled subset."""
+    pass
+
+
+class ExpressionTranslator(ast.NodeTransformer):
+    """
+    Rewrites a Jinja expression (parsed as Python) into plain Python.
+    Only the subset with identical semantics is accepted;
+    anything else raises NativeUnsupportedError.
+    """
+
+    LITERALS = {"true": True, "false": False, "none": None, "True": True, "False": False, "None": None}
+    BUILTINS = {"range", "dict"}
+    ALLOWED = (
+        ast.Expression, ast.Name, ast.Load, ast.Constant, ast.Attribute, ast.Subscript, ast.Slice,
+        ast.Call, ast.keyword, ast.Compare, ast.BoolOp, ast.UnaryOp, ast.BinOp, ast.IfExp,
+        ast.Tuple, ast.List, ast.Dict,
+        ast.And, ast.Or, ast.Not, ast.USub, ast.UAdd,
+        ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+        ast.Add, ast.Sub, ast.Mult, ast.Div, ast.FloorDiv, ast.Mod, ast.Pow,
+    )
+
+    def __init__(self, scope: Set[str]) -> None:
+        self.scope = scope
+
+    def generic_visit(self, node: ast.AST) -> ast.AST:
+        if not isinstance(node, self.ALLOWED):
+            raise NativeUnsupportedError(type(node).__name__)
+        return super().generic_visit(node)
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id in self.LITERALS:
+            return ast.copy_location(ast.Constant(self.LITERALS[node.id]), node)
+        if node.id not in self.scope and node.id not in self.BUILTINS:
+            # Jinja renders unknown names as Undefined, Python would raise
+            raise NativeUnsupportedError(node.id)
+        return node
+
+    def visit_Attribute(self, node: ast.Attribute) -> ast.AST:
+        value = self.visit(node.value)
+        call = ast.Call(func=ast.Name("__attr", ast.Load()), args=[value, ast.Constant(node.attr)], keywords=[])
+        return ast.copy_location(call, node)
+
+    def visit_Subscript(self, node: ast.Subscript) -> ast.AST:
+        value = self.visit(node.value)
+        key = self.visit(node.slice)
+        if isinstance(key, ast.Slice):
+            node.value, node.slice = value, key
+            return node
+        call = ast.Call(func=ast.Name("__item", ast.Load()), args=[value, key], keywords=[])
+        return ast.copy_location(call, node)
+
+    def visit_BinOp(self, node: ast.BinOp) -> ast.AST:
+        if isinstance(node.op, ast.BitOr):
+            # Filters are only supported at the top of an output expression
+            raise NativeUnsupportedError("filter")
+        return self.generic_visit(node)
+
+
+class NativeCompiler:
+    """
+    Compiles the Jinja subset emitted by TemplateParser into Python string-building code.
+
+    Supported: text, {{ expr }}, the `safe`/`e` filters, if/elif/else, for loops and
+    {% call Component() %} blocks. Any other construct makes `compile` return None so
+    the component keeps rendering through Jinja.
+    """
+
+    _TOKEN_RE = re.compile(r"(\{\{.*?\}\}|\{%.*?%\}|\{#.*?#\})", re.DOTALL)
+    _FOR_RE = re.compile(r"^for\s+(.+?)\s+in\s+(.+)$", re.DOTALL)
+    _FILTERS = {"safe": "str({})", "e": "str(__escape({}))", "escape": "str(__escape({}))"}
+    _PRIMARY = (ast.Name, ast.Attribute, ast.Subscript, ast.Call, ast.Constant)
+
+    def __init__(self, names: Iterable[str]) -> None:
+        self.names: Set[str] = set(names)
+
+    def compile(self, template: str, func_name: str = "__render") -> Optional[str]:
+        """Returns the source of a `func_name()` closure rendering the template, or None."""
+        try:
+            body = self._compile(template)
+        except (NativeUnsupportedError, SyntaxError):
+            return None
+        lines = [f"def {func_name}() -> str:", "    __out = []"]
+        lines += [f"    {line}" for line in body]
+        lines.append('    return "".join(__out)')
+        return "\n".join(lines)
+
+    def _compile(self, template: str) -> List[str]:
+        # Jinja drops a single trailing newline (keep_trailing_newline=False)
+        if template.endswith("\r\n"):
+            template = template[:-2]
+        elif template.endswith("\n"):
+            template = template[:-1]
+
+        self._lines: List[str] = []
+        self._indent = 0
+        self._scopes: List[Set[str]] = [set(self.names)]
+        self._blocks: List[List[Any]] = []
+        self._callers = 0
+
+        for token in self._TOKEN_RE.split(template):
+            if not token:
+                continue
+            if token.startswith("{#"):
+                continue
+            if token.startswith("{{"):
+                self._output(token[2:-2])
+            elif token.startswith("{%"):
+                self._statement(token[2:-2])
+            else:
+                self._emit(f"__out.append({token!r})")
+
+        if self._blocks:
+            raise NativeUnsupportedError(f"unclosed {self._blocks[-1][0]}")
+        return self._lines
+
+    # --- code emission ---
+
+    def _emit(self, line: str) -> None:
+        self._lines.append("    " * self._indent + line)
+
+    def _open(self, kind: str, header: str, **data: Any) -> None:
+        self._emit(header)
+        self._indent += 1
+        self._blocks.append([kind, len(self._lines), data])
+
+    def _close_body(self) -> None:
+        if len(self._lines) == self._blocks[-1][1]:
+            self._emit("pass")
+        self._indent -= 1
+
+    def _scope(self) -> Set[str]:
+        return set().union(*self._scopes)
+
+    def _expr(self, source: str) -> str:
+        if not source or source[0] in "-+" or source[-1] in "-+":
+            # Whitespace control markers ({{- / -}})
+            raise NativeUnsupportedError("whitespace control")
+        tree = ast.parse(source.strip(), mode="eval")
+        return ast.unparse(ExpressionTranslator(self._scope()).visit(tree))
+
+    def _output(self, source: str) -> None:
+        expr = source.strip()
+        wrapper = "str({})"
+        tree = ast.parse(expr, mode="eval") if expr else None
+        node = tree.body if tree else None
+        if (
+            isinstance(node, ast.BinOp) and isinstance(node.op, ast.BitOr)
+            and isinstance(node.right, ast.Name) and node.right.id in self._FILTERS
+            and isinstance(node.left, self._PRIMARY)
+        ):
+            wrapper = self._FILTERS[node.right.id]
+            expr = ast.unparse(node.left)
+            source = f" {expr} "
+        self._emit(f"__out.append({wrapper.format(self._expr(source))})")
+
+    def _statement(self, source: str) -> None:
+        if source[:1] in "-+" or source[-1:] in "-+":
+            raise NativeUnsupportedError("whitespace control")
+        statement = source.strip()
+        keyword, _, rest = statement.partition(" ")
+        rest = rest.strip()
+
+        if keyword == "if":
+            self._open("if", f"if {self._expr(rest)}:")
+        elif keyword == "elif":
+            self._expect("if")
+            self._close_body()
+            self._emit(f"elif {self._expr(rest)}:")
+            self._indent += 1
+            self._blocks[-1][1] = len(self._lines)
+        elif keyword == "else" and not rest:
+            self._expect("if")
+            self._close_body()
+            self._emit("else:")
+            self._indent += 1
+            self._blocks[-1][1] = len(self._lines)
+        elif keyword == "endif" and not rest:
+            self._expect("if")
+            self._close_body()
+            self._blocks.pop()
+        elif keyword == "for":
+            self._for(statement)
+        elif keyword == "endfor" and not rest:
+            self._expect("for")
+            self._close_body()
+            self._blocks.pop()
+            self._scopes.pop()
+        elif keyword == "call":
+            self._call(rest)
+        elif keyword == "endcall" and not rest:
+            self._expect("call")
+            _, _, data = self._blocks.pop()
+            self._emit('return "".join(__out)')
+            self._indent -= 1
+            self._emit(f"__out.append(str({data['call']}))")
+        else:
+            raise NativeUnsupportedError(keyword)
+
+    def _expect(self, kind: str) -> None:
+        if not self._blocks or self._blocks[-1][0] != kind:
+            raise NativeUnsupportedError(f"unexpected end of {kind}")
+
+    def _for(self, statement: str) -> None:
+        match = self._FOR_RE.match(statement)
+        if not match:
+            raise NativeUnsupportedError("for")
+        target = ast.parse(match.group(1), mode="eval").body
+        names = [target] if isinstance(target, ast.Name) else getattr(target, "elts", None)
+        if not names or not all(isinstance(n, ast.Name) for n in names):
+            raise NativeUnsupportedError("for target")
+        bound = {n.id for n in names}
+        if bound & self._scope() or "loop" in bound:
+            # Jinja restores shadowed names after the loop, Python would not
+            raise NativeUnsupportedError("shadowed loop variable")
+        iterable = self._expr(match.group(2))
+        self._open("for", f"for {match.group(1).strip()} in {iterable}:")
+        self._scopes.append(bound)
+
+    def _call(self, source: str) -> None:
+        call = ast.parse(source, mode="eval").body
+        if not isinstance(call, ast.Call):
+            raise NativeUnsupportedError("call")
+        self._callers += 1
+        caller = f"__caller_{self._callers}"
+        expr = self._expr(source)[:-1]
+        expr += f"{', ' if call.args or call.keywords else ''}caller={caller})"
+        # The caller body becomes a closure: the component calls it as Slot()
+        self._open("call", f"def {caller}() -> str:", call=expr)
+        self._emit("__out = []")
+
+
+__all__ = ["NativeCompiler", "NativeUnsupportedError"]
@@ -36,11 +36,15 @@ class Parser:
         # 3. Préparation des composants connus pour le template
         # On extrait les alias ou les noms de symboles des imports Nexy
         known_components: set[str] = set()
+        # Composants client (îlots) : seuls concernés par la directive hydrate=
+        islands: set[str] = set()
         for imp in logic_result.nexy_imports:
             # Si on a 'import X as Y', on cherche 'Y' dans le template
             name = imp.alias if imp.alias else imp.symbol
             if name:
                 known_components.add(name)
+                if imp.path.lower().endswith(tuple(Config.ISLAND_EXTENSIONS)):
+                    islands.add(name)
 
         if logic_result.python_code:
             
@@ -56,7 +60,7 @@ class Parser:
                 pass
 
         
-        jinja_code = self.template_parser.parse(blocks.template_block, known_components=known_components)
+        jinja_code = self.template_parser.parse(blocks.template_block, known_components=known_components, islands=islands)
         if current_file.endswith(".mdx"):
             jinja_code = self._clean_jinja_wrapping(jinja_code)
             
@@ -66,6 +70,9 @@ class Parser:
             props=logic_result.props,
             context=[],
             styles=logic_result.css_imports,
+            options=logic_result.options,
+            hooks=logic_result.hooks,
+            is_async=logic_result.is_async,
         )
 
 __all__ = ["Parser"]
@@ -1,6 +1,7 @@
 import ast
 from typing import Any, List, Optional, cast
 
+from nexy.core.config import Config
 from nexy.core.models import (
     LogicResult,
     NexyImport,
@@ -19,6 +20,57 @@ class ASTUtils:
                 isinstance(node.annotation.value, ast.Name) and 
                 node.annotation.value.id == "prop")
 
+    @staticmethod
+    def uses_await(tree: ast.Module) -> bool:
+        """Checks if the logic block itself awaits (nested functions are not inspected)."""
+        pending: List[ast.AST] = list(tree.body)
+        while pending:
+            node = pending.pop()
+            if isinstance(node, (ast.Await, ast.AsyncFor, ast.AsyncWith)):
+                return True
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.Lambda, ast.ClassDef)):
+                continue
+            pending.extend(ast.iter_child_nodes(node))
+        return False
+
+    @staticmethod
+    def is_option_value(name: str, value: Any) -> bool:
+        """Checks that a literal has the type of the option it names (`stream = "live"` is plain data)."""
+        if name in ("stream", "memo"):
+            return isinstance(value, bool)
+        if name == "backend":
+            return value in Config.TEMPLATE_BACKENDS
+        number = isinstance(value, (int, float)) and not isinstance(value, bool)
+        if name == "revalidate":
+            return number
+        if name == "cache":
+            if isinstance(value, dict):
+                # A policy only when every key is one of its options: `cache = {"users": []}` is data
+                keys = {str(key).replace("-", "_") for key in value}
+                return bool(keys) and keys <= set(Config.CACHE_POLICY_OPTIONS)
+            return number and isinstance(value, int)
+        return False
+
+    @staticmethod
+    def extract_option(node: ast.Assign) -> Optional[tuple[str, Any]]:
+        """
+        Extracts a component option (`stream = True`) declared with a literal value of the
+        expected type. Any other binding with the same name stays an ordinary variable.
+        """
+        if len(node.targets) != 1 or not isinstance(node.targets[0], ast.Name):
+            return None
+        name = node.targets[0].id
+        if name not in Config.COMPONENT_OPTIONS:
+            return None
+        try:
+            value = ast.literal_eval(node.value)
+        except (ValueError, TypeError, SyntaxError):
+            # `{[1]: 2}` (unhashable key): the binding stays a variable
+            return None
+        if not ASTUtils.is_option_value(name, value):
+            return None
+        return name, value
+
     @staticmethod
     def extract_loader_args(node: ast.Assign) -> Optional[dict[str, Any]]:
         """Attempts to extract path/framework/symbol from a __nexy_loader__ or __Import call."""
@@ -79,6 +131,8 @@ class LogicParser:
             # Re-raise with a clear message for the user
             raise SyntaxError(f"Logic Parse Error: {e}")
 
+        result.is_async = ASTUtils.uses_await(tree)
+
         # 3. Data Extraction & Final Code Construction
         final_body = self._process_nodes(tree.body, result)
         
@@ -97,13 +151,25 @@ class LogicParser:
                 # Skip prop annotations in the final function body
                 continue
 
-            # Case B: Component Imports (Variable Assignment from __Import)
+            # Case B: Component options, hoisted to the generated module
+            if isinstance(node, ast.Assign):
+                option = ASTUtils.extract_option(node)
+                if option is not None:
+                    result.options[option[0]] = option[1]
+                    continue
+
+            # Case B2: Component hooks (`def static_params()`), moved to the generated module
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name in Config.COMPONENT_HOOKS:
+                result.hooks.append(ast.unparse(node))
+                continue
+
+            # Case C: Component Imports (Variable Assignment from __Import)
             if isinstance(node, ast.Assign):
                 if self._try_extract_import(node, result):
                     final_nodes.append(node)
                     continue
 
-            # Case C: Standard Python code
+            # Case D: Standard Python code
             final_nodes.append(node)
 
         return final_nodes
@@ -4,6 +4,7 @@ import re
 import pathlib
 from typing import Match, List, Optional
 from nexy.core.config import Config
+from nexy.utils.imports.ncc import NCC
 
 class LogicSanitizer:
     """
@@ -65,6 +66,11 @@ class LogicSanitizer:
         """Returns the framework name associated with the extension."""
         return Config.FRONTEND_EXTENSIONS.get(extension.lower(), 'unknown')
 
+    def _client_constants(self, full_rel_path: str) -> str:
+        """URL and data-nexy-key of a client component, resolved once here instead of on every render."""
+        url = NCC.resolve_url(full_rel_path)
+        return f', url="{url}", key="{NCC.url_key(url)}"'
+
     def sanitize(self, source: str, current_file: str) -> str:
         """
         Main entry point for sanitizing logic blocks.
@@ -111,7 +117,7 @@ class LogicSanitizer:
             alias = self._normalize_alias(alias)
             
             line = (f'{alias} = __Import('
-                    f'path="{full_rel_path}", framework="{framework}", symbol="{symbol}")')
+                    f'path="{full_rel_path}", framework="{framework}", symbol="{symbol}"{self._client_constants(full_rel_path)})')
             import_lines.append(line)
 
         return "\n".join(import_lines)
@@ -193,4 +199,4 @@ class LogicSanitizer:
         # --- RUNTIME (JSON, VUE, etc.) ---
         framework = self._get_framework(ext)
         # For simple imports, we assume 'default' symbol unless specified (not possible in simple import syntax)
-        return f'{alias} = __Import(path="{full_rel_path}", framework="{framework}", symbol="default")'
+        return f'{alias} = __Import(path="{full_rel_path}", framework="{framework}", symbol="default"{self._client_constants(full_rel_path)})'
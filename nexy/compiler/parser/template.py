@@ -1,6 +1,8 @@
 import re
 from typing import Optional, Set
 
+from nexy.frontend.hydration import hydration_strategy
+
 class NexyParserError(Exception):
     """Custom exception for Nexy template parsing errors."""
     pass
@@ -55,8 +57,10 @@ class TemplateParser:
 
     def __init__(self) -> None:
         self.known_components: Set[str] = set()
+        # Client components (islands): the only tags whose hydrate= is a directive
+        self.islands: Set[str] = set()
 
-    def parse(self, html: str, known_components: Optional[Set[str]] = None) -> str:
+    def parse(self, html: str, known_components: Optional[Set[str]] = None, islands: Optional[Set[str]] = None) -> str:
         # STEP 1: GLOBAL COMMENT STRIPPING
         # This removes comments everywhere, including inside <header> or <ul>
         content = self._HTML_COMMENT_RE.sub('', html)
@@ -64,6 +68,7 @@ class TemplateParser:
         
         if known_components:
             self.known_components.update(known_components)
+        self.islands = set(islands or ())
 
         # STEP 2: PASCALCASE TAG VALIDATION
         # Ensure tags like <Image /> are actually imported/known
@@ -88,12 +93,30 @@ class TemplateParser:
         
         return content
 
+    def _check_hydration(self, tag: str, attrs: str) -> None:
+        """
+        A static hydrate="..." of a client component is checked here, so a typo fails the build
+        instead of every request. On a Nexy component, `hydrate` is an ordinary prop.
+        """
+        if tag not in self.islands:
+            return
+        for key, *values in TemplateFormatter._ATTR_REGEX.findall(attrs):
+            value = next((v for v in values if v), "")
+            if key != "hydrate" or not value or "{{" in value:
+                continue
+            try:
+                hydration_strategy(value)
+            except ValueError as e:
+                raise NexyParserError(f"<{tag}>: {e}") from None
+
     def _replace_self_closing(self, match: re.Match[str]) -> str:
         tag, attrs = match.group(1), match.group(2)
+        self._check_hydration(tag, attrs)
         formatted_attrs = TemplateFormatter.format_attributes(attrs)
         return f'{{{{ {tag}({formatted_attrs}) }}}}'
 
     def _replace_block(self, match: re.Match[str]) -> str:
         tag, attrs, inner_html = match.group(1), match.group(2), match.group(3)
+        self._check_hydration(tag, attrs)
         formatted_attrs = TemplateFormatter.format_attributes(attrs)
         return f'{{% call {tag}({formatted_attrs}) %}}{inner_html}{{% endcall %}}'
\ No newline at end of file
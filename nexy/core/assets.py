@@ -0,0 +1,174 @@
+import hashlib
+import json
+import re
+import shutil
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Union
+
+from nexy.core.config import Config
+from nexy.utils.mode import is_prod
+
+STYLE_LINK = '<link rel="stylesheet" href="{href}" data-nexy-style>'
+_STYLE_LINK_RE = re.compile(r'<link rel="stylesheet" href="([^"]+)" data-nexy-style>')
+_LINK_RE = re.compile(r"<link\b[^>]*\brel=[\"']?stylesheet\b[^>]*>", re.I)
+_HREF_RE = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.I)
+# Feuille complète chargée sans bloquer le rendu (le CSS critique est déjà dans le <head>)
+DEFERRED_LINK = (
+    '<link rel="preload" href="{href}" as="style" onload="this.onload=null;this.rel=\'stylesheet\'">'
+    '<noscript><link rel="stylesheet" href="{href}"></noscript>'
+)
+
+
+class StyleAssets:
+    """
+    Feuilles de style des composants, publiées au build en fichiers adressés par leur contenu.
+
+    Chaque composant référence ses feuilles par des balises `<link data-nexy-style>` ;
+    la page les regroupe ensuite : une seule balise par feuille, dans le <head>.
+    """
+
+    # Source CSS -> URL publiée (pour republier après un build Vite qui vide __nexy__/client)
+    published: Dict[str, str] = {}
+
+    @staticmethod
+    def asset_name(css_path: Path, content: bytes) -> str:
+        """badge.css -> badge-<hash>.css"""
+        digest = hashlib.sha256(content).hexdigest()[:8]
+        return f"{css_path.stem}-{digest}.css"
+
+    @classmethod
+    def clean(cls, target: Optional[str] = None) -> None:
+        """Repart d'un dossier d'assets vide : les feuilles d'une session précédente ne s'accumulent pas."""
+        directory = Path(target or Config.STYLE_ASSETS_PATH)
+        shutil.rmtree(directory, ignore_errors=True)
+        directory.mkdir(parents=True, exist_ok=True)
+        cls.published.clear()
+
+    @classmethod
+    def publish(cls, css_path: str, target: Optional[str] = None) -> Optional[str]:
+        """Copie une feuille de style dans les assets et retourne son URL, ou None si elle n'existe pas."""
+        source = Path(css_path)
+        try:
+            content = source.read_bytes()
+        except OSError:
+            return None
+        name = cls.asset_name(source, content)
+        directory = Path(target or Config.STYLE_ASSETS_PATH)
+        output = directory / name
+        if not output.is_file():
+            directory.mkdir(parents=True, exist_ok=True)
+            output.write_bytes(content)
+        href = f"{Config.STYLE_ASSETS_URL}/{name}"
+        previous = cls.published.get(source.as_posix())
+        cls.published[source.as_posix()] = href
+        if previous and previous != href and previous not in cls.published.values():
+            # Feuille modifiée (nexy dev) : l'ancienne version et ses variantes compressées sont retirées
+            stale = directory / previous.rsplit("/", 1)[-1]
+            for path in (stale, stale.with_name(f"{stale.name}.gz"), stale.with_name(f"{stale.name}.br")):
+                path.unlink(missing_ok=True)
+        return href
+
+    @classmethod
+    def republish(cls) -> List[str]:
+        """Réécrit les feuilles déjà publiées par ce processus (ex: après `vite build`)."""
+        return [href for href in (cls.publish(path) for path in list(cls.published)) if href]
+
+    @classmethod
+    def links(cls, css_paths: Iterable[str]) -> str:
+        """Balises <link> des feuilles de style d'un composant."""
+        hrefs = (cls.publish(path) for path in css_paths)
+        return "".join(STYLE_LINK.format(href=href) for href in hrefs if href)
+
+    @staticmethod
+    def _hoist_html(html: str) -> str:
+        hrefs = list(dict.fromkeys(_STYLE_LINK_RE.findall(html)))
+        if not hrefs:
+            return html
+        links = "".join(STYLE_LINK.format(href=href) for href in hrefs)
+        if "</head>" in html:
+            html = _STYLE_LINK_RE.sub("", html)
+            return html.replace("</head>", f"{links}</head>", 1)
+        # Sans <head> : toutes les feuilles à l'emplacement de la première
+        first = True
+
+        def replace(_: re.Match[str]) -> str:
+            nonlocal first
+            if first:
+                first = False
+                return links
+            return ""
+        return _STYLE_LINK_RE.sub(replace, html)
+
+    @staticmethod
+    def _dedupe_stream(chunks: Iterable[str]) -> Iterator[str]:
+        # Le <head> est déjà parti : chaque feuille reste à sa première occurrence
+        seen: Set[str] = set()
+
+        def replace(match: re.Match[str]) -> str:
+            if match.group(1) in seen:
+                return ""
+            seen.add(match.group(1))
+            return match.group(0)
+
+        for chunk in chunks:
+            yield _STYLE_LINK_RE.sub(replace, chunk) if "data-nexy-style" in chunk else chunk
+
+    @staticmethod
+    @lru_cache(maxsize=1)
+    def critical_manifest() -> Dict[str, Dict[str, Any]]:
+        """CSS critique des routes (source -> css, feuilles différées), écrit par `nexy build`."""
+        if not is_prod():
+            return {}
+        try:
+            text = Path(Config.CRITICAL_CSS_PATH).read_text(encoding="utf-8")
+            manifest: Dict[str, Dict[str, Any]] = json.loads(text)
+        except (OSError, ValueError):
+            return {}
+        return manifest
+
+    @staticmethod
+    def _defer(html: str, stylesheets: Iterable[str]) -> str:
+        deferred = set(stylesheets)
+
+        def replace(match: re.Match[str]) -> str:
+            href = _HREF_RE.search(match.group(0))
+            if href is None or href.group(1) not in deferred:
+                return match.group(0)
+            return DEFERRED_LINK.format(href=href.group(1))
+        return _LINK_RE.sub(replace, html)
+
+    @classmethod
+    def _critical(cls, html: str, entry: Dict[str, Any]) -> str:
+        """Insère le CSS critique avant </head> et diffère les feuilles qu'il couvre."""
+        head, end, body = html.partition("</head>")
+        if not end:
+            return html
+        style = f"<style data-nexy-critical>{entry['css']}</style>" if entry.get("css") else ""
+        return f"{cls._defer(head, entry['stylesheets'])}{style}{end}{cls._defer(body, entry['stylesheets'])}"
+
+    @classmethod
+    def _critical_stream(cls, chunks: Iterable[str], entry: Dict[str, Any]) -> Iterator[str]:
+        inlined = False
+        for chunk in chunks:
+            if not inlined and "</head>" in chunk:
+                inlined = True
+                yield cls._critical(chunk, entry)
+            else:
+                yield cls._defer(chunk, entry["stylesheets"])
+
+    @classmethod
+    def hoist(cls, output: Union[str, Iterable[str]], source: Optional[str] = None) -> Union[str, Iterator[str]]:
+        """
+        Dédoublonne les feuilles de style d'une page rendue (HTML complet ou flux de morceaux),
+        puis, en production, y insère le CSS critique de la route `source`.
+        """
+        entry = cls.critical_manifest().get(source) if source else None
+        if isinstance(output, str):
+            html = cls._hoist_html(output)
+            return cls._critical(html, entry) if entry else html
+        chunks = cls._dedupe_stream(output)
+        return cls._critical_stream(chunks, entry) if entry else chunks
+
+
+__all__ = ["StyleAssets"]
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+def content_key(*parts: Any) -> str:
+    """Clé de cache adressée par le contenu : empreinte SHA-256 des éléments fournis."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x00")
+    return digest.hexdigest()
+
+
+class MemoryCache(Generic[V]):
+    """Cache LRU en mémoire, borné et thread-safe, avec expiration optionnelle (en secondes)."""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._items: "OrderedDict[str, Tuple[float, V]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[V]:
+        """Retourne la valeur associée à la clé, ou None si absente ou expirée."""
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires, value = item
+            if expires and expires < time.monotonic():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: V, ttl: Optional[float] = None) -> None:
+        """Enregistre une valeur ; la plus ancienne est évincée au-delà de `maxsize`."""
+        ttl = self.ttl if ttl is None else ttl
+        expires = time.monotonic() + ttl if ttl else 0.0
+        with self._lock:
+            self._items[key] = (expires, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._items.clear()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+
+class DiskCache:
+    """
+    Cache texte persistant (un fichier par clé), précédé d'un cache mémoire.
+
+    Les écritures sont atomiques (fichier temporaire puis `os.replace`) : plusieurs
+    workers peuvent partager le même dossier. Une erreur disque ne fait jamais
+    échouer le rendu : la valeur est simplement recalculée.
+    """
+
+    def __init__(self, directory: str, memory_size: int = 1024) -> None:
+        self.directory = Path(directory)
+        self.memory: MemoryCache[str] = MemoryCache(maxsize=memory_size)
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / key
+
+    def get(self, key: str) -> Optional[str]:
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        try:
+            header, _, value = self._path(key).read_text(encoding="utf-8").partition("\n")
+            expires = float(header)
+        except (OSError, ValueError):
+            return None
+        if expires and expires < time.time():
+            return None
+        self.memory.set(key, value, ttl=expires - time.time() if expires else None)
+        return value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None:
+        """Enregistre une valeur ; avec `ttl`, elle expire après ce nombre de secondes."""
+        self.memory.set(key, value, ttl=ttl)
+        # Première ligne du fichier : date d'expiration (0 = jamais), lisible par tous les workers
+        expires = time.time() + ttl if ttl else 0
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+        except OSError:
+            return
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as file:
+                file.write(f"{expires}\n{value}")
+            os.replace(tmp, path)
+        except OSError:
+            Path(tmp).unlink(missing_ok=True)
+
+
+__all__ = ["content_key", "MemoryCache", "DiskCache"]
@@ -15,6 +15,34 @@ if current_dir not in sys.path:
 class Config:
     ALIASES: dict[str, str] = {}
     NAMESPACE: str = "__nexy__/"
+    PROD_FLAG: str = "__nexy__/nexy.prod"
+    TEMPLATE_CACHE_SIZE: int = 400
+    COMPILED_TEMPLATES_PATH: str = "__nexy__/__templates__"
+    HIGHLIGHT_CACHE_PATH: str = "__nexy__/cache/highlight"
+    FRAGMENT_CACHE_PATH: str = "__nexy__/cache/fragments"
+    FRAGMENT_CACHE_SIZE: int = 1024
+    STYLE_ASSETS_PATH: str = "__nexy__/client/assets"
+    STYLE_ASSETS_URL: str = "/assets"
+    CRITICAL_CSS_PATH: str = "__nexy__/critical.json"
+    # Entrées Vite par route (îlots de chaque page)
+    ISLANDS_MANIFEST_PATH: str = "__nexy__/islands.json"
+    ISLANDS_ENTRIES_PATH: str = "__nexy__/src/entries"
+    # Composants client (îlots) hydratés dans le navigateur par le runtime d'un framework
+    ISLAND_EXTENSIONS: list[str] = [".tsx", ".jsx", ".ts", ".js", ".vue", ".svelte"]
+    # Assets précompressés (.gz / .br) par `nexy build`
+    COMPRESSIBLE_EXTENSIONS: list[str] = [".css", ".js", ".mjs", ".json", ".map", ".svg", ".html", ".txt", ".xml", ".wasm"]
+    COMPRESS_MIN_SIZE: int = 1024
+    # Options de composant déclarées dans le frontmatter (`stream = True`), hissées au niveau du module
+    COMPONENT_OPTIONS: list[str] = ["stream", "backend", "revalidate", "memo", "cache"]
+    # Clés d'une politique `cache = {...}` (les tirets valent des soulignés : "s-maxage")
+    CACHE_POLICY_OPTIONS: list[str] = ["max_age", "s_maxage", "stale_while_revalidate", "vary", "private"]
+    # Fonctions du frontmatter déplacées au niveau du module (appelées sans rendre le composant)
+    COMPONENT_HOOKS: list[str] = ["static_params"]
+    REVALIDATE_CACHE_SIZE: int = 1024
+    STATIC_EXPORT_PATH: str = "__nexy__/static"
+    TEMPLATE_BACKENDS: list[str] = ["jinja", "native"]
+    # Directive `hydrate` des composants client (<Count hydrate="visible" />)
+    HYDRATION_STRATEGIES: list[str] = ["load", "idle", "visible", "media", "none"]
     MARKDOWN_EXTENSIONS: list[str] = ["extra","tables","fenced_code","codehilite","toc","admonition","attr_list","pymdownx.highlight","pymdownx.superfences","pymdownx.inlinehilite","pymdownx.details","pymdownx.tabbed"]
     TARGET_EXTENSIONS: list[str] = [".nexy", ".mdx"]
     FF_REGISTRY: dict[str, object] = {}
@@ -85,6 +85,9 @@ class LogicResult:
     props: List[NexyProp] = field(default_factory=list)
     python_code: str = ""
     css_imports: List[str] = field(default_factory=list)
+    options: Dict[str, Any] = field(default_factory=dict)
+    hooks: List[str] = field(default_factory=list)
+    is_async: bool = False
 
 
 @dataclass
@@ -113,6 +116,9 @@ class PaserModel:
     props: list[NexyProp]
     context: list[ContextModel] = field(default_factory=list)
     styles: list[str] = field(default_factory=list)
+    options: dict[str, Any] = field(default_factory=dict)
+    hooks: list[str] = field(default_factory=list)
+    is_async: bool = False
 
 @dataclass
 class FFModel:
@@ -133,6 +139,13 @@ class NexyConfigModel:
     useViteDevUrl: str | None = None
     useFF: list[FFModel] = field(default_factory=list)
     useMarkdownExtensions: list[str] = []
+    useTemplateCacheSize: int | None = None
+    useStreaming: bool = False
+    useTemplateBackend: str = "jinja"
+    useFragmentCache: Any = "memory"
+    useCriticalCSS: bool = False
+    useMinifyHTML: bool = True
+    useCompression: bool | dict[str, Any] = False
     excludeDirs: list[str] = []
     useMiddlewares: list[Any] = field(default_factory=list)
 
@@ -6,6 +6,8 @@ from fastapi.responses import Response
 from threading import RLock
 
 from nexy.routers.actions.store import ACTIONS_STORE
+from nexy.routers.fbrouter.cache import CachePolicy
+from nexy.routers.fbrouter.response import RouteResponse
 
 HTTP_METHODS: Set[str] = {"GET", "POST", "PUT", "DELETE", "PATCH", "OPTIONS", "HEAD"}
 
@@ -225,6 +227,28 @@ def UseResponse(
 
     return wrapper
 
+def UseCache(
+    max_age: int = 0,
+    s_maxage: Optional[int] = None,
+    stale_while_revalidate: Optional[int] = None,
+    vary: Optional[str | List[str]] = None,
+    private: bool = False,
+) -> Callable[[Any], Any]:
+    """Politique de cache HTTP (Cache-Control, Vary) d'un handler GET, ou de tout un controller."""
+    policy = CachePolicy(
+        max_age=max_age,
+        s_maxage=s_maxage,
+        stale_while_revalidate=stale_while_revalidate,
+        vary=vary,
+        private=private,
+    )
+
+    def wrapper(target: Any) -> Any:
+        target.__nexy_cache_meta__ = policy
+        return target
+
+    return wrapper
+
 def Module(prefix: str = "") -> Callable[[type[Any]], APIRouter]:
     def wrapper(cls: type[Any]) -> APIRouter:
         controllers_list = getattr(cls, "controllers", [])
@@ -287,9 +311,16 @@ def _register_controller(ctrl_cls: Type[Any], parent_router: APIRouter) -> None:
             route_tags = ctrl_tags
             if route_meta is not None and route_meta.tags is not None:
                 route_tags = route_meta.tags
+            # La politique du handler remplace celle du controller
+            cache_meta: CachePolicy | None = getattr(method_func, "__nexy_cache_meta__", None) or getattr(
+                ctrl_cls, "__nexy_cache_meta__", None
+            )
+            endpoint: Callable[..., Any] = method_func
+            if cache_meta is not None and method_upper in ("GET", "HEAD"):
+                endpoint = RouteResponse.cache_control(method_func, cache_meta)
             route_kwargs: Dict[str, Any] = {
                 "path": "/",
-                "endpoint": method_func,
+                "endpoint": endpoint,
                 "methods": [method_upper],
                 "name": route_name,
                 "dependencies": dependencies or None,
@@ -2,6 +2,7 @@ from pathlib import Path
 import shutil
 from nexy.utils.console import console
 from nexy.core.config import Config
+from .hydration import SCHEDULE_SCRIPT
 from .preact import preact
 from .react import react
 from .svelte import svelte
@@ -120,6 +121,7 @@ class FrontendGenerator:
             "  if (!imp) return Promise.reject(new Error('Component not found: ' + p));",
             "  return imp();",
             "}",
+            SCHEDULE_SCRIPT.rstrip("\n"),
             "export {};",
         ]
         runtime_content = "\n".join(runtime_lines) + "\n"
@@ -0,0 +1,57 @@
+from typing import Any, Tuple
+
+from nexy.core.config import Config
+
+# Shared by every framework runtime: decides when an <ncc> island is mounted,
+# from the data-nexy-hydrate attribute written by NCC (load, idle, visible, media, none).
+SCHEDULE_SCRIPT = """(() => {
+  const w: any = window as any;
+  if (w.__nexy_schedule) return;
+  const idle = (run: () => void) => (w.requestIdleCallback ? w.requestIdleCallback(run, { timeout: 2000 }) : setTimeout(run, 200));
+  w.__nexy_schedule = (el: any, mount: (el: any) => void) => {
+    const strategy = el.getAttribute('data-nexy-hydrate') || 'load';
+    if (strategy === 'none') return;
+    if (strategy === 'idle') return idle(() => mount(el));
+    if (strategy === 'media') {
+      const query = w.matchMedia(el.getAttribute('data-nexy-media') || 'all');
+      if (query.matches) return mount(el);
+      const change = () => {
+        if (!query.matches) return;
+        query.removeEventListener('change', change);
+        mount(el);
+      };
+      return query.addEventListener('change', change);
+    }
+    if (strategy === 'visible') {
+      // <ncc> is display: contents and has no box of its own: its children are observed
+      const targets = Array.from(el.children);
+      if (!('IntersectionObserver' in w) || !targets.length) return idle(() => mount(el));
+      const observer = new IntersectionObserver((entries) => {
+        if (!entries.some((entry) => entry.isIntersecting)) return;
+        observer.disconnect();
+        mount(el);
+      }, { rootMargin: '200px' });
+      return targets.forEach((target: any) => observer.observe(target));
+    }
+    mount(el);
+  };
+})();
+"""
+
+
+def hydration_strategy(directive: Any) -> Tuple[str, str]:
+    """
+    Strategy and media query of a hydrate= value: "visible" -> ("visible", ""),
+    "media:(max-width: 600px)" -> ("media", "(max-width: 600px)").
+    Raises ValueError for a strategy outside Config.HYDRATION_STRATEGIES.
+    """
+    strategy, _, query = str(directive).partition(":")
+    strategy = strategy.strip().lower()
+    if strategy not in Config.HYDRATION_STRATEGIES:
+        raise ValueError(
+            f"Unknown hydration strategy {directive!r}: expected one of {', '.join(Config.HYDRATION_STRATEGIES)}"
+        )
+    return strategy, query.strip()
+
+
+__all__ = ["SCHEDULE_SCRIPT", "hydration_strategy"]
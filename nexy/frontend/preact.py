@@ -24,7 +24,8 @@ def preact() -> FFModel:
             '}'
             'function init(){'
             'const nodes=w.document.querySelectorAll("[data-nexy-fw=\\"preact\\"]");'
-            'nodes.forEach((el: any)=>{m(el)});'
+            'const schedule=w.__nexy_schedule||((el: any, run: any)=>run(el));'
+            'nodes.forEach((el: any)=>{schedule(el,m)});'
             '}'
             'if(w.document.readyState==="loading"){'
             'w.document.addEventListener("DOMContentLoaded",init);'
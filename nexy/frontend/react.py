@@ -85,7 +85,9 @@ def react() -> FFModel:
 
         function init() {
             const nodes = document.querySelectorAll('[data-nexy-fw="react"]');
-            nodes.forEach(m);
+            // data-nexy-hydrate: load (default), idle, visible, media or none
+            const schedule = w.__nexy_schedule || ((el, run) => run(el));
+            nodes.forEach((el) => schedule(el, m));
         }
 
         if (document.readyState === "loading") {
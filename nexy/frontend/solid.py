@@ -30,7 +30,8 @@ def solid() -> FFModel:
             '}'
             'function init(){'
             'const nodes=w.document.querySelectorAll("[data-nexy-fw=\\"solid\\"]");'
-            'for(let i=0; i<nodes.length; i++) m(nodes[i]);'
+            'const schedule=w.__nexy_schedule||((el: any, run: any)=>run(el));'
+            'for(let i=0; i<nodes.length; i++) schedule(nodes[i],m);'
             '}'
             'if(w.document.readyState==="loading"){'
             'w.document.addEventListener("DOMContentLoaded",init);'
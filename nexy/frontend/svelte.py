@@ -30,7 +30,8 @@ def svelte() -> FFModel:
             '}'
             'function init(){'
             'const nodes=w.document.querySelectorAll("[data-nexy-fw=\\"svelte\\"]");'
-            'nodes.forEach((el: any)=>{m(el)});'
+            'const schedule=w.__nexy_schedule||((el: any, run: any)=>run(el));'
+            'nodes.forEach((el: any)=>{schedule(el,m)});'
             '}'
             'if(w.document.readyState==="loading"){'
             'w.document.addEventListener("DOMContentLoaded",init);'
@@ -1,5 +1,6 @@
 import { createLogger, type Logger, type Plugin} from 'vite'
 import path from 'node:path'
+import fs from 'node:fs'
 import { execSync } from 'child_process'
 import { createRequire } from 'module'
 import { pathToFileURL } from 'url'
@@ -21,6 +22,19 @@ function getTsxPath(): string {
   }
 }
 
+// Entrées par route écrites par `nexy build` (__nexy__/islands.json) : chaque page ne charge que ses îlots
+function islandInputs(): Record<string, string> {
+  const manifest = path.resolve(process.cwd(), '__nexy__/islands.json')
+  if (!fs.existsSync(manifest)) return {}
+  const { styles, entries } = JSON.parse(fs.readFileSync(manifest, 'utf-8'))
+  const inputs: Record<string, string> = {}
+  if (styles) inputs.styles = path.resolve(process.cwd(), styles)
+  for (const [name, entry] of Object.entries(entries || {})) {
+    inputs[name] = path.resolve(process.cwd(), entry as string)
+  }
+  return inputs
+}
+
 let nexySSGDone = false
 let isSSRBuild = false
 
@@ -64,7 +78,8 @@ function nexyPlugin(): Plugin {
           outDir: '__nexy__/client',
           rollupOptions: {
             input: {
-              main: path.resolve(process.cwd(), '__nexy__/main.ts')
+              main: path.resolve(process.cwd(), '__nexy__/main.ts'),
+              ...islandInputs()
             }
           }
         }
@@ -81,7 +81,9 @@ def vue() -> FFModel:
 
         function init() {
             const nodes = document.querySelectorAll('[data-nexy-fw="vue"]');
-            nodes.forEach(m);
+            // data-nexy-hydrate: load (default), idle, visible, media or none
+            const schedule = w.__nexy_schedule || ((el, run) => run(el));
+            nodes.forEach((el) => schedule(el, m));
         }
 
         if (document.readyState === "loading") {
@@ -1,8 +1,7 @@
 from contextvars import ContextVar
 import os
-from typing import Callable, Optional, Union, Type
+from typing import Awaitable, Callable, Optional, Union, Type
 from fastapi import FastAPI, APIRouter, Request, Response, status
-from fastapi.staticfiles import StaticFiles
 from starlette.exceptions import HTTPException
 from scalar_fastapi import get_scalar_api_reference
 
@@ -14,6 +13,11 @@ from nexy.routers.actions.engine import ACTION_ENGINE
 from nexy.routers.fbrouter import FBRouter
 from nexy.utils.console import console
 from nexy.routers.context import current_request
+from nexy.routers.compression import CompressionMiddleware, compression_options
+from nexy.routers.staticfiles import PrecompressedStaticFiles, precompressed_file
+from nexy.builder.static import StaticExporter
+from nexy.utils.imports.ncc import IslandHTML
+from nexy.utils.mode import is_prod
 
 
 class AppServer:
@@ -51,11 +55,47 @@ class AppServer:
         """Mounts directories if they exist."""
         mounts = {
             "/public": "public",
-            "/assets": "__nexy__/client/assets"
+            Config.STYLE_ASSETS_URL: Config.STYLE_ASSETS_PATH
         }
         for path, directory in mounts.items():
-            if os.path.isdir(directory):
-                self.server.mount(path, StaticFiles(directory=directory), name=directory)
+            # Feuilles de style des composants : publiées par le build, parfois après le démarrage (nexy dev)
+            published = directory == Config.STYLE_ASSETS_PATH
+            if published or os.path.isdir(directory):
+                # Variantes .br / .gz écrites par `nexy build`, choisies selon Accept-Encoding
+                static = PrecompressedStaticFiles(directory=directory, check_dir=not published)
+                self.server.mount(path, static, name=directory)
+
+    def _setup_static_pages(self) -> None:
+        """Serves the pages exported by `nexy build --static` without rendering them."""
+        assert self.server is not None
+        pages = StaticExporter.load() if is_prod() else {}
+        if not pages:
+            return
+
+        @self.server.middleware("http")
+        async def StaticPagesMiddleware(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+            # Query strings may change the render: those requests still reach the route
+            if request.method in ("GET", "HEAD") and not request.url.query:
+                page = pages.get(request.url.path.rstrip("/") or "/")
+                if page is not None:
+                    path, headers = page
+                    # Variante précompressée au build : CompressionMiddleware ne recompresse pas les fichiers.
+                    # Cache-Control / Vary de la politique `cache` de la route, relevés à l'export
+                    return precompressed_file(path, request.scope, media_type="text/html", headers=headers)
+            return await call_next(request)
+
+    def _preload_islands(self) -> None:
+        """In production, loads the SSG HTML of client components once instead of on every render."""
+        if is_prod():
+            IslandHTML.preload()
+
+    def _setup_compression(self) -> None:
+        """Compresses rendered pages and JSON when `useCompression` is set in nexyconfig."""
+        assert self.server is not None
+        options = compression_options(getattr(self.config, "useCompression", False))
+        if options is not None:
+            # Ajouté en dernier : enveloppe les autres middlewares (les pages statiques arrivent déjà précompressées)
+            self.server.add_middleware(CompressionMiddleware, **options)
 
     def _setup_favicon(self):
         """Handle favicon route."""
@@ -135,9 +175,12 @@ class AppServer:
         
 
         self.server.middleware("http")(self.PathMiddleware)
+        self._setup_static_pages()
+        self._preload_islands()
         self._setup_favicon()
         self._setup_static_files()
         self._resolve_router()
+        self._setup_compression()
         self.server.exception_handler(HTTPException)(self._register_error_handlers)
         return self.server
 
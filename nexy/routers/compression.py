@@ -0,0 +1,197 @@
+import zlib
+from typing import Any, Dict, Iterable, List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:  # Optional extra: pip install "nexy[brotli]"
+    brotli = None
+
+COMPRESSIBLE_TYPES = (
+    "text/html",
+    "text/plain",
+    "text/css",
+    "text/xml",
+    "text/javascript",
+    "application/json",
+    "application/javascript",
+    "application/xml",
+    "image/svg+xml",
+)
+
+
+def accepted_encodings(scope: Scope) -> List[str]:
+    """Encodings of the Accept-Encoding header, without those refused with q=0."""
+    accepted = []
+    for item in Headers(scope=scope).get("accept-encoding", "").split(","):
+        name, _, params = item.strip().partition(";")
+        quality = params.strip().removeprefix("q=")
+        try:
+            refused = bool(params) and float(quality) == 0
+        except ValueError:
+            refused = False
+        if name and not refused:
+            accepted.append(name.strip().lower())
+    return accepted
+
+
+class _Encoder:
+    """Incremental compressor: each chunk is flushed so streamed HTML reaches the client at once."""
+
+    def __init__(self, encoding: str, level: int) -> None:
+        self.encoding = encoding
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=level)
+        else:
+            # wbits 31: gzip container
+            self._zlib = zlib.compressobj(level, zlib.DEFLATED, 31)
+
+    def chunk(self, data: bytes) -> bytes:
+        if self.encoding == "br":
+            return bytes(self._brotli.process(data) + self._brotli.flush())
+        return self._zlib.compress(data) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self, data: bytes = b"") -> bytes:
+        if self.encoding == "br":
+            return bytes(self._brotli.process(data) + self._brotli.finish())
+        return self._zlib.compress(data) + self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """
+    Compresses rendered pages and JSON responses (gzip, or brotli when installed).
+
+    The body is buffered until `minimum_size` bytes are known (or it ends): smaller bodies
+    are sent as is. A body with a Content-Length is compressed whole, with the new length;
+    a streamed body is then compressed chunk by chunk. Responses that are already encoded
+    and file responses (`Accept-Ranges`, precompressed at build time) are left alone.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        minimum_size: int = 500,
+        gzip_level: int = 6,
+        brotli_quality: int = 4,
+        content_types: Iterable[str] = COMPRESSIBLE_TYPES,
+    ) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "br": brotli_quality}
+        self.content_types = tuple(content_types)
+
+    def _encoding(self, scope: Scope) -> Optional[str]:
+        accepted = accepted_encodings(scope)
+        if brotli is not None and "br" in accepted:
+            return "br"
+        if "gzip" in accepted or "*" in accepted:
+            return "gzip"
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        encoding = self._encoding(scope) if scope["type"] == "http" else None
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+        await _CompressedResponse(self, encoding, send).run(scope, receive)
+
+
+class _CompressedResponse:
+    """State of one response going through CompressionMiddleware."""
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: str, send: Send) -> None:
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        # None: not decided yet, False: passed through, _Encoder: compressing
+        self.encoder: Any = None
+        # Body received before the decision
+        self.buffer = bytearray()
+
+    async def run(self, scope: Scope, receive: Receive) -> None:
+        await self.middleware.app(scope, receive, self.wrap)
+
+    def _compressible(self, headers: Headers) -> bool:
+        content_type = headers.get("content-type", "").split(";")[0].strip().lower()
+        return (
+            "content-encoding" not in headers
+            and "accept-ranges" not in headers
+            and content_type.startswith(self.middleware.content_types)
+        )
+
+    def _start_compressed(self, length: Optional[int] = None) -> Message:
+        assert self.start is not None
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["content-encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        etag = headers.get("etag")
+        if etag and etag.endswith('"') and not etag.startswith("W/"):
+            # A strong ETag identifies one representation: "abc" becomes "abc-gzip"
+            headers["etag"] = f'{etag[:-1]}-{self.encoding}"'
+        if length is None:
+            del headers["content-length"]
+        else:
+            headers["content-length"] = str(length)
+        return self.start
+
+    def _decided(self) -> bool:
+        """Enough body to choose: `minimum_size` bytes of a streamed body (no Content-Length)."""
+        assert self.start is not None
+        sized = "content-length" in Headers(raw=self.start["headers"])
+        return not sized and len(self.buffer) >= self.middleware.minimum_size
+
+    async def wrap(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            # Copied: a Response object sent again (cached by its route) shares its raw_headers list
+            self.start = {**message, "headers": list(message.get("headers", []))}
+            headers = Headers(raw=self.start["headers"])
+            if not self._compressible(headers):
+                self.encoder = False
+                await self.send(message)
+            return
+
+        if message["type"] != "http.response.body" or self.encoder is False:
+            await self.send(message)
+            return
+        assert self.start is not None
+
+        body: bytes = message.get("body", b"")
+        more_body: bool = message.get("more_body", False)
+
+        if self.encoder is None:
+            # BaseHTTPMiddleware re-streams every body: chunks are gathered before choosing
+            self.buffer.extend(body)
+            if more_body and not self._decided():
+                return
+            body, self.buffer = bytes(self.buffer), bytearray()
+            if not more_body:
+                # Whole body: compressed only when it is worth it
+                if len(body) < self.middleware.minimum_size:
+                    self.encoder = False
+                    MutableHeaders(raw=self.start["headers"]).add_vary_header("Accept-Encoding")
+                    await self.send(self.start)
+                    await self.send({"type": "http.response.body", "body": body})
+                    return
+                encoder = _Encoder(self.encoding, self.middleware.levels[self.encoding])
+                compressed = encoder.finish(body)
+                await self.send(self._start_compressed(len(compressed)))
+                await self.send({"type": "http.response.body", "body": compressed})
+                return
+            self.encoder = _Encoder(self.encoding, self.middleware.levels[self.encoding])
+            await self.send(self._start_compressed())
+
+        data = self.encoder.chunk(body) if more_body else self.encoder.finish(body)
+        await self.send({"type": "http.response.body", "body": data, "more_body": more_body})
+
+
+def compression_options(setting: Any) -> Optional[Dict[str, Any]]:
+    """`useCompression` of nexyconfig: True for the defaults, or a dict of middleware options."""
+    if not setting:
+        return None
+    return dict(setting) if isinstance(setting, dict) else {}
+
+
+__all__ = ["CompressionMiddleware", "accepted_encodings", "compression_options"]
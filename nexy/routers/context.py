@@ -1,6 +1,80 @@
+import functools
+import inspect
 from contextvars import ContextVar
-from typing import Optional
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
 from fastapi import Request
 
 
-current_request: ContextVar[Optional[Request]] = ContextVar("current_request", default=None)
\ No newline at end of file
+current_request: ContextVar[Optional[Request]] = ContextVar("current_request", default=None)
+
+MEMO_STATE = "nexy_memo"
+MOUNT_STATE = "nexy_mounts"
+
+
+def _memo_key(
+    component: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any]
+) -> Optional[Hashable]:
+    """Key of one component call, or None when it cannot be memoized."""
+    if kwargs.get("caller") is not None:
+        # Slot content is rendered by the parent and may differ between calls
+        return None
+    key = (component.__module__, component.__qualname__, args, tuple(sorted(kwargs.items())))
+    try:
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _request_store(name: str) -> Optional[Dict[Hashable, Any]]:
+    """Dict kept on `request.state` for the current request, or None outside a request."""
+    request = current_request.get()
+    if request is None:
+        return None
+    store = getattr(request.state, name, None)
+    if store is None:
+        store = {}
+        setattr(request.state, name, store)
+    return store
+
+
+def _memo_store() -> Optional[Dict[Hashable, Any]]:
+    """Renders memoized for the current request, kept on `request.state`."""
+    return _request_store(MEMO_STATE)
+
+
+def mount_index(component: str) -> Optional[int]:
+    """Position (1, 2, ...) of a client component among the renders of the current request."""
+    store = _request_store(MOUNT_STATE)
+    if store is None:
+        return None
+    count: int = store.get(component, 0) + 1
+    store[component] = count
+    return count
+
+
+def memo(component: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Component option `memo = True`: calls with the same hashable props render once per request.
+    Outside a request, or with unhashable props or a Slot, the component renders as usual.
+    """
+    if inspect.iscoroutinefunction(component):
+        @functools.wraps(component)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            store, key = _memo_store(), _memo_key(component, args, kwargs)
+            if store is None or key is None:
+                return await component(*args, **kwargs)
+            if key not in store:
+                store[key] = await component(*args, **kwargs)
+            return store[key]
+        return async_wrapper
+
+    @functools.wraps(component)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        store, key = _memo_store(), _memo_key(component, args, kwargs)
+        if store is None or key is None:
+            return component(*args, **kwargs)
+        if key not in store:
+            store[key] = component(*args, **kwargs)
+        return store[key]
+    return wrapper
@@ -10,8 +10,10 @@ from nexy.error import InternalServerError
 from nexy.routers.fbrouter.discovery import RouteDiscovery
 
 # Specialized classes
+from .cache import POLICY_ATTR, CachePolicy
 from .dependencies import RouteDependencies
 from .middleware import RouteMiddleware
+from .response import RouteResponse
 from .validator import RouteValidator
 
 HTTP_METHODS_MAP = {
@@ -100,9 +102,18 @@ class FBRouter:
                         # Metadata extraction
                         r_meta = getattr(handler, "__nexy_route_meta__", None)
                         resp_meta = getattr(handler, "__nexy_response_meta__", None)
+                        endpoint = handler
+                        if method == "GET" and (seconds := getattr(module, "revalidate", None)):
+                            endpoint = RouteResponse.revalidate(handler, seconds)
+                        # @UseCache on the handler, or `cache = CachePolicy(...)` for every GET of the module
+                        policy = CachePolicy.resolve(
+                            getattr(handler, POLICY_ATTR, None), path
+                        ) or CachePolicy.declared(module, path)
+                        if method in ("GET", "HEAD") and policy:
+                            endpoint = RouteResponse.cache_control(endpoint, policy)
                         self.router.add_api_route(
                             path=path,
-                            endpoint=handler,
+                            endpoint=endpoint,
                             methods=[method],
                             dependencies=deps or None,
                             name=method,
@@ -116,6 +127,17 @@ class FBRouter:
 
             else: # Component (UI)
                 if component := getattr(module, meta["comp_name"], None):
+                    if seconds := getattr(module, "revalidate", None):
+                        # Cached pages are served whole: revalidate takes precedence over stream.
+                        # Their ETag is computed once per regeneration, not on every request.
+                        tagged = RouteResponse.tagged(RouteResponse.collect(component))
+                        endpoint = RouteResponse.conditional(RouteResponse.revalidate(tagged, seconds))
+                    elif getattr(module, "stream", False):
+                        endpoint = RouteResponse.stream(component)
+                    else:
+                        endpoint = RouteResponse.conditional(component)
+                    if policy := CachePolicy.declared(module, path):
+                        endpoint = RouteResponse.cache_control(endpoint, policy)
                     self.router.get(
                         path, 
                         response_class=HTMLResponse,
@@ -124,7 +146,7 @@ class FBRouter:
                         description=component.__doc__ or "",
                         tags=[path],
                         
-                    )(component)
+                    )(endpoint)
         
 
 
@@ -0,0 +1,81 @@
+from typing import Any, Dict, Iterable, Optional, Union
+
+from nexy.core.config import Config
+
+# Attribute holding the policy of a handler, a controller or a compiled page module
+POLICY_ATTR = "__nexy_cache_meta__"
+
+
+class CachePolicy:
+    """
+    HTTP caching policy of a route, sent as Cache-Control (and Vary) headers.
+
+    `max_age` applies to browsers, `s_maxage` to shared caches (CDN, proxies).
+    A private response may only be stored by the browser: `s_maxage` is then ignored.
+    """
+
+    def __init__(
+        self,
+        max_age: int = 0,
+        s_maxage: Optional[int] = None,
+        stale_while_revalidate: Optional[int] = None,
+        vary: Union[str, Iterable[str], None] = None,
+        private: bool = False,
+    ) -> None:
+        self.max_age = max_age
+        self.s_maxage = s_maxage
+        self.stale_while_revalidate = stale_while_revalidate
+        self.vary = [vary] if isinstance(vary, str) else list(vary or ())
+        self.private = private
+
+    @staticmethod
+    def options(value: Dict[Any, Any]) -> Optional[Dict[str, Any]]:
+        """Keyword arguments of a `{"max_age": 60, "s-maxage": 600}` policy, or None if it is not one."""
+        options = {str(key).replace("-", "_"): option for key, option in value.items()}
+        if not options or not set(options) <= set(Config.CACHE_POLICY_OPTIONS):
+            return None
+        return options
+
+    @classmethod
+    def resolve(cls, value: Any, route: str = "") -> Optional["CachePolicy"]:
+        """
+        Policy declared by a route: a CachePolicy, a max-age in seconds, or a dict of
+        options (`{"max_age": 60, "s-maxage": 600}`). A dict with other keys is an error;
+        anything else declares no policy.
+        """
+        if isinstance(value, CachePolicy):
+            return value
+        if isinstance(value, int) and not isinstance(value, bool):
+            return cls(max_age=value)
+        if isinstance(value, dict):
+            options = cls.options(value)
+            if options is None:
+                expected = ", ".join(Config.CACHE_POLICY_OPTIONS)
+                raise ValueError(f"{route or 'route'}: invalid cache policy {value!r} (expected options: {expected})")
+            return cls(**options)
+        return None
+
+    @classmethod
+    def declared(cls, module: Any, route: str = "") -> Optional["CachePolicy"]:
+        """
+        Policy of a route module: the `cache` option of a compiled page (kept under POLICY_ATTR),
+        or a `cache = CachePolicy(...)` of a Python route. Any other `cache` is the route's own data.
+        """
+        value = getattr(module, POLICY_ATTR, None)
+        if value is None and isinstance(getattr(module, "cache", None), CachePolicy):
+            value = module.cache
+        return cls.resolve(value, route)
+
+    def cache_control(self) -> str:
+        directives = ["private" if self.private else "public", f"max-age={self.max_age}"]
+        if self.s_maxage is not None and not self.private:
+            directives.append(f"s-maxage={self.s_maxage}")
+        if self.stale_while_revalidate is not None:
+            directives.append(f"stale-while-revalidate={self.stale_while_revalidate}")
+        return ", ".join(directives)
+
+    def __repr__(self) -> str:
+        return f"CachePolicy({self.cache_control()!r}, vary={self.vary!r})"
+
+
+__all__ = ["CachePolicy", "POLICY_ATTR"]
@@ -1,11 +1,12 @@
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional
 from nexy.core.config import Config
 from nexy.core.string import StringTransform
 
 class RouteLayout:
     @staticmethod
-    def get_closest_import(source_path: str, is_layout: bool = False) -> Optional[str]:
+    def get_closest_path(source_path: str, is_layout: bool = False) -> Optional[Path]:
+        """Returns the closest layout.nexy above a route file (its parent layout for a layout)."""
         try:
             path = Path(source_path).resolve()
             root = Path(Config.ROUTER_PATH).resolve()
@@ -18,26 +19,7 @@ class RouteLayout:
                 layout_candidate = current / "layout.nexy"
                 
                 if layout_candidate.is_file() and layout_candidate != path:
-                    try:
-                        # 1. Get the relative path as a POSIX string (with slashes)
-                        rel_path = layout_candidate.relative_to(Path.cwd())
-                        raw_path = rel_path.as_posix()
-                    except ValueError:
-                        raw_path = layout_candidate.as_posix()
-
-                    # 2. Normalize the path while slashes still exist
-                    # This ensures (article) becomes article_ngp
-                    normalized_path = StringTransform.normalize_route_path_for_namespace(raw_path)
-                    
-                    # 3. Strip extension and convert to Python module dots
-                    module_path = normalized_path.rsplit(".", 1)[0].replace("/", ".")
-                    
-                    # 4. Apply namespace
-                    namespace = getattr(Config, "NAMESPACE", "__nexy__.").replace("/", ".")
-                    if not namespace.endswith("."):
-                        namespace += "."
-                        
-                    return f"{namespace}{module_path}"
+                    return layout_candidate
 
                 if current == limit_dir:
                     break
@@ -46,4 +28,46 @@ class RouteLayout:
         except Exception:
             return None
             
-        return None
\ No newline at end of file
+        return None
+
+    @staticmethod
+    def get_chain(source_path: str, is_layout: bool = False) -> List[Path]:
+        """Returns every layout wrapping a route file, from the closest to the root layout."""
+        chain: List[Path] = []
+        current = RouteLayout.get_closest_path(source_path, is_layout=is_layout)
+        while current is not None and current not in chain:
+            chain.append(current)
+            current = RouteLayout.get_closest_path(str(current), is_layout=True)
+        return chain
+
+    @staticmethod
+    def to_import(layout_path: Path) -> str:
+        """Converts a layout.nexy path into the module path of its compiled component."""
+        try:
+            # 1. Get the relative path as a POSIX string (with slashes)
+            rel_path = layout_path.relative_to(Path.cwd())
+            raw_path = rel_path.as_posix()
+        except ValueError:
+            raw_path = layout_path.as_posix()
+
+        # 2. Normalize the path while slashes still exist
+        # This ensures (article) becomes article_ngp
+        normalized_path = StringTransform.normalize_route_path_for_namespace(raw_path)
+        
+        # 3. Strip extension and convert to Python module dots
+        module_path = normalized_path.rsplit(".", 1)[0].replace("/", ".")
+        
+        # 4. Apply namespace
+        namespace = getattr(Config, "NAMESPACE", "__nexy__.").replace("/", ".")
+        if not namespace.endswith("."):
+            namespace += "."
+            
+        return f"{namespace}{module_path}"
+
+    @staticmethod
+    def get_closest_import(source_path: str, is_layout: bool = False) -> Optional[str]:
+        try:
+            layout_path = RouteLayout.get_closest_path(source_path, is_layout=is_layout)
+            return RouteLayout.to_import(layout_path) if layout_path else None
+        except Exception:
+            return None
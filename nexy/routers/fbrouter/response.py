@@ -0,0 +1,219 @@
+import functools
+import hashlib
+import inspect
+import re
+from typing import Any, Callable, Dict, NamedTuple, Union, cast
+from fastapi import Request, Response
+from fastapi.responses import HTMLResponse, StreamingResponse
+
+from .cache import CachePolicy
+from .revalidate import RevalidateCache
+
+REQUEST_PARAM = "_nexy_request"
+RESPONSE_PARAM = "_nexy_response"
+# Suffix added by CompressionMiddleware to the ETag of a compressed representation
+_ENCODING_SUFFIX_RE = re.compile(r"-(?:gzip|br)(?=\"$)")
+
+
+class TaggedHTML(NamedTuple):
+    """Rendered page and its ETag, computed once when the page is rendered."""
+    html: str
+    etag: str
+
+
+class RouteResponse:
+    @staticmethod
+    def _declare(endpoint: Callable[..., Any], signature: inspect.Signature) -> Callable[..., Any]:
+        """Signature FastAPI reads instead of the (*args, **kwargs) of the wrapper."""
+        cast(Any, endpoint).__signature__ = signature
+        return endpoint
+
+    @staticmethod
+    def _signature(component: Callable[..., Any], endpoint: Callable[..., Any], returns: type) -> Callable[..., Any]:
+        """Keeps the component parameters (path params, props) but declares the real response type."""
+        return RouteResponse._declare(endpoint, inspect.signature(component).replace(return_annotation=returns))
+
+    @staticmethod
+    def stream(component: Callable[..., Any]) -> Callable[..., Any]:
+        """Wraps a streaming component so its chunks are sent as soon as they are rendered."""
+        if inspect.iscoroutinefunction(component):
+            @functools.wraps(component)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> StreamingResponse:
+                return StreamingResponse(await component(*args, **kwargs), media_type="text/html")
+            return RouteResponse._signature(component, async_endpoint, StreamingResponse)
+
+        @functools.wraps(component)
+        def endpoint(*args: Any, **kwargs: Any) -> StreamingResponse:
+            return StreamingResponse(component(*args, **kwargs), media_type="text/html")
+        return RouteResponse._signature(component, endpoint, StreamingResponse)
+
+    @staticmethod
+    def collect(component: Callable[..., Any]) -> Callable[..., Any]:
+        """Joins the chunks of a streaming component into a single HTML string."""
+        if inspect.iscoroutinefunction(component):
+            @functools.wraps(component)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> str:
+                rendered = await component(*args, **kwargs)
+                return rendered if isinstance(rendered, str) else "".join(rendered)
+            return RouteResponse._signature(component, async_endpoint, str)
+
+        @functools.wraps(component)
+        def endpoint(*args: Any, **kwargs: Any) -> str:
+            rendered = component(*args, **kwargs)
+            return rendered if isinstance(rendered, str) else "".join(rendered)
+        return RouteResponse._signature(component, endpoint, str)
+
+    @staticmethod
+    def etag(html: str) -> str:
+        """Strong ETag of a rendered page: a hash of its body."""
+        return f'"{hashlib.blake2b(html.encode("utf-8"), digest_size=16).hexdigest()}"'
+
+    @staticmethod
+    def tagged(component: Callable[..., Any]) -> Callable[..., Any]:
+        """Makes a (collected) component return its HTML with its ETag."""
+        if inspect.iscoroutinefunction(component):
+            @functools.wraps(component)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> TaggedHTML:
+                html = await component(*args, **kwargs)
+                return TaggedHTML(html, RouteResponse.etag(html))
+            return async_endpoint
+
+        @functools.wraps(component)
+        def endpoint(*args: Any, **kwargs: Any) -> TaggedHTML:
+            html = component(*args, **kwargs)
+            return TaggedHTML(html, RouteResponse.etag(html))
+        return endpoint
+
+    @staticmethod
+    def not_modified(request: Request, etag: str) -> bool:
+        """If-None-Match (weak comparison) against the ETag of the page."""
+        header = request.headers.get("if-none-match")
+        if not header:
+            return False
+        for candidate in header.split(","):
+            candidate = _ENCODING_SUFFIX_RE.sub("", candidate.strip().removeprefix("W/"))
+            if candidate in ("*", etag):
+                return True
+        return False
+
+    @staticmethod
+    def _respond(request: Request, rendered: Union[str, TaggedHTML, Any]) -> Any:
+        if isinstance(rendered, TaggedHTML):
+            html, etag = rendered
+        elif isinstance(rendered, str):
+            html, etag = rendered, RouteResponse.etag(rendered)
+        else:
+            # Response built by the component itself
+            return rendered
+        if RouteResponse.not_modified(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
+        return HTMLResponse(html, headers={"ETag": etag})
+
+    @staticmethod
+    def conditional(handler: Callable[..., Any]) -> Callable[..., Any]:
+        """
+        Sends rendered pages with an ETag and answers If-None-Match with 304 Not Modified.
+
+        The handler returns HTML (hashed on every request) or a TaggedHTML whose ETag was
+        computed when it was rendered (pages cached by `revalidate`).
+        """
+        has_request = REQUEST_PARAM in inspect.signature(handler).parameters
+
+        def request_of(kwargs: Dict[str, Any]) -> Request:
+            # Forwarded to handlers that need it themselves (revalidate)
+            request: Request = kwargs[REQUEST_PARAM] if has_request else kwargs.pop(REQUEST_PARAM)
+            return request
+
+        if inspect.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+                request = request_of(kwargs)
+                return RouteResponse._respond(request, await handler(*args, **kwargs))
+            endpoint: Callable[..., Any] = async_endpoint
+        else:
+            @functools.wraps(handler)
+            def endpoint(*args: Any, **kwargs: Any) -> Any:
+                request = request_of(kwargs)
+                return RouteResponse._respond(request, handler(*args, **kwargs))
+
+        if has_request:
+            signature = inspect.signature(handler).replace(return_annotation=Response)
+            return RouteResponse._declare(endpoint, signature)
+        return RouteResponse._with_request(handler, endpoint, returns=Response)
+
+    @staticmethod
+    def _with_request(handler: Callable[..., Any], endpoint: Callable[..., Any], returns: Any = None) -> Callable[..., Any]:
+        """Adds a keyword-only Request parameter, resolved by FastAPI but never passed to the handler."""
+        return RouteResponse._with_param(handler, endpoint, REQUEST_PARAM, Request, returns)
+
+    @staticmethod
+    def _with_param(
+        handler: Callable[..., Any], endpoint: Callable[..., Any], name: str, annotation: type, returns: Any = None
+    ) -> Callable[..., Any]:
+        signature = inspect.signature(handler)
+        params = list(signature.parameters.values())
+        extra = inspect.Parameter(name, inspect.Parameter.KEYWORD_ONLY, annotation=annotation)
+        index = next((i for i, p in enumerate(params) if p.kind is inspect.Parameter.VAR_KEYWORD), len(params))
+        params.insert(index, extra)
+        signature = signature.replace(parameters=params)
+        if returns is not None:
+            signature = signature.replace(return_annotation=returns)
+        return RouteResponse._declare(endpoint, signature)
+
+    @staticmethod
+    def _apply_policy(policy: CachePolicy, injected: Response, result: Any) -> Any:
+        # FastAPI copies the headers of the injected Response only into responses it builds itself
+        target = result if isinstance(result, Response) else injected
+        if target.status_code is not None and target.status_code >= 400:
+            return result
+        if "cache-control" not in target.headers:
+            target.headers["Cache-Control"] = policy.cache_control()
+        # A Response returned again (cached by the route) already carries the Vary values
+        present = {value.strip().lower() for value in target.headers.get("vary", "").split(",")}
+        for header in policy.vary:
+            if header.lower() not in present:
+                target.headers.add_vary_header(header)
+        return result
+
+    @staticmethod
+    def cache_control(handler: Callable[..., Any], policy: CachePolicy) -> Callable[..., Any]:
+        """
+        Sends the Cache-Control and Vary headers of the route policy.
+
+        Error responses are left uncached, and a Cache-Control set by the handler itself wins.
+        """
+        if inspect.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+                injected: Response = kwargs.pop(RESPONSE_PARAM)
+                return RouteResponse._apply_policy(policy, injected, await handler(*args, **kwargs))
+            return RouteResponse._with_param(handler, async_endpoint, RESPONSE_PARAM, Response)
+
+        @functools.wraps(handler)
+        def endpoint(*args: Any, **kwargs: Any) -> Any:
+            injected: Response = kwargs.pop(RESPONSE_PARAM)
+            return RouteResponse._apply_policy(policy, injected, handler(*args, **kwargs))
+        return RouteResponse._with_param(handler, endpoint, RESPONSE_PARAM, Response)
+
+    @staticmethod
+    def revalidate(handler: Callable[..., Any], seconds: float) -> Callable[..., Any]:
+        """
+        Serves the cached result of a GET route (incremental static regeneration).
+
+        The result is kept per URL; after `seconds` the stale value is still served
+        while it is regenerated in the background.
+        """
+        cache = RevalidateCache(seconds)
+
+        if inspect.iscoroutinefunction(handler):
+            @functools.wraps(handler)
+            async def async_endpoint(*args: Any, **kwargs: Any) -> Any:
+                request: Request = kwargs.pop(REQUEST_PARAM)
+                return await cache.aget(RevalidateCache.key(request), lambda: handler(*args, **kwargs))
+            return RouteResponse._with_request(handler, async_endpoint)
+
+        @functools.wraps(handler)
+        def endpoint(*args: Any, **kwargs: Any) -> Any:
+            request: Request = kwargs.pop(REQUEST_PARAM)
+            return cache.get(RevalidateCache.key(request), lambda: handler(*args, **kwargs))
+        return RouteResponse._with_request(handler, endpoint)
@@ -0,0 +1,97 @@
+import asyncio
+import contextvars
+import threading
+import time
+from typing import Any, Awaitable, Callable, Optional, Set, Tuple
+
+from fastapi import Request
+
+from nexy.core.cache import MemoryCache
+from nexy.core.config import Config
+
+
+class RevalidateCache:
+    """
+    Stale-while-revalidate store for one route.
+
+    A fresh entry is served as is. Once it is older than `seconds`, the stale entry is
+    still served while a single background regeneration replaces it.
+    """
+
+    def __init__(self, seconds: float, maxsize: Optional[int] = None) -> None:
+        self.seconds = seconds
+        self.entries: MemoryCache[Tuple[float, Any]] = MemoryCache(maxsize=maxsize or Config.REVALIDATE_CACHE_SIZE)
+        self._pending: Set[str] = set()
+        self._lock = threading.Lock()
+        # Keeps background tasks referenced until they finish
+        self._tasks: Set[asyncio.Task[Any]] = set()
+
+    @staticmethod
+    def key(request: Request) -> str:
+        """Path and query string: every distinct URL gets its own entry."""
+        query = request.url.query
+        return f"{request.url.path}?{query}" if query else request.url.path
+
+    def _lookup(self, key: str) -> Tuple[Optional[Any], bool]:
+        """Returns (value, needs_refresh); needs_refresh is True for the first stale hit only."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None, False
+        created, value = entry
+        if time.monotonic() - created < self.seconds:
+            return value, False
+        with self._lock:
+            if key in self._pending:
+                return value, False
+            self._pending.add(key)
+        return value, True
+
+    def _store(self, key: str, value: Any) -> Any:
+        self.entries.set(key, (time.monotonic(), value))
+        return value
+
+    def _done(self, key: str) -> None:
+        with self._lock:
+            self._pending.discard(key)
+
+    def get(self, key: str, render: Callable[[], Any]) -> Any:
+        """Sync routes: renders on a miss, regenerates stale entries in a thread."""
+        value, refresh = self._lookup(key)
+        if value is None and not refresh:
+            return self._store(key, render())
+        if refresh:
+            # The thread keeps the request's contextvars (current_request, ...), like an asyncio task
+            context = contextvars.copy_context()
+            threading.Thread(target=context.run, args=(self._refresh, key, render), daemon=True).start()
+        return value
+
+    def _refresh(self, key: str, render: Callable[[], Any]) -> None:
+        try:
+            self._store(key, render())
+        except Exception:
+            # The stale entry stays in place; the next request retries
+            pass
+        finally:
+            self._done(key)
+
+    async def aget(self, key: str, render: Callable[[], Awaitable[Any]]) -> Any:
+        """Async routes: same policy, regenerating in a task on the running loop."""
+        value, refresh = self._lookup(key)
+        if value is None and not refresh:
+            return self._store(key, await render())
+        if refresh:
+            task = asyncio.get_running_loop().create_task(self._arefresh(key, render))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        return value
+
+    async def _arefresh(self, key: str, render: Callable[[], Awaitable[Any]]) -> None:
+        try:
+            self._store(key, await render())
+        except Exception:
+            pass
+        finally:
+            self._done(key)
+
+
+__all__ = ["RevalidateCache"]
@@ -0,0 +1,65 @@
+import stat
+from mimetypes import guess_type
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import anyio
+from starlette.responses import FileResponse, Response
+from starlette.staticfiles import StaticFiles
+from starlette.types import Scope
+
+from nexy.core.config import Config
+from nexy.routers.compression import accepted_encodings
+
+# Preferred first when the client accepts both
+ENCODINGS: List[Tuple[str, str]] = [("br", ".br"), ("gzip", ".gz")]
+
+
+class PrecompressedStaticFiles(StaticFiles):
+    """
+    StaticFiles serving the `.br` / `.gz` siblings written by `nexy build`
+    when the client accepts them. Nothing is compressed at request time.
+    """
+
+    async def get_response(self, path: str, scope: Scope) -> Response:
+        compressible = any(path.lower().endswith(ext) for ext in Config.COMPRESSIBLE_EXTENSIONS)
+        if compressible and scope["method"] in ("GET", "HEAD"):
+            accepted = accepted_encodings(scope)
+            for encoding, suffix in ENCODINGS:
+                if encoding not in accepted and "*" not in accepted:
+                    continue
+                try:
+                    full_path, stat_result = await anyio.to_thread.run_sync(self.lookup_path, path + suffix)
+                except (OSError, ValueError):
+                    continue
+                if stat_result and stat.S_ISREG(stat_result.st_mode):
+                    response = self.file_response(full_path, stat_result, scope)
+                    response.headers["content-type"] = guess_type(path)[0] or "text/plain"
+                    response.headers["content-encoding"] = encoding
+                    response.headers["vary"] = "Accept-Encoding"
+                    return response
+
+        response = await super().get_response(path, scope)
+        if compressible:
+            response.headers["vary"] = "Accept-Encoding"
+        return response
+
+
+def precompressed_file(
+    path: Path, scope: Scope, media_type: str, headers: Optional[Dict[str, str]] = None
+) -> FileResponse:
+    """FileResponse for a file written by `nexy build`, from its `.br` / `.gz` sibling when accepted."""
+    accepted = accepted_encodings(scope)
+    for encoding, suffix in ENCODINGS:
+        variant = path.with_name(path.name + suffix)
+        if (encoding in accepted or "*" in accepted) and variant.is_file():
+            response = FileResponse(variant, media_type=media_type, headers=headers)
+            response.headers["content-encoding"] = encoding
+            break
+    else:
+        response = FileResponse(path, media_type=media_type, headers=headers)
+    response.headers.add_vary_header("Accept-Encoding")
+    return response
+
+
+__all__ = ["PrecompressedStaticFiles", "precompressed_file"]
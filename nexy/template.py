@@ -1,58 +1,231 @@
+import shutil
+import threading
 import markdown
-from jinja2 import Environment, FileSystemLoader, select_autoescape
-from typing import Any, Dict, Optional
+from jinja2 import BaseLoader, ChoiceLoader, Environment, FileSystemLoader, ModuleLoader, Undefined, select_autoescape
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional
 from pathlib import Path
 import json
 from .core.config import Config
+from .errors import NexyCompileError
+from .utils.fragments import FragmentCacheExtension
+from .utils.highlight import cached_extensions
+from .utils.mode import is_prod
 from .utils.ports import get_vite_port
 
 extension_configs={
     "pymdownx.highlight": {
     "pygments_lang_class": True,
-    "linenums": False, 
+    "linenums": False,
     }
 }
 
+# Un environnement par mode de rendu (synchrone / asynchrone)
+_envs: Dict[bool, Environment] = {}
+_env_lock = threading.Lock()
+
+
+def _compiled_path(is_async: bool) -> Path:
+    """Dossier des templates précompilés (les versions asynchrones sont à part)."""
+    compiled = Path(Config.COMPILED_TEMPLATES_PATH)
+    return compiled / "async" if is_async else compiled
+
+
+def _create_loader(prod: bool, is_async: bool = False) -> BaseLoader:
+    """En production, les templates précompilés par `nexy build` passent en premier."""
+    source_loader = FileSystemLoader(".")
+    compiled = _compiled_path(is_async)
+    if prod and compiled.is_dir():
+        return ChoiceLoader([ModuleLoader(compiled.as_posix()), source_loader])
+    return source_loader
+
+
+def _create_environment(is_async: bool = False) -> Environment:
+    """Construit l'environnement Jinja2 partagé par tout le processus."""
+    config = Config()
+    prod = is_prod()
+    cache_size = getattr(config, "useTemplateCacheSize", None) or Config.TEMPLATE_CACHE_SIZE
+
+    return Environment(
+        loader=_create_loader(prod, is_async),
+        # En production les templates compilés ne changent plus : pas de stat() par rendu.
+        # En développement, Jinja2 invalide le cache selon le mtime du fichier source.
+        auto_reload=not prod,
+        # Cache LRU borné des templates compilés (thread-safe)
+        cache_size=cache_size,
+        # Composants `async def` : rendu via `render_async` / `generate_async`
+        enable_async=is_async,
+        # `{% cache key, ttl %}` : fragments mis en cache (nexy.utils.fragments)
+        extensions=[FragmentCacheExtension],
+    )
+
+
+def get_environment(is_async: bool = False) -> Environment:
+    """Retourne l'environnement Jinja2 du processus (créé à la première demande)."""
+    env = _envs.get(is_async)
+    if env is None:
+        with _env_lock:
+            env = _envs.get(is_async)
+            if env is None:
+                env = _envs[is_async] = _create_environment(is_async)
+    return env
+
+
+def compile_templates(names: Iterable[str], target: Optional[str] = None) -> list[str]:
+    """
+    Compile les templates générés en modules Python chargés par `ModuleLoader`.
+
+    Args:
+        names: Noms des templates (chemins relatifs au projet, ex: __nexy__/src/routes/index.html)
+        target: Dossier de sortie (par défaut Config.COMPILED_TEMPLATES_PATH)
+
+    Returns:
+        La liste des templates compilés
+
+    Raises:
+        NexyCompileError: un template ne compile pas ; les modules du build précédent restent en place
+    """
+    out_dir = Path(target or Config.COMPILED_TEMPLATES_PATH)
+    # Toujours relire les sources : jamais d'anciens modules compilés
+    source_loader = FileSystemLoader(".")
+
+    # Compilés à part, puis substitués d'un coup à la sortie précédente
+    staging = out_dir.with_name(f"{out_dir.name}.tmp")
+    shutil.rmtree(staging, ignore_errors=True)
+    # Le code généré diffère selon enable_async : une version par environnement
+    targets = {False: staging, True: staging / "async"}
+    for directory in targets.values():
+        directory.mkdir(parents=True, exist_ok=True)
+
+    compiled: list[str] = []
+    module_filename: Callable[[str], str] = ModuleLoader.get_module_filename
+    for name in names:
+        try:
+            for is_async, directory in targets.items():
+                env = get_environment(is_async)
+                source, filename, _ = source_loader.get_source(env, name)
+                code = env.compile(source, name, filename, raw=True, defer_init=True)
+                module_file = directory / module_filename(name)
+                module_file.write_text(code, encoding="utf-8")
+        except Exception as e:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise NexyCompileError(source_path=name, message=str(e), line=getattr(e, "lineno", None)) from e
+        compiled.append(name)
+
+    shutil.rmtree(out_dir, ignore_errors=True)
+    staging.rename(out_dir)
+    return compiled
+
+
+def render_markdown(content: str) -> str:
+    """Convertit le texte Markdown en HTML (au rendu, ou au build pour le MDX statique)."""
+    # Utilisation de la librairie standard 'markdown' avec extensions communes,
+    # la coloration syntaxique passant par le cache de blocs de code
+    extensions, configs = cached_extensions(Config.MARKDOWN_EXTENSIONS, extension_configs)
+    html: str = markdown.markdown(content, extensions=extensions, extension_configs=configs)
+    return html
+
+
+def native_getattr(obj: Any, name: str) -> Any:
+    """`obj.name` dans un template compilé en Python : même résolution que Jinja2."""
+    try:
+        return getattr(obj, name)
+    except AttributeError:
+        pass
+    try:
+        return obj[name]
+    except (TypeError, LookupError, AttributeError):
+        return Undefined(obj=obj, name=name)
+
+
+def native_getitem(obj: Any, key: Any) -> Any:
+    """`obj[key]` dans un template compilé en Python : même résolution que Jinja2."""
+    try:
+        return obj[key]
+    except (AttributeError, TypeError, LookupError):
+        if isinstance(key, str):
+            try:
+                return getattr(obj, key)
+            except AttributeError:
+                pass
+        return Undefined(obj=obj, name=key)
+
+
+class LazyRender:
+    """Rendu différé : le contenu n'est produit qu'au moment où il est inséré dans le HTML."""
+
+    def __init__(self, render: Callable[[], Any]) -> None:
+        self._render = render
+        self._value: Optional[str] = None
+
+    def __str__(self) -> str:
+        if self._value is None:
+            self._value = str(self._render())
+        return self._value
+
+    # Compatible avec le filtre `safe` de Jinja2 (Markup)
+    __html__ = __str__
+
+
 class Template:
     """Classe pour gérer le rendu des templates Jinja2 et Markdown."""
-    
+
     def __init__(self) -> None:
-        """Initialise le renderer avec la configuration Nexy."""
-        self.config =  Config()
-        
-        # Sécurité : autoescape activé pour éviter les failles XSS
-        self.env = Environment(
-            loader=FileSystemLoader("."),
-            auto_reload=True,
-        
-        )
-    
+        """Initialise le renderer sur l'environnement partagé du processus."""
+        self.env = get_environment()
+
     def _render_jinja2(self, path: str, context: Dict[str, Any]) -> str:
         """Charge et rend un template Jinja2."""
         template = self.env.get_template(path)
         return template.render(context)
-    
+
     def _render_markdown(self, content: str) -> str:
         """Convertit le texte Markdown en HTML."""
-        # Utilisation de la librairie standard 'markdown' avec extensions communes
-        return markdown.markdown(content, extensions=self.config.MARKDOWN_EXTENSIONS, extension_configs=extension_configs)
-    
+        return render_markdown(content)
+
     def render(self, path: str, context: Optional[Dict[str, Any]] = None) -> str:
         """
         Rend un template selon l'extension (Jinja2 ou Markdown).
-        
+
         Args:
             path: Chemin du template
             context: Contexte pour le rendu (dict clé-valeur)
-        
+
         Returns:
             Contenu rendu (HTML)
         """
         if context is None:
             context = {}
-        
+
         rendered_content = self._render_jinja2(path, context)
 
         if path.endswith(".md"):
             return self._render_markdown(rendered_content)
         return rendered_content
+
+    async def render_async(self, path: str, context: Optional[Dict[str, Any]] = None) -> str:
+        """
+        Rend un template sur l'environnement asynchrone (composants `async def`).
+
+        Les appels de composants asynchrones dans le template sont attendus par Jinja2.
+        """
+        template = get_environment(is_async=True).get_template(path)
+        rendered_content = await template.render_async(context or {})
+
+        if path.endswith(".md"):
+            return self._render_markdown(rendered_content)
+        return rendered_content
+
+    def stream(self, path: str, context: Optional[Dict[str, Any]] = None) -> Iterator[str]:
+        """
+        Rend un template morceau par morceau (`Template.generate` de Jinja2).
+
+        Le Markdown doit être converti en entier : il est rendu d'un bloc.
+        """
+        if path.endswith(".md"):
+            return iter((self.render(path, context),))
+        chunks = self.env.get_template(path).generate(context or {})
+        return (chunk for chunk in chunks if chunk)
+
+    def lazy(self, path: str, context: Optional[Dict[str, Any]] = None) -> LazyRender:
+        """Prépare le rendu d'un template sans l'exécuter (utilisé comme `children` en streaming)."""
+        return LazyRender(lambda: self.render(path, context))
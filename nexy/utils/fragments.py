@@ -0,0 +1,86 @@
+import inspect
+from functools import lru_cache
+from typing import Any, Callable, Optional, Protocol, cast
+
+from jinja2 import nodes
+from jinja2.ext import Extension
+from jinja2.parser import Parser
+from markupsafe import Markup
+
+from nexy.core.cache import DiskCache, MemoryCache, content_key
+from nexy.core.config import Config
+
+
+class FragmentStore(Protocol):
+    """Backend du tag `{% cache %}` : tout objet offrant `get` et `set` avec une durée de vie."""
+
+    def get(self, key: str) -> Optional[str]: ...
+
+    def set(self, key: str, value: str, ttl: Optional[float] = None) -> None: ...
+
+
+@lru_cache(maxsize=1)
+def get_fragment_cache() -> FragmentStore:
+    """
+    Cache des fragments du processus, choisi par `useFragmentCache` dans nexyconfig :
+    "memory" (LRU borné, par défaut), "disk" (partagé entre workers) ou un objet `FragmentStore`.
+    """
+    backend = getattr(Config(), "useFragmentCache", None) or "memory"
+    if backend == "memory":
+        return MemoryCache(maxsize=Config.FRAGMENT_CACHE_SIZE)
+    if backend == "disk":
+        return DiskCache(Config.FRAGMENT_CACHE_PATH)
+    if isinstance(backend, str):
+        raise ValueError(f"useFragmentCache: unknown backend '{backend}' (expected 'memory' or 'disk')")
+    return cast(FragmentStore, backend)
+
+
+class FragmentCacheExtension(Extension):
+    """
+    `{% cache key, ttl %}...{% endcache %}` : met en cache le HTML d'une section de template.
+
+    La clé est une expression quelconque (ex: `"sidebar", lang`) ; `ttl` est en secondes,
+    sans limite s'il est omis. Le contenu n'est rendu qu'en cas d'absence dans le cache.
+    Chaque bloc a ses propres entrées : la clé est complétée par le nom du template, la ligne
+    du tag et l'empreinte du contenu du bloc (une modification du bloc invalide ses entrées).
+    """
+
+    tags = {"cache"}
+
+    def parse(self, parser: Parser) -> nodes.Node:
+        lineno = next(parser.stream).lineno
+        args = [parser.parse_expression()]
+        if parser.stream.skip_if("comma"):
+            args.append(parser.parse_expression())
+        else:
+            args.append(nodes.Const(None))
+        body = parser.parse_statements(("name:endcache",), drop_needle=True)
+        block_id = content_key(parser.name, lineno, body)
+        call = self.call_method("_cache", [nodes.Const(block_id), *args])
+        block: nodes.Node = nodes.CallBlock(call, [], [], body).set_lineno(lineno)
+        return block
+
+    def _wrap(self, html: str) -> str:
+        return Markup(html) if self.environment.autoescape else html
+
+    def _cache(self, block_id: str, key: Any, ttl: Optional[float], caller: Callable[[], Any]) -> Any:
+        cache = get_fragment_cache()
+        cache_key = content_key("fragment", block_id, key)
+        html = cache.get(cache_key)
+        if html is not None:
+            return self._wrap(html)
+
+        rendered = caller()
+        if inspect.isawaitable(rendered):
+            # Environnement asynchrone : Jinja2 attend le résultat de l'appel
+            return self._store_async(cache, cache_key, ttl, rendered)
+        cache.set(cache_key, str(rendered), ttl=ttl)
+        return rendered
+
+    async def _store_async(self, cache: FragmentStore, cache_key: str, ttl: Optional[float], rendered: Any) -> Any:
+        html = await rendered
+        cache.set(cache_key, str(html), ttl=ttl)
+        return html
+
+
+__all__ = ["FragmentCacheExtension", "FragmentStore", "get_fragment_cache"]
@@ -0,0 +1,68 @@
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+from pymdownx.highlight import Highlight, HighlightExtension
+
+from nexy.core.cache import DiskCache, content_key
+from nexy.core.config import Config
+
+HIGHLIGHT_EXTENSION = "pymdownx.highlight"
+
+
+@lru_cache(maxsize=1)
+def get_highlight_cache() -> DiskCache:
+    """Cache des blocs de code colorés, partagé par le processus et conservé dans __nexy__/."""
+    return DiskCache(Config.HIGHLIGHT_CACHE_PATH)
+
+
+class CachedHighlight(Highlight):
+    """`Highlight` de pymdownx dont le HTML Pygments est mis en cache par (langage, code, options)."""
+
+    def _settings(self) -> Tuple[Tuple[str, str], ...]:
+        return tuple(sorted((k, repr(v)) for k, v in vars(self).items() if k != "md"))
+
+    def highlight(self, src: str, language: str, *args: Any, **kwargs: Any) -> Any:
+        inline = kwargs.get("inline", args[5] if len(args) > 5 else False)
+        html_title = self.title_mode == "html" or any(isinstance(v, dict) for v in self.auto_title_map.values())
+        if inline or html_title:
+            # Inline : élément etree ; titre HTML : stocké dans le htmlStash du document
+            return super().highlight(src, language, *args, **kwargs)
+
+        options = dict(kwargs)
+        if not (self.line_spans or self.line_anchors):
+            # Le numéro du bloc ne sert qu'aux ancres de lignes : inutile dans la clé
+            options.pop("code_block_count", None)
+        key = content_key(language, src, args, sorted(options.items()), self._settings())
+
+        cache = get_highlight_cache()
+        html = cache.get(key)
+        if html is None:
+            html = super().highlight(src, language, *args, **kwargs)
+            cache.set(key, html)
+        return html
+
+
+class CachedHighlightExtension(HighlightExtension):
+    """Extension `pymdownx.highlight` qui fournit `CachedHighlight` à superfences et inlinehilite."""
+
+    def get_pymdownx_highlighter(self) -> type:
+        return CachedHighlight
+
+
+def cached_extensions(
+    extensions: List[Any], configs: Dict[str, Dict[str, Any]] | None = None
+) -> Tuple[List[Any], Dict[str, Dict[str, Any]]]:
+    """
+    Remplace `pymdownx.highlight` par sa version avec cache dans une liste d'extensions Markdown.
+
+    Returns:
+        (extensions, extension_configs) à passer à `markdown.markdown`
+    """
+    configs = dict(configs or {})
+    if HIGHLIGHT_EXTENSION not in extensions:
+        return list(extensions), configs
+    highlight = CachedHighlightExtension(**configs.pop(HIGHLIGHT_EXTENSION, {}))
+    return [highlight if ext == HIGHLIGHT_EXTENSION else ext for ext in extensions], configs
+
+
+__all__ = ["CachedHighlight", "CachedHighlightExtension", "cached_extensions", "get_highlight_cache"]
@@ -2,32 +2,114 @@ import hashlib
 import json
 from pathlib import Path
 from html import escape as _html_escape
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 from nexy.core.config import Config
+from nexy.frontend.hydration import hydration_strategy
+from nexy.routers.context import mount_index
+from nexy.utils.mode import is_prod
+
+
+class IslandHTML:
+    """
+    Server-rendered HTML of client components, written by the SSG build to __nexy__/client/static.
+
+    In production every file is read once (at startup by AppServer) and lookups are served
+    from memory, keyed by (url, symbol). In dev the files are read on each render so a new
+    build is picked up.
+    """
+
+    ROOT = Path("__nexy__/client/static")
+    _files: Optional[Dict[str, str]] = None
+    _lookups: Dict[Tuple[str, str], str] = {}
+
+    @classmethod
+    def preload(cls) -> int:
+        """Loads every SSG file in memory; returns how many were found."""
+        files: Dict[str, str] = {}
+        if cls.ROOT.is_dir():
+            for path in cls.ROOT.rglob("*.html"):
+                files["/" + path.relative_to(cls.ROOT).as_posix()] = path.read_text(encoding="utf-8")
+        cls._files = files
+        cls._lookups = {}
+        return len(files)
+
+    @classmethod
+    def _read(cls, relative: str) -> Optional[str]:
+        if cls._files is not None:
+            return cls._files.get(relative)
+        path = cls.ROOT / relative.lstrip("/")
+        return path.read_text(encoding="utf-8") if path.is_file() else None
+
+    @classmethod
+    def get(cls, url: str, symbol: str, framework: str) -> str:
+        prod = is_prod()
+        if prod:
+            cached = cls._lookups.get((url, symbol))
+            if cached is not None:
+                return cached
+            if cls._files is None:
+                cls.preload()
+
+        clean_url = url.replace(".tsx", "")
+        default = f"{url}.html" if framework in ["vue", "svelte"] else f"{clean_url}.Default.html"
+        content = cls._read(f"{clean_url}.{symbol}.html")
+        if content is None:
+            content = cls._read(default)
+        content = content or ""
+        if prod:
+            cls._lookups[(url, symbol)] = content
+        return content
+
 
 class NCC:
     """Nexy Client Component placeholder generator."""
     
-    def __init__(self, path: str, framework: str, symbol: str) -> None:
+    def __init__(self, path: str, framework: str, symbol: str,
+                 url: Optional[str] = None, key: Optional[str] = None) -> None:
         self.path = path
         self.framework = framework.lower()
         self.symbol = symbol
+        # Resolved by the compiler in generated modules; computed here for hand-written calls
+        self.url = url or self.resolve_url(path)
+        self.key = key or self.url_key(self.url)
+        self._mount_prefix = f"nexy-{self.key[:10]}-{self.symbol}"
         self._seq = 0
 
     def generate(self, props: Dict[str, Any] , caller: callable = None) -> str:
-        self._seq += 1
         mount_id = self._generate_mount_id()
+        # <Count hydrate="visible" /> : directive for the runtime, not a prop of the component
+        hydrate = self._hydration_attrs(props.pop("hydrate", None))
         if caller:
             props["children"] = f"{caller()}"
         props_json = self._serialize_props(props)
-        url = self._resolve_path()
         
-        return self._render_tag(url, mount_id, props_json)
+        return self._render_tag(self.url, mount_id, props_json, hydrate)
+
+    def _hydration_attrs(self, directive: Optional[str]) -> str:
+        """
+        load (default), idle, visible, none, or media:<query> such as media:(max-width: 600px).
+        Static values are checked by the template parser; an unknown computed value hydrates on load.
+        """
+        if not directive:
+            return ""
+        try:
+            strategy, query = hydration_strategy(directive)
+        except ValueError:
+            return ""
+        if strategy == "load":
+            return ""
+        attrs = f'data-nexy-hydrate="{strategy}" '
+        if strategy == "media":
+            attrs += f'data-nexy-media="{_html_escape(query or "all", quote=True)}" '
+        return attrs
 
     def _generate_mount_id(self) -> str:
-        base = f"{self.path}|{self.symbol}|{self._seq}"
-        h = hashlib.md5(base.encode()).hexdigest()[:10]
-        return f"nexy-{h}"
+        """Same ids for the same page on every request: numbered per request, or per instance outside one."""
+        index = mount_index(self._mount_prefix)
+        if index is None:
+            self._seq += 1
+            index = self._seq
+        return f"{self._mount_prefix}-{index}"
 
     def _serialize_props(self, props: Dict[str, Any]) -> str:
         try:
@@ -35,9 +117,15 @@ class NCC:
         except Exception:
             return "{}"
 
-    def _resolve_path(self) -> str:
+    @staticmethod
+    def url_key(url: str) -> str:
+        """data-nexy-key: the runtimes map it back to the module URL (keys.auto.ts)."""
+        return hashlib.md5(url.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def resolve_url(path: str) -> str:
         aliases = getattr(Config, "ALIASES", {}) or {}
-        resolved = self.path
+        resolved = path
         
         for key, target in aliases.items():
             k = key.rstrip("/")
@@ -56,41 +144,28 @@ class NCC:
         
         return resolved if resolved.startswith("/") else f"/{resolved}"
 
-    def _render_tag(self, url: str, mount_id: str, props_json: str) -> str:
+    def _render_tag(self, url: str, mount_id: str, props_json: str, hydrate: str = "") -> str:
         esc_props = _html_escape(props_json, quote=True)
         esc_symbol = _html_escape(self.symbol, quote=True)
         esc_fw = _html_escape(self.framework, quote=True)
         esc_url = _html_escape(url, quote=True)
         
-        is_prod = Path("__nexy__/nexy.prod").is_file()
-        
         # Static content retrieval
         content = self._get_static_content(esc_url, esc_symbol)
-        key_hash = hashlib.md5(url.encode("utf-8")).hexdigest()
+        key_hash = self.key
 
-        path_attr = f'data-nexy-path="{esc_url}" ' if not is_prod else ""
+        path_attr = f'data-nexy-path="{esc_url}" ' if not is_prod() else ""
         
         return (
             f'<ncc id="{mount_id}" '
             f'data-nexy-fw="{esc_fw}" '
             f'{path_attr}'
             f'data-nexy-key="{key_hash}" '
+            f'{hydrate}'
             f'style="display: contents;" '
             f'data-nexy-symbol="{esc_symbol}" '
             f'data-nexy-props="{esc_props}">{content}</ncc>'
         )
 
     def _get_static_content(self, url: str, symbol: str) -> str:
-        clean_url = url.replace(".tsx", "")
-        if self.framework in ["vue", "svelte"]:
-            default_path = Path(f"__nexy__/client/static{url}.html")
-        else:
-            default_path = Path(f"__nexy__/client/static{clean_url}.Default.html")
-            
-        export_path = Path(f"__nexy__/client/static{clean_url}.{symbol}.html")
-
-        if export_path.is_file():
-            return export_path.read_text(encoding="utf-8")
-        if default_path.is_file():
-            return default_path.read_text(encoding="utf-8")
-        return ""
\ No newline at end of file
+        return IslandHTML.get(url, symbol, self.framework)
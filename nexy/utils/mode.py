@@ -0,0 +1,17 @@
+from functools import lru_cache
+from pathlib import Path
+
+from nexy.core.config import Config
+
+
+@lru_cache(maxsize=1)
+def is_prod() -> bool:
+    """Indique si le processus tourne en production (`nexy build` a écrit nexy.prod).
+
+    Le mode est décidé une seule fois par processus : `nexy dev` supprime le
+    marqueur avant de lancer Uvicorn et `nexy build` le crée.
+    """
+    return Path(Config.PROD_FLAG).is_file()
+
+
+__all__ = ["is_prod"]
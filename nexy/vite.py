@@ -1,11 +1,78 @@
 import os
 import json
 from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
 from nexy.core.config import Config
+from nexy.routers.context import current_request
+from nexy.utils.mode import is_prod
 from nexy.utils.ports import get_client_port
 
+MANIFEST_PATH = "__nexy__/client/.vite/manifest.json"
+# Fichiers dont dépendent les balises : surveillés en dev uniquement
+WATCHED_FILES = (
+    "vite.config.ts", MANIFEST_PATH, Config.ISLANDS_MANIFEST_PATH, Config.PROD_FLAG,
+    "__nexy__/client.port", "__nexy__/vite.port",
+)
+
+# Route -> (empreinte, balises) : calculé une fois par route et par processus en production
+_tags: Dict[Optional[str], Tuple[Any, str]] = {}
+
+
+def _stamp() -> Tuple[Any, ...]:
+    """mtime des fichiers surveillés et NEXY_INLINE_CLIENT : change dès qu'ils changent."""
+    stamps: list[Any] = [os.getenv("NEXY_INLINE_CLIENT", "")]
+    for path in WATCHED_FILES:
+        try:
+            stamps.append(os.stat(path).st_mtime_ns)
+        except OSError:
+            stamps.append(None)
+    return tuple(stamps)
+
+
+def _current_route() -> Optional[str]:
+    """Chemin de la route servie (/blog/{slug}), tel que FBRouter l'a enregistré."""
+    request = current_request.get()
+    route = request.scope.get("route") if request is not None else None
+    return getattr(route, "path", None)
+
 
 def Vite() -> str:
+    """Balises du client Vite, servies depuis la mémoire ; en dev, recalculées quand un fichier surveillé change."""
+    route = _current_route()
+    stamp = None if is_prod() else _stamp()
+    cached = _tags.get(route)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+    tags = _render_tags(route)
+    _tags[route] = (stamp, tags)
+    return tags
+
+
+def _route_bundle(data: Dict[str, Any], route: Optional[str]) -> Optional[Tuple[List[str], List[str]]]:
+    """
+    (CSS, JS) de la route d'après le manifeste des îlots : les styles globaux, puis l'entrée
+    de la route s'il y en a une. None si la route est inconnue (l'entrée main est alors servie).
+    """
+    try:
+        islands = json.loads(Path(Config.ISLANDS_MANIFEST_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    meta = islands.get("routes", {}).get(route)
+    if meta is None:
+        return None
+    css_files: List[str] = []
+    js_files: List[str] = []
+    styles = data.get(islands.get("styles") or "")
+    if styles:
+        css_files.append(styles["file"])
+    entry = data.get(meta.get("entry") or "")
+    if entry:
+        css_files.extend(entry.get("css") or [])
+        js_files.append(entry["file"])
+    return css_files, js_files
+
+
+def _render_tags(route: Optional[str] = None) -> str:
     # 1. Vérification config
     config = Config()
     if not os.path.exists("vite.config.ts"):
@@ -14,16 +81,19 @@ def Vite() -> str:
     if not getattr(config, "useVite", False):
         return "" # Pas de Vite si désactivé
 
-    manifest_path = Path("__nexy__/client/.vite/manifest.json")
-    prod_server = Path("__nexy__/nexy.prod")
+    manifest_path = Path(MANIFEST_PATH)
+    prod_server = Path(Config.PROD_FLAG)
     prod_mode = manifest_path.is_file() and prod_server.is_file()
     if prod_mode:
         try:
             data = json.loads(manifest_path.read_text(encoding="utf-8"))
-            entry = data.get("__nexy__/main.ts") or data.get("/__nexy__/main.ts")
-            if entry and "file" in entry:
-                file_rel = entry["file"].lstrip("/")
-                css_files = entry.get("css") or []
+            bundle = _route_bundle(data, route)
+            if bundle is None:
+                entry = data.get("__nexy__/main.ts") or data.get("/__nexy__/main.ts")
+                if entry and "file" in entry:
+                    bundle = entry.get("css") or [], [entry["file"]]
+            if bundle is not None:
+                css_files, js_files = bundle
                 inline = os.getenv("NEXY_INLINE_CLIENT", "").strip() in ("1", "true", "TRUE")
                 if inline:
                     # Inline CSS and JS content to avoid extra HTTP requests
@@ -32,18 +102,21 @@ def Vite() -> str:
                         p = Path("__nexy__/client").joinpath(c.lstrip("/"))
                         if p.is_file():
                             css_blocks.append(f"<style>{p.read_text(encoding='utf-8')}</style>")
-                    js_path = Path("__nexy__/client").joinpath(file_rel)
-                    js_code = js_path.read_text(encoding="utf-8") if js_path.is_file() else ""
-                    return "".join(css_blocks) + f'<script type="module">\n{js_code}\n</script>'
+                    js_blocks = []
+                    for file_rel in js_files:
+                        js_path = Path("__nexy__/client").joinpath(file_rel.lstrip("/"))
+                        js_code = js_path.read_text(encoding="utf-8") if js_path.is_file() else ""
+                        js_blocks.append(f'<script type="module">\n{js_code}\n</script>')
+                    return "".join(css_blocks) + "".join(js_blocks)
                 else:
                     # src = f"/__nexy__/client/{file_rel}"
-                    src = f"/{file_rel}"
                     css_links = "".join(
                         f"<link rel=\"stylesheet\" href=\"/{c.lstrip('/')}\" />"
                         # f"<link rel=\"stylesheet\" href=\"/__nexy__/client/{c.lstrip('/')}\" />"
                         for c in css_files
                     )
-                    return f'{css_links}<script type="module" src="{src}"></script>'
+                    scripts = "".join(f'<script type="module" src="/{f.lstrip("/")}"></script>' for f in js_files)
+                    return f'{css_links}{scripts}'
         except Exception:
             pass
     if prod_server.is_file() is True and manifest_path.is_file() is False:
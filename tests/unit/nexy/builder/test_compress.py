@@ -0,0 +1,28 @@
+import gzip
+
+from nexy.builder.compress import AssetCompressor
+
+CSS = ".badge { color: red; }\n" * 200
+
+
+class TestAssetCompressor:
+    def test_writes_gzip_siblings_for_compressible_assets(self, tmp_path):
+        (tmp_path / "app.css").write_text(CSS)
+        (tmp_path / "logo.png").write_bytes(b"\x89PNG" * 500)
+        (tmp_path / "small.js").write_text("let a = 1")
+
+        written = AssetCompressor().compress([str(tmp_path), str(tmp_path / "missing")])
+
+        assert tmp_path / "app.css.gz" in written
+        assert gzip.decompress((tmp_path / "app.css.gz").read_bytes()).decode() == CSS
+        assert not (tmp_path / "logo.png.gz").exists()
+        assert not (tmp_path / "small.js.gz").exists()
+
+    def test_up_to_date_variants_are_kept(self, tmp_path):
+        (tmp_path / "app.css").write_text(CSS)
+        AssetCompressor().compress([str(tmp_path)])
+        variant = tmp_path / "app.css.gz"
+        mtime = variant.stat().st_mtime_ns
+
+        AssetCompressor().compress([str(tmp_path)])
+        assert variant.stat().st_mtime_ns == mtime
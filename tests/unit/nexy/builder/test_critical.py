@@ -0,0 +1,39 @@
+from nexy.builder.critical import CriticalCSS
+from nexy.core.assets import StyleAssets
+
+HTML = '<html><head></head><body><main id="app"><p class="card is-active">x</p></main></body></html>'
+
+
+class TestCriticalExtraction:
+    def test_keeps_only_rules_used_by_the_page(self):
+        css = ".card{color:red}.missing{color:blue}#app > p{margin:0}#other{margin:1px}h1{font-size:2em}"
+        assert CriticalCSS.extract(HTML, css) == ".card{color:red}#app > p{margin:0}"
+
+    def test_selector_lists_pseudo_classes_and_media_queries(self):
+        css = (
+            "/* note */.x, .card:hover{opacity:1}"
+            "@media (max-width: 600px){.card.is-active::before{content:''}.x{top:0}}"
+            "@media print{.x{top:0}}"
+        )
+        assert CriticalCSS.extract(HTML, css) == (
+            ".x, .card:hover{opacity:1}@media (max-width: 600px){.card.is-active::before{content:''}}"
+        )
+
+    def test_keeps_font_faces_and_used_keyframes(self):
+        css = "@font-face{font-family:A}@keyframes spin{to{opacity:0}}@keyframes fade{to{opacity:1}}.card{animation:spin 1s}"
+        assert CriticalCSS.extract(HTML, css) == "@font-face{font-family:A}.card{animation:spin 1s}@keyframes spin{to{opacity:0}}"
+
+    def test_stylesheets_of_a_page(self):
+        html = '<link rel="stylesheet" href="/assets/main.css" /><link rel="icon" href="/x.ico"><link rel="stylesheet" href="/assets/main.css">'
+        assert CriticalCSS.stylesheets(html) == ["/assets/main.css"]
+
+
+class TestCriticalInlining:
+    def test_critical_css_is_inlined_and_stylesheets_deferred(self):
+        html = '<html><head><link rel="stylesheet" href="/assets/main.css" /></head><body></body></html>'
+        entry = {"css": ".card{color:red}", "stylesheets": ["/assets/main.css"]}
+        rendered = StyleAssets._critical(html, entry)
+        assert '<style data-nexy-critical>.card{color:red}</style></head>' in rendered
+        assert '<link rel="preload" href="/assets/main.css" as="style"' in rendered
+        assert '<noscript><link rel="stylesheet" href="/assets/main.css"></noscript>' in rendered
+        assert '<link rel="stylesheet" href="/assets/main.css" />' not in rendered
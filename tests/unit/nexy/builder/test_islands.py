@@ -0,0 +1,47 @@
+import json
+
+import pytest
+
+from nexy.builder.islands import IslandManifest
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    files = {
+        "src/components/count.tsx": "export const Count = () => null\n",
+        "src/components/panel.nexy": '---\nfrom "src/components/count.tsx" import Count\n---\n<div>{{ Count() }}</div>\n',
+        "src/routes/layout.nexy": "---\nchildren:prop[str]\n---\n<main>{{ children | safe }}</main>\n",
+        "src/routes/index.nexy": '---\nfrom "src/components/panel.nexy" import Panel\n---\n<Panel />\n',
+        "src/routes/about.nexy": "<p>About</p>\n",
+        "src/globale.css": "body{margin:0}\n",
+        "__nexy__/src/react.nexy.ts": "export default () => {}\n",
+    }
+    for name, content in files.items():
+        (tmp_path / name).parent.mkdir(parents=True, exist_ok=True)
+        (tmp_path / name).write_text(content, encoding="utf-8")
+    return tmp_path
+
+
+class TestIslandManifest:
+    def test_only_pages_with_islands_get_an_entry(self, project):
+        manifest = IslandManifest().build()
+
+        assert manifest["styles"] == "src/globale.css"
+        assert manifest["routes"]["/about"]["entry"] is None
+        home = manifest["routes"]["/"]
+        # Found through the Nexy component the page renders
+        assert home["islands"] == ["src/components/count.tsx"]
+        assert list(manifest["entries"].values()) == [home["entry"]]
+        assert json.loads((project / "__nexy__/islands.json").read_text(encoding="utf-8")) == manifest
+
+        entry = (project / home["entry"]).read_text(encoding="utf-8")
+        assert "import init_react from '@nexy/react.nexy.ts';" in entry
+        assert '"/src/components/count.tsx": () => import("/src/components/count.tsx"),' in entry
+        assert entry.index("register({") < entry.index("init_react();")
+        assert (project / "__nexy__/src/islands.ts").is_file()
+
+    def test_entry_names_are_unique(self):
+        assert IslandManifest.entry_name("/") == "index-42099b4a"
+        assert IslandManifest.entry_name("/a-b").startswith("a_b-")
+        assert IslandManifest.entry_name("/a-b") != IslandManifest.entry_name("/a_b")
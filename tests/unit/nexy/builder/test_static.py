@@ -0,0 +1,109 @@
+import asyncio
+from types import SimpleNamespace
+
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+import nexy.routers.app as app_module
+from nexy.builder.static import StaticExporter, fetch
+from nexy.core.config import Config
+from nexy.routers.app import AppServer
+from nexy.routers.fbrouter.cache import CachePolicy
+from nexy.routers.fbrouter.response import RouteResponse
+from nexy.utils.mode import is_prod
+
+
+def Page() -> str:
+    return "<p>static</p>"
+
+
+def Post(slug: str) -> str:
+    return f"<p>{slug}</p>"
+
+
+def make_server() -> AppServer:
+    router = APIRouter()
+    page = RouteResponse.cache_control(Page, CachePolicy(60, vary="Cookie"))
+    router.get("/page", response_class=HTMLResponse)(page)
+    router.get("/blog/{slug}", response_class=HTMLResponse)(Post)
+    return AppServer(SimpleNamespace(nexy_config=SimpleNamespace(useDocs=False, useRouter=router)))
+
+
+class TestStaticExporter:
+    def test_dynamic_pathnames_are_filled(self):
+        filled = StaticExporter._fill("/blog/{slug}", {"slug": "hello world"})
+        assert filled == "/blog/hello%20world"
+        assert StaticExporter._fill("/docs/{path:path}", {"path": "a/b"}) == "/docs/a/b"
+
+    def test_revalidated_pages_are_listed_on_demand(self, monkeypatch):
+        import nexy.routers.fbrouter as fbrouter
+
+        modules_meta = [
+            {"type": "component", "pathname": "/", "source": "index.nexy",
+             "module": SimpleNamespace()},
+            {"type": "component", "pathname": "/feed", "source": "feed.nexy",
+             "module": SimpleNamespace(revalidate=60)},
+        ]
+        router = SimpleNamespace(modules_meta=modules_meta)
+        monkeypatch.setattr(fbrouter, "FBRouter", lambda: router)
+        # ISR pages stay rendered by the server, but critical CSS is extracted for them too
+        assert list(StaticExporter().pages()) == [("index.nexy", "/")]
+        revalidated = [("index.nexy", "/"), ("feed.nexy", "/feed")]
+        assert list(StaticExporter().pages(revalidated=True)) == revalidated
+
+    def test_urls_map_to_index_files(self):
+        assert StaticExporter.file_for("/") == "index.html"
+        assert StaticExporter.file_for("/blog/hello") == "blog/hello/index.html"
+
+    def test_pages_are_rendered_in_process(self):
+        app = FastAPI()
+
+        @app.get("/page", response_class=HTMLResponse)
+        def page() -> str:
+            return "<p>static</p>"
+
+        status, headers, body = asyncio.run(fetch(app, "/page"))
+        assert status == 200
+        assert headers["content-type"].startswith("text/html")
+        assert body == b"<p>static</p>"
+
+    def test_manifest_is_loaded(self, tmp_path):
+        manifest = '{"/": {"file": "index.html", "headers": {"vary": "Cookie"}}}'
+        (tmp_path / "manifest.json").write_text(manifest)
+        expected = {"/": (tmp_path / "index.html", {"vary": "Cookie"})}
+        assert StaticExporter.load(str(tmp_path)) == expected
+
+    @staticmethod
+    def serve(tmp_path, monkeypatch, urls) -> TestClient:
+        """Exports `urls`, then serves the export like a production AppServer."""
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(StaticExporter, "urls", lambda _self: urls)
+        monkeypatch.setattr(app_module, "AppServer", make_server)
+        StaticExporter().export()
+        (tmp_path / Config.PROD_FLAG).write_text("", encoding="utf-8")
+        is_prod.cache_clear()
+        try:
+            return TestClient(make_server().run())
+        finally:
+            is_prod.cache_clear()
+
+    def test_exported_pages_keep_their_cache_policy(self, tmp_path, monkeypatch):
+        response = self.serve(tmp_path, monkeypatch, ["/page"]).get("/page")
+        headers = {"cache-control": "public, max-age=60", "vary": "Cookie"}
+        assert StaticExporter.load()["/page"][1] == headers
+        # Served from the exported file, with the headers of the rendered route
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.text == "<p>static</p>"
+        assert response.headers["cache-control"] == "public, max-age=60"
+        assert response.headers["vary"] == "Cookie, Accept-Encoding"
+
+    def test_encoded_params_are_served_from_disk(self, tmp_path, monkeypatch):
+        urls = [StaticExporter._fill("/blog/{slug}", {"slug": slug}) for slug in ("b c", "café")]
+        client = self.serve(tmp_path, monkeypatch, urls)
+        assert StaticExporter.load().keys() == {"/blog/b c", "/blog/café"}
+        for url, slug in zip(urls, ("b c", "café"), strict=True):
+            response = client.get(url)
+            assert response.headers["accept-ranges"] == "bytes"
+            # Rendered at export with the decoded param
+            assert response.text == f"<p>{slug}</p>"
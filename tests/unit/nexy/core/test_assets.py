@@ -0,0 +1,50 @@
+from nexy.core.assets import StyleAssets
+
+LINK = '<link rel="stylesheet" href="/assets/{}" data-nexy-style>'
+
+
+class TestStyleAssets:
+    def test_publish_writes_a_content_hashed_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "badge.css").write_text(".badge{color:red}")
+
+        href = StyleAssets.publish("badge.css", target="assets")
+        assert href.startswith("/assets/badge-") and href.endswith(".css")
+        assert (tmp_path / "assets" / href.rsplit("/", 1)[1]).read_text() == ".badge{color:red}"
+
+        (tmp_path / "badge.css").write_text(".badge{color:blue}")
+        assert StyleAssets.publish("badge.css", target="assets") != href
+        assert StyleAssets.publish("missing.css", target="assets") is None
+
+    def test_republishing_an_edited_sheet_removes_the_previous_file(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(StyleAssets, "published", {})
+        (tmp_path / "badge.css").write_text(".badge{color:red}")
+        old = StyleAssets.publish("badge.css", target="assets").rsplit("/", 1)[1]
+        (tmp_path / "assets" / f"{old}.gz").write_bytes(b"")
+
+        (tmp_path / "badge.css").write_text(".badge{color:blue}")
+        new = StyleAssets.publish("badge.css", target="assets").rsplit("/", 1)[1]
+        assert sorted(p.name for p in (tmp_path / "assets").iterdir()) == [new]
+
+    def test_app_does_not_create_the_assets_directory(self, tmp_path, monkeypatch):
+        from nexy.core.config import Config
+        from nexy.routers.app import AppServer
+
+        monkeypatch.chdir(tmp_path)
+        AppServer().run()
+        assert not (tmp_path / Config.STYLE_ASSETS_PATH).exists()
+
+    def test_page_carries_each_stylesheet_once_in_head(self):
+        badge, card = LINK.format("badge-1.css"), LINK.format("card-2.css")
+        html = f"<html><head><title>x</title></head><body>{badge}{card}{badge}{badge}</body></html>"
+        assert StyleAssets.hoist(html) == f"<html><head><title>x</title>{badge}{card}</head><body></body></html>"
+
+    def test_fragment_without_head_keeps_first_position(self):
+        badge = LINK.format("badge-1.css")
+        assert StyleAssets.hoist(f"<p>a</p>{badge}<p>b</p>{badge}") == f"<p>a</p>{badge}<p>b</p>"
+
+    def test_streamed_pages_drop_repeated_links(self):
+        badge = LINK.format("badge-1.css")
+        chunks = ["<head></head>", f"<p>a</p>{badge}", f"<p>b</p>{badge}"]
+        assert list(StyleAssets.hoist(iter(chunks))) == ["<head></head>", f"<p>a</p>{badge}", "<p>b</p>"]
@@ -0,0 +1,35 @@
+import time
+
+from nexy.core.cache import DiskCache, MemoryCache, content_key
+
+
+class TestMemoryCache:
+    def test_evicts_least_recently_used(self):
+        cache = MemoryCache(maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+
+    def test_entries_expire(self, monkeypatch):
+        cache = MemoryCache(ttl=10)
+        cache.set("a", 1)
+        now = time.monotonic()
+        monkeypatch.setattr(time, "monotonic", lambda: now + 11)
+        assert cache.get("a") is None
+
+
+class TestDiskCache:
+    def test_values_survive_a_new_instance(self, tmp_path):
+        key = content_key("python", "print('hi')")
+        DiskCache(str(tmp_path)).set(key, "<pre>hi</pre>")
+        assert DiskCache(str(tmp_path)).get(key) == "<pre>hi</pre>"
+        assert DiskCache(str(tmp_path)).get(content_key("python", "print('ho')")) is None
+
+    def test_expired_values_are_ignored(self, tmp_path, monkeypatch):
+        DiskCache(str(tmp_path)).set("a", "<p>a</p>", ttl=10)
+        now = time.time()
+        monkeypatch.setattr(time, "time", lambda: now + 11)
+        assert DiskCache(str(tmp_path)).get("a") is None
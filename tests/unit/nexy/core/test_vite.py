@@ -0,0 +1,99 @@
+import json
+import os
+
+import pytest
+
+import nexy.vite as vite
+from nexy.core.config import Config
+from nexy.utils.mode import is_prod
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Config, "useVite", True, raising=False)
+    monkeypatch.setattr(vite, "_tags", {})
+    (tmp_path / "vite.config.ts").write_text("export default {}", encoding="utf-8")
+    is_prod.cache_clear()
+    yield tmp_path
+    is_prod.cache_clear()
+
+
+def write_build(root, js="assets/main-1.js", **chunks):
+    manifest = root / "__nexy__/client/.vite/manifest.json"
+    manifest.parent.mkdir(parents=True, exist_ok=True)
+    data = {"__nexy__/main.ts": {"file": js, "css": ["assets/main-1.css"]}, **chunks}
+    manifest.write_text(json.dumps(data), encoding="utf-8")
+    (root / Config.PROD_FLAG).write_text("", encoding="utf-8")
+    return manifest
+
+
+def count_renders(monkeypatch):
+    calls = []
+    render = vite._render_tags
+    monkeypatch.setattr(vite, "_render_tags", lambda route=None: calls.append(1) or render(route))
+    return calls
+
+
+class TestViteTags:
+    def test_production_tags_are_built_once(self, project, monkeypatch):
+        manifest = write_build(project)
+        calls = count_renders(monkeypatch)
+
+        tags = vite.Vite()
+        assert '<script type="module" src="/assets/main-1.js"></script>' in tags
+        assert '<link rel="stylesheet" href="/assets/main-1.css" />' in tags
+
+        manifest.unlink()
+        assert vite.Vite() == tags
+        assert len(calls) == 1
+
+    def test_dev_tags_follow_file_changes(self, project, monkeypatch):
+        calls = count_renders(monkeypatch)
+        port_file = project / "__nexy__/client.port"
+        port_file.parent.mkdir()
+        port_file.write_text("5180", encoding="utf-8")
+
+        assert ":5180" in vite.Vite()
+        assert ":5180" in vite.Vite()
+        assert len(calls) == 1
+
+        port_file.write_text("5190", encoding="utf-8")
+        stat = port_file.stat()
+        os.utime(port_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+        assert ":5190" in vite.Vite()
+        assert len(calls) == 2
+
+    def test_routes_only_load_their_islands(self, project, monkeypatch):
+        write_build(
+            project,
+            **{
+                "src/globale.css": {"file": "assets/styles-1.css"},
+                "__nexy__/src/entries/index-1.ts": {"file": "assets/index-1.js", "css": ["assets/index-1.css"]},
+            },
+        )
+        (project / Config.ISLANDS_MANIFEST_PATH).write_text(json.dumps({
+            "styles": "src/globale.css",
+            "entries": {"index-1": "__nexy__/src/entries/index-1.ts"},
+            "routes": {
+                "/": {"entry": "__nexy__/src/entries/index-1.ts"},
+                "/about": {"entry": None},
+            },
+        }), encoding="utf-8")
+        route = {}
+        monkeypatch.setattr(vite, "_current_route", lambda: route.get("path"))
+
+        route["path"] = "/"
+        home = vite.Vite()
+        assert home == (
+            '<link rel="stylesheet" href="/assets/styles-1.css" />'
+            '<link rel="stylesheet" href="/assets/index-1.css" />'
+            '<script type="module" src="/assets/index-1.js"></script>'
+        )
+        route["path"] = "/about"
+        assert vite.Vite() == '<link rel="stylesheet" href="/assets/styles-1.css" />'
+        # Routes outside the manifest keep the main entry
+        route["path"] = "/api/page"
+        assert 'src="/assets/main-1.js"' in vite.Vite()
+        route["path"] = "/"
+        assert vite.Vite() == home
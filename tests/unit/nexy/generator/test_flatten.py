@@ -0,0 +1,39 @@
+from jinja2 import Environment
+
+from nexy.compiler.generator.flatten import LayoutFlattener
+from nexy.compiler.generator.graph import ComponentGraph
+
+NSLOT = "<nslot  style='display:contents;'>"
+
+
+def write(path, content):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content, encoding="utf-8")
+
+
+class TestLayoutFlattener:
+    def test_nested_layouts_render_like_runtime_calls(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        write(tmp_path / "src/routes/layout.nexy", '---\nchildren:prop[str] = ""\nsite = "Demo"\n---\n<main>{{ site }}{{ children | safe }}</main>\n')
+        write(tmp_path / "src/routes/blog/layout.nexy", '---\nchildren:prop[str] = ""\nsection = "Blog"\n---\n<section>{{ section }}{{ children|safe }}{{ site }}</section>\n')
+        write(tmp_path / "src/routes/blog/index.nexy", '---\nname = "post"\n---\n<p>{{ name }}{{ section }}</p>\n')
+
+        graph = ComponentGraph()
+        template, chain = LayoutFlattener(graph).flatten("src/routes/blog/index.nexy", graph.parse("src/routes/blog/index.nexy"))
+
+        assert [p.parent.name for p in chain] == ["routes", "blog"]
+        rendered = Environment().from_string(template).render(
+            __page={"name": "post"}, __l0={"site": "Demo"}, __l1={"section": "Blog"}, __s1="<style></style>"
+        )
+        # Each level only sees its own variables, exactly like separate renders
+        page = "<p>post</p>"
+        blog = f"<section>Blog{NSLOT}{page}</nslot></section><style></style>"
+        assert rendered == f"<main>Demo{NSLOT}{blog}</nslot></main>"
+
+    def test_layout_using_children_elsewhere_is_not_flattened(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        write(tmp_path / "src/routes/layout.nexy", '---\nchildren:prop[str] = ""\n---\n{% if children %}{{ children | safe }}{% endif %}\n')
+        write(tmp_path / "src/routes/index.nexy", "---\n---\n<p>home</p>\n")
+
+        graph = ComponentGraph()
+        assert LayoutFlattener(graph).flatten("src/routes/index.nexy", graph.parse("src/routes/index.nexy")) is None
@@ -0,0 +1,75 @@
+import pytest
+
+from nexy.compiler import Compiler
+from nexy.core.config import Config
+from nexy.utils.mode import is_prod
+
+FOOTER = "<footer>\n    <p>Static</p>\n</footer>\n"
+PAGE = '---\nfrom "src/components/footer.nexy" import Footer\n---\n<main>\n    <Footer />\n</main>\n'
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / "components").mkdir(parents=True)
+    (tmp_path / "src" / "routes").mkdir(parents=True)
+    is_prod.cache_clear()
+    yield tmp_path
+    is_prod.cache_clear()
+
+
+def write(root, path: str, content: str) -> None:
+    (root / path).write_text(content, encoding="utf-8")
+
+
+def compile_source(root, path: str) -> str:
+    compiler = Compiler()
+    compiler.compile(path)
+    return (root / compiler.output.replace(".html", ".py")).read_text(encoding="utf-8")
+
+
+class TestStaticHoisting:
+    def test_static_component_returns_a_constant(self, project):
+        write(project, "src/components/footer.nexy", FOOTER)
+        module = compile_source(project, "src/components/footer.nexy")
+        assert "__STATIC = '<footer>\\n    <p>Static</p>\\n</footer>'" in module
+        assert "return __STATIC" in module
+        assert "__Template().render" not in module
+
+    def test_component_with_props_is_not_hoisted(self, project):
+        write(project, "src/components/badge.nexy", '---\nlabel:prop[str] = "ok"\n---\n<span>ok</span>\n')
+        module = compile_source(project, "src/components/badge.nexy")
+        assert "__STATIC" not in module
+
+    def test_component_with_expressions_is_not_hoisted(self, project):
+        write(project, "src/components/year.nexy", "<p>{{ 2024 }}</p>\n")
+        assert "__STATIC" not in compile_source(project, "src/components/year.nexy")
+
+    def test_parent_inlines_static_child_in_production(self, project):
+        (project / Config.PROD_FLAG).parent.mkdir(parents=True, exist_ok=True)
+        (project / Config.PROD_FLAG).write_text("")
+        write(project, "src/components/footer.nexy", FOOTER)
+        write(project, "src/routes/index.nexy", PAGE)
+        compile_source(project, "src/routes/index.nexy")
+        template = (project / "__nexy__/src/routes/index.html").read_text(encoding="utf-8")
+        assert "Footer()" not in template
+        assert "<p>Static</p>" in template
+
+    def test_parent_keeps_the_call_in_development(self, project):
+        write(project, "src/components/footer.nexy", FOOTER)
+        write(project, "src/routes/index.nexy", PAGE)
+        compile_source(project, "src/routes/index.nexy")
+        template = (project / "__nexy__/src/routes/index.html").read_text(encoding="utf-8")
+        assert "{{ Footer() }}" in template
+
+    def test_flattened_layouts_inline_static_children(self, project):
+        (project / Config.PROD_FLAG).parent.mkdir(parents=True, exist_ok=True)
+        (project / Config.PROD_FLAG).write_text("")
+        write(project, "src/components/footer.nexy", FOOTER)
+        layout = '---\nfrom "src/components/footer.nexy" import Footer\nchildren:prop[str] = ""\n---\n'
+        write(project, "src/routes/layout.nexy", layout + "<body>{{ children | safe }}<Footer /></body>\n")
+        write(project, "src/routes/index.nexy", PAGE)
+        compile_source(project, "src/routes/index.nexy")
+        flat = (project / "__nexy__/src/routes/index.flat.html").read_text(encoding="utf-8")
+        assert "Footer()" not in flat
+        assert flat.count("<p>Static</p>") == 2
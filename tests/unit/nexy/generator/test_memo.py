@@ -0,0 +1,30 @@
+import pytest
+
+from nexy.compiler import Compiler
+
+
+@pytest.fixture
+def project(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "src" / "components").mkdir(parents=True)
+    (tmp_path / "src" / "components" / "count.tsx").write_text("export const Count = () => null\n", encoding="utf-8")
+    return tmp_path
+
+
+def compile_source(root, path: str, content: str) -> str:
+    (root / path).write_text(content, encoding="utf-8")
+    compiler = Compiler()
+    compiler.compile(path)
+    return (root / compiler.output.replace(".html", ".py")).read_text(encoding="utf-8")
+
+
+class TestMemoOption:
+    def test_component_is_memoized(self, project):
+        module = compile_source(project, "src/components/badge.nexy", "---\nmemo = True\n---\n<span>ok</span>\n")
+        assert "@__memo" in module
+
+    def test_component_rendering_an_island_is_not_memoized(self, project):
+        # Each render of the island needs its own mount id
+        source = '---\nmemo = True\nfrom "src/components/count.tsx" import Count\n---\n<div><Count /></div>\n'
+        module = compile_source(project, "src/components/panel.nexy", source)
+        assert "__memo" not in module
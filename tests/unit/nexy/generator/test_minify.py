@@ -0,0 +1,27 @@
+from nexy.compiler.generator.minify import HTMLMinifier
+
+
+class TestHTMLMinifier:
+    def test_whitespace_between_blocks_is_removed(self):
+        template = "<div>\n    <ul>\n        <li>a</li>\n        <li>b</li>\n    </ul>\n</div>\n"
+        assert HTMLMinifier.minify(template) == "<div><ul><li>a</li><li>b</li></ul></div>"
+
+    def test_inline_whitespace_collapses_to_one_space(self):
+        assert HTMLMinifier.minify("<p>\n  Hello   <b>Nexy</b>\n  <i>!</i>\n</p>") == "<p>Hello <b>Nexy</b> <i>!</i></p>"
+
+    def test_preformatted_and_scripts_are_untouched(self):
+        template = "<div>\n  <pre>  a\n    b</pre>\n  <textarea>\n x </textarea>\n  <script>\n  let a  =  1\n</script>\n</div>"
+        assert HTMLMinifier.minify(template) == (
+            "<div><pre>  a\n    b</pre><textarea>\n x </textarea><script>\n  let a  =  1\n</script></div>"
+        )
+
+    def test_jinja_tags_are_untouched(self):
+        template = "<ul>\n  {% for item in items %}\n    <li>{{ item  }}  {{ 'a  b' }}</li>\n  {% endfor %}\n</ul>"
+        assert HTMLMinifier.minify(template) == "<ul>{% for item in items %}<li>{{ item  }} {{ 'a  b' }}</li>{% endfor %}</ul>"
+
+    def test_statements_between_inline_elements_keep_spacing(self):
+        template = "<span>a</span>\n{% if b %}\n<span>b</span>\n{% endif %}"
+        assert HTMLMinifier.minify(template) == "<span>a</span> {% if b %} <span>b</span>{% endif %}"
+
+    def test_comments_are_dropped(self):
+        assert HTMLMinifier.minify("<div>\n<!-- note -->\n<p>x</p></div>") == "<div><p>x</p></div>"
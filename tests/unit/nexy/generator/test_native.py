@@ -0,0 +1,45 @@
+from jinja2 import Environment
+from markupsafe import escape
+
+from nexy.compiler.generator.native import NativeCompiler
+from nexy.template import native_getattr, native_getitem
+
+
+def render_native(template: str, **context) -> str:
+    code = NativeCompiler(context).compile(template)
+    assert code is not None
+    namespace = {"__attr": native_getattr, "__item": native_getitem, "__escape": escape, **context}
+    exec(code, namespace)
+    return namespace["__render"]()
+
+
+def render_jinja(template: str, **context) -> str:
+    return Environment().from_string(template).render(context)
+
+
+class TestNativeCompiler:
+    def test_matches_jinja_output(self):
+        template = (
+            "<ul>{% for item in items %}<li>{{ item.name }}</li>{% endfor %}</ul>\n"
+            "{% if user %}<p>{{ user['name'] }}</p>{% elif guest %}guest{% else %}none{% endif %}\n"
+        )
+        context = {"items": [{"name": "a"}, {"name": "b"}], "user": {"name": "<b>"}, "guest": False}
+        assert render_native(template, **context) == render_jinja(template, **context)
+
+    def test_escape_filter_and_call_block(self):
+        def Card(title, caller=None):
+            return f"<div>{title}:{caller()}</div>"
+
+        template = "{% call Card(title=name|e) %}<span>{{ name|e }}</span>{% endcall %}"
+        assert NativeCompiler({"Card", "name"}).compile(template) is None
+
+        template = "{% call Card(title='x') %}<span>{{ name|e }}</span>{% endcall %}"
+        assert render_native(template, Card=Card, name="<i>") == "<div>x:<span>&lt;i&gt;</span></div>"
+
+    def test_unsupported_syntax_falls_back(self):
+        compiler = NativeCompiler({"name", "items"})
+        assert compiler.compile("{{ name | upper }}") is None
+        assert compiler.compile("{{ unknown }}") is None
+        assert compiler.compile("{{ 'a' ~ name }}") is None
+        assert compiler.compile("{% for item in items %}{{ loop.index }}{% endfor %}") is None
+        assert compiler.compile("{% set x = 1 %}") is None
@@ -0,0 +1,24 @@
+from nexy.compiler import Compiler
+
+
+def compile_mdx(tmp_path, monkeypatch, content: str) -> str:
+    monkeypatch.chdir(tmp_path)
+    source = tmp_path / "src" / "routes" / "guide.mdx"
+    source.parent.mkdir(parents=True)
+    source.write_text(content, encoding="utf-8")
+
+    compiler = Compiler()
+    compiler.compile("src/routes/guide.mdx")
+    return (tmp_path / compiler.output.replace(".md", ".py")).read_text(encoding="utf-8")
+
+
+class TestStaticMarkdown:
+    def test_static_mdx_is_rendered_at_build_time(self, tmp_path, monkeypatch):
+        module = compile_mdx(tmp_path, monkeypatch, "# Docs\n\nSome *text*.\n")
+        assert "__PRERENDERED = '<h1 id=\"docs\">Docs</h1>\\n<p>Some <em>text</em>.</p>'" in module
+        assert "__Template().render" not in module
+
+    def test_dynamic_mdx_renders_at_request_time(self, tmp_path, monkeypatch):
+        module = compile_mdx(tmp_path, monkeypatch, "---\nname = 'Nexy'\n---\n# {{ name }}\n")
+        assert "__PRERENDERED" not in module
+        assert '__Template().render("__nexy__/src/routes/guide.md", context)' in module
@@ -0,0 +1,126 @@
+import hashlib
+
+import pytest
+from starlette.requests import Request
+
+from nexy._import import Import
+from nexy.compiler.parser import Parser
+from nexy.compiler.parser.sanitizer import LogicSanitizer
+from nexy.compiler.parser.template import NexyParserError, TemplateParser
+from nexy.routers.context import current_request
+from nexy.utils.imports.ncc import NCC, IslandHTML
+from nexy.utils.mode import is_prod
+
+
+@pytest.fixture
+def Count(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    return Import(path="src/components/count.tsx", framework="react", symbol="Count")
+
+
+class TestHydrationDirective:
+    def test_default_strategy_adds_no_attribute(self, Count):
+        assert "data-nexy-hydrate" not in Count(start=1)
+        assert "data-nexy-hydrate" not in Count(start=1, hydrate="load")
+
+    def test_strategy_is_emitted_and_not_passed_as_a_prop(self, Count):
+        html = Count(start=1, hydrate="visible")
+        assert 'data-nexy-hydrate="visible"' in html
+        assert 'data-nexy-props="{&quot;start&quot;: 1}"' in html
+
+    def test_media_query(self, Count):
+        html = Count(hydrate="media:(max-width: 600px)")
+        assert 'data-nexy-hydrate="media" data-nexy-media="(max-width: 600px)"' in html
+
+    def test_unknown_strategy_fails_at_compile_time(self, Count):
+        parser = TemplateParser()
+        island = {"known_components": {"Count"}, "islands": {"Count"}}
+        with pytest.raises(NexyParserError, match="<Count>: Unknown hydration strategy 'lazy'"):
+            parser.parse('<Count hydrate="lazy" />', **island)
+        assert parser.parse('<Count hydrate="{{ mode }}" />', **island)
+        # A value only known at render time hydrates on load instead of failing the request
+        assert "data-nexy-hydrate" not in Count(hydrate="lazy")
+
+    def test_nexy_components_keep_hydrate_as_a_prop(self):
+        parser = TemplateParser()
+        html = parser.parse('<Card hydrate="lazy" />', known_components={"Card"})
+        assert html == '{{ Card(hydrate="lazy") }}'
+
+    def test_parser_knows_client_imports(self):
+        source = (
+            "---\n"
+            'from "src/components/count.tsx" import Count\n'
+            'from "src/components/card.nexy" import Card\n'
+            "---\n"
+        )
+        route = "src/routes/index.nexy"
+        with pytest.raises(NexyParserError, match="<Count>"):
+            Parser().process(source + '<Count hydrate="lazy" />', current_file=route)
+        card = Parser().process(source + '<Card hydrate="lazy" />', current_file=route)
+        assert "hydrate" in card.template
+
+
+class TestIslandHTML:
+    @pytest.fixture
+    def static(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setattr(IslandHTML, "_files", None)
+        monkeypatch.setattr(IslandHTML, "_lookups", {})
+        root = tmp_path / "__nexy__/client/static/src/components"
+        root.mkdir(parents=True)
+        (root / "count.Count.html").write_text("<button>0</button>", encoding="utf-8")
+        (root / "count.Default.html").write_text("<span>default</span>", encoding="utf-8")
+        is_prod.cache_clear()
+        yield root
+        is_prod.cache_clear()
+
+    def test_dev_reads_the_latest_build(self, static):
+        assert IslandHTML.get("/src/components/count.tsx", "Count", "react") == "<button>0</button>"
+        fallback = IslandHTML.get("/src/components/count.tsx", "Other", "react")
+        assert fallback == "<span>default</span>"
+        (static / "count.Count.html").write_text("<button>1</button>", encoding="utf-8")
+        assert IslandHTML.get("/src/components/count.tsx", "Count", "react") == "<button>1</button>"
+
+    def test_production_serves_the_preloaded_index(self, static, Count):
+        (static.parents[3] / "nexy.prod").write_text("", encoding="utf-8")
+        assert IslandHTML.preload() == 2
+        for html in static.iterdir():
+            html.unlink()
+        assert IslandHTML.get("/src/components/count.tsx", "Count", "react") == "<button>0</button>"
+        rendered = Count()
+        assert "<button>0</button></ncc>" in rendered
+        assert "data-nexy-path" not in rendered
+
+
+class TestCompiledImports:
+    def test_url_and_key_are_compiled_constants(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        source = 'from "src/components/count.tsx" import Count'
+        line = LogicSanitizer().sanitize(source, "src/routes/index.nexy")
+        key = hashlib.md5(b"/src/components/count.tsx").hexdigest()
+        assert f'url="/src/components/count.tsx", key="{key}")' in line
+
+        # Nothing left to resolve when the component renders
+        unresolved = staticmethod(lambda path: pytest.fail(f"resolved {path}"))
+        monkeypatch.setattr(NCC, "resolve_url", unresolved)
+        count = Import("src/components/count.tsx", "react", "Count",
+                       url="/src/components/count.tsx", key=key)
+        html = count()
+        assert f'data-nexy-key="{key}"' in html
+
+    @pytest.mark.usefixtures("Count")
+    def test_mount_ids_are_numbered_per_request(self):
+        def render_page():
+            token = current_request.set(Request({"type": "http", "headers": []}))
+            try:
+                # Every component render builds its own __Import
+                first = Import(path="src/components/count.tsx", framework="react", symbol="Count")
+                second = Import(path="src/components/count.tsx", framework="react", symbol="Count")
+                return [html.split('"')[1] for html in (first(), second(), first())]
+            finally:
+                current_request.reset(token)
+
+        ids = render_page()
+        assert len(set(ids)) == 3
+        assert ids[0].endswith("-Count-1") and ids[2].endswith("-Count-3")
+        assert render_page() == ids
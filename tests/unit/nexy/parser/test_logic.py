@@ -0,0 +1,55 @@
+from nexy.compiler.parser.logic import LogicParser
+
+
+class TestComponentOptions:
+    def test_literal_option_is_hoisted(self):
+        result = LogicParser().process('stream = True\nname = "post"', current_file="src/routes/index.nexy")
+        assert result.options == {"stream": True}
+        assert "stream" not in result.python_code
+        assert "name = 'post'" in result.python_code
+
+    def test_computed_option_stays_in_logic(self):
+        result = LogicParser().process("stream = is_enabled()", current_file="src/routes/index.nexy")
+        assert result.options == {}
+        assert "stream = is_enabled()" in result.python_code
+
+    def test_bindings_of_another_type_stay_in_context(self):
+        code = 'backend = "Django"\nstream = "live"\ncache = "redis"\nmemo = 1\nrevalidate = True'
+        result = LogicParser().process(code, current_file="src/routes/index.nexy")
+        assert result.options == {}
+        for line in ("backend = 'Django'", "stream = 'live'", "cache = 'redis'", "memo = 1", "revalidate = True"):
+            assert line in result.python_code
+
+    def test_typed_options_are_hoisted(self):
+        code = 'backend = "native"\nrevalidate = 30\ncache = {"max_age": 60}\nmemo = True'
+        result = LogicParser().process(code, current_file="src/routes/index.nexy")
+        assert result.options == {"backend": "native", "revalidate": 30, "cache": {"max_age": 60}, "memo": True}
+
+    def test_cache_dicts_of_data_stay_in_context(self):
+        code = 'cache = {"users": []}\nempty = 1'
+        result = LogicParser().process(code, current_file="src/components/list.nexy")
+        assert result.options == {}
+        assert "cache = {'users': []}" in result.python_code
+        for code in ("cache = {}", "cache = {[1]: 2}"):
+            assert LogicParser().process(code, current_file="src/routes/index.nexy").options == {}
+        code = 'cache = {"s-maxage": 600, "vary": "Cookie"}'
+        assert LogicParser().process(code, current_file="src/routes/index.nexy").options["cache"]["s-maxage"] == 600
+
+
+class TestAsyncDetection:
+    def test_top_level_await_marks_component_async(self):
+        result = LogicParser().process("data = await fetch_data()", current_file="src/routes/index.nexy")
+        assert result.is_async is True
+
+    def test_await_inside_nested_function_is_ignored(self):
+        code = "async def load():\n    return await fetch_data()\nname = 'post'"
+        result = LogicParser().process(code, current_file="src/routes/index.nexy")
+        assert result.is_async is False
+
+
+class TestComponentHooks:
+    def test_static_params_is_moved_to_module(self):
+        code = "def static_params():\n    return [{'slug': 'a'}]\nname = 'post'"
+        result = LogicParser().process(code, current_file="src/routes/[slug].nexy")
+        assert result.hooks == ["def static_params():\n    return [{'slug': 'a'}]"]
+        assert "static_params" not in result.python_code
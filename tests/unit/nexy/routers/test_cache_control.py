@@ -0,0 +1,118 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import FastAPI, HTTPException, Response
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from nexy.decorators import Controller, Module, UseCache
+from nexy.routers.fbrouter.cache import POLICY_ATTR, CachePolicy
+from nexy.routers.fbrouter.response import RouteResponse
+
+
+def Page(name: str = "home") -> str:
+    return f"<p>{name}</p>"
+
+
+class TestCachePolicy:
+    def test_directives(self):
+        policy = CachePolicy(max_age=60, s_maxage=600, stale_while_revalidate=30)
+        assert policy.cache_control() == "public, max-age=60, s-maxage=600, stale-while-revalidate=30"
+        # Shared caches never store a private response
+        assert CachePolicy(max_age=60, s_maxage=600, private=True).cache_control() == "private, max-age=60"
+
+    def test_resolve_declared_values(self):
+        assert CachePolicy.resolve(120).max_age == 120
+        policy = CachePolicy.resolve({"s-maxage": 300, "vary": "Cookie"})
+        assert policy.s_maxage == 300 and policy.vary == ["Cookie"]
+        # `from functools import cache` in a route module is not a policy
+        assert CachePolicy.resolve(lambda: None) is None
+        assert CachePolicy.resolve(True) is None
+
+    def test_dicts_must_only_hold_policy_options(self):
+        for value in ({}, {"users": []}, {"max_age": 60, "maxage": 60}):
+            with pytest.raises(ValueError, match="/blog"):
+                CachePolicy.resolve(value, "/blog")
+
+    def test_module_policy_uses_a_dedicated_attribute(self):
+        # A route's own `cache` data is not a policy; only a CachePolicy instance is
+        assert CachePolicy.declared(SimpleNamespace(cache={"users": []})) is None
+        assert CachePolicy.declared(SimpleNamespace(cache=60)) is None
+        assert CachePolicy.declared(SimpleNamespace(cache=CachePolicy(30))).max_age == 30
+        # Compiled pages keep their `cache` option under POLICY_ATTR
+        compiled = SimpleNamespace(**{POLICY_ATTR: {"max-age": 60}, "cache": {"users": []}})
+        assert CachePolicy.declared(compiled).max_age == 60
+
+
+class TestCacheControl:
+    def test_pages_and_304_carry_the_policy(self):
+        policy = CachePolicy(max_age=0, s_maxage=600, vary=["Accept-Language"])
+        app = FastAPI()
+        app.get("/page", response_class=HTMLResponse)(
+            RouteResponse.cache_control(RouteResponse.conditional(Page), policy)
+        )
+        client = TestClient(app)
+
+        first = client.get("/page")
+        assert first.headers["cache-control"] == "public, max-age=0, s-maxage=600"
+        assert first.headers["vary"] == "Accept-Language"
+        revisit = client.get("/page", headers={"If-None-Match": first.headers["etag"]})
+        assert revisit.status_code == 304
+        assert revisit.headers["cache-control"] == first.headers["cache-control"]
+
+    def test_json_handlers_and_errors(self):
+        async def GET(item: int) -> dict:
+            if item == 0:
+                raise HTTPException(status_code=404)
+            return {"item": item}
+
+        app = FastAPI()
+        app.get("/items/{item}")(RouteResponse.cache_control(GET, CachePolicy(max_age=30, private=True)))
+        client = TestClient(app)
+
+        found = client.get("/items/3")
+        assert found.json() == {"item": 3}
+        assert found.headers["cache-control"] == "private, max-age=30"
+        assert "cache-control" not in client.get("/items/0").headers
+
+    def test_handler_header_wins(self):
+        def GET() -> Response:
+            return Response("fresh", headers={"Cache-Control": "no-store"})
+
+        app = FastAPI()
+        app.get("/")(RouteResponse.cache_control(GET, CachePolicy(max_age=60)))
+        assert TestClient(app).get("/").headers["cache-control"] == "no-store"
+
+    def test_reused_response_keeps_one_vary(self):
+        cached = HTMLResponse(Page())
+
+        app = FastAPI()
+        app.get("/")(RouteResponse.cache_control(lambda: cached, CachePolicy(max_age=60, vary=["Cookie"])))
+        client = TestClient(app)
+        assert client.get("/").headers["vary"] == "Cookie"
+        assert client.get("/").headers["vary"] == "Cookie"
+
+
+class TestUseCache:
+    def test_method_policy_overrides_controller_policy(self):
+        @Controller(prefix="/articles")
+        @UseCache(max_age=60)
+        class ArticlesController:
+            @UseCache(s_maxage=3600, stale_while_revalidate=60)
+            def get(self) -> list:
+                return []
+
+            def post(self) -> dict:
+                return {}
+
+        @Module()
+        class ArticlesModule:
+            controllers = [ArticlesController]
+
+        app = FastAPI()
+        app.include_router(ArticlesModule)
+        client = TestClient(app)
+
+        cached = client.get("/articles/")
+        assert cached.headers["cache-control"] == "public, max-age=0, s-maxage=3600, stale-while-revalidate=60"
+        assert "cache-control" not in client.post("/articles/").headers
@@ -0,0 +1,148 @@
+import gzip
+import zlib
+from types import SimpleNamespace
+
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.responses import HTMLResponse, StreamingResponse
+from fastapi.testclient import TestClient
+
+import nexy.routers.app as app_module
+from nexy.builder.static import StaticExporter
+from nexy.core.config import Config
+from nexy.routers.app import AppServer
+from nexy.routers.compression import CompressionMiddleware
+from nexy.utils.mode import is_prod
+
+PAGE = "<p>Nexy</p>" * 200
+
+
+def make_client(**options) -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, **options)
+
+    @app.get("/page", response_class=HTMLResponse)
+    def page():
+        return PAGE
+
+    @app.get("/small", response_class=HTMLResponse)
+    def small():
+        return "<p>hi</p>"
+
+    @app.get("/json")
+    def data():
+        return {"items": list(range(500))}
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(iter(["<head></head>", PAGE, "</html>"]), media_type="text/html")
+
+    @app.get("/encoded")
+    def encoded():
+        return HTMLResponse(gzip.compress(PAGE.encode()), headers={"content-encoding": "gzip"})
+
+    return TestClient(app)
+
+
+def raw(client: TestClient, path: str, accept: str = "gzip"):
+    with client.stream("GET", path, headers={"Accept-Encoding": accept}) as response:
+        return response, b"".join(response.iter_raw())
+
+
+class TestCompressionMiddleware:
+    def test_pages_and_json_are_gzipped(self):
+        client = make_client()
+        for path in ("/page", "/json"):
+            response, body = raw(client, path)
+            assert response.headers["content-encoding"] == "gzip"
+            assert response.headers["content-length"] == str(len(body))
+            assert "Accept-Encoding" in response.headers["vary"]
+            assert gzip.decompress(body)
+
+    def test_small_bodies_and_unsupported_clients_are_untouched(self):
+        client = make_client(minimum_size=100)
+        assert "content-encoding" not in raw(client, "/small")[0].headers
+        response, body = raw(client, "/page", accept="identity")
+        assert "content-encoding" not in response.headers
+        assert body.decode() == PAGE
+
+    def test_streamed_chunks_are_flushed_one_by_one(self):
+        response, body = raw(make_client(), "/stream")
+        assert response.headers["content-encoding"] == "gzip"
+        assert "content-length" not in response.headers
+        assert zlib.decompress(body, 31).decode() == "<head></head>" + PAGE + "</html>"
+
+    def test_encoded_responses_are_not_compressed_twice(self):
+        response, body = raw(make_client(), "/encoded")
+        assert gzip.decompress(body).decode() == PAGE
+
+    def test_reused_response_is_not_altered(self):
+        cached = HTMLResponse(PAGE)
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        app.get("/cached")(lambda: cached)
+        client = TestClient(app)
+
+        for _ in range(2):
+            response, body = raw(client, "/cached")
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert gzip.decompress(body).decode() == PAGE
+        response, body = raw(client, "/cached", accept="identity")
+        assert "content-encoding" not in response.headers
+        assert body.decode() == PAGE
+        assert "content-encoding" not in cached.headers
+
+    def test_levels_are_configurable(self):
+        # Gzip header XFL byte: 2 for the best level, 4 for the fastest
+        assert raw(make_client(gzip_level=9), "/json")[1][8] == 2
+        assert raw(make_client(gzip_level=1), "/json")[1][8] == 4
+
+
+@pytest.fixture
+def server(tmp_path, monkeypatch):
+    """AppServer with its own middleware stack (PathMiddleware re-streams every body)."""
+    monkeypatch.chdir(tmp_path)
+    is_prod.cache_clear()
+    router = APIRouter()
+    router.get("/page", response_class=HTMLResponse)(lambda: PAGE)
+    router.get("/small", response_class=HTMLResponse)(lambda: "<p>Nexy</p>" * 15)
+    nexy_config = SimpleNamespace(useDocs=False, useRouter=router)
+    settings = SimpleNamespace(nexy_config=nexy_config, useCompression=True)
+
+    def build() -> TestClient:
+        is_prod.cache_clear()
+        return TestClient(AppServer(settings).run())
+
+    yield build
+    is_prod.cache_clear()
+
+
+class TestAppServerCompression:
+    def test_minimum_size_and_length_survive_the_middleware_stack(self, server):
+        client = server()
+        response, body = raw(client, "/small")
+        assert "content-encoding" not in response.headers
+        assert response.headers["content-length"] == str(len(body)) == "165"
+
+        response, body = raw(client, "/page")
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-length"] == str(len(body))
+        assert gzip.decompress(body).decode() == PAGE
+
+    def test_exported_pages_are_served_precompressed(self, server, monkeypatch, tmp_path):
+        monkeypatch.setattr(StaticExporter, "urls", lambda _self: ["/page"])
+        exporting = SimpleNamespace(run=lambda: server().app)
+        monkeypatch.setattr(app_module, "AppServer", lambda: exporting)
+        StaticExporter().export()
+        (tmp_path / Config.PROD_FLAG).write_text("", encoding="utf-8")
+        client = server()
+
+        response, body = raw(client, "/page")
+        # Served from the exported file, not rendered and compressed again
+        assert response.headers["accept-ranges"] == "bytes"
+        assert response.headers["content-encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["vary"]
+        assert gzip.decompress(body).decode() == PAGE
+        response, body = raw(client, "/page", accept="identity")
+        assert "content-encoding" not in response.headers
+        assert body.decode() == PAGE
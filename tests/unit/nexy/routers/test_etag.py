@@ -0,0 +1,55 @@
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from nexy.routers.compression import CompressionMiddleware
+from nexy.routers.fbrouter.response import RouteResponse
+
+
+def Page(name: str = "home") -> str:
+    return f"<p>{name}</p>" * 100
+
+
+def make_client(endpoint) -> TestClient:
+    app = FastAPI()
+    app.get("/page", response_class=HTMLResponse)(endpoint)
+    return TestClient(app)
+
+
+class TestConditionalGet:
+    def test_pages_carry_an_etag_and_answer_304(self):
+        client = make_client(RouteResponse.conditional(Page))
+        first = client.get("/page")
+        etag = first.headers["etag"]
+        assert first.status_code == 200 and first.text == Page()
+
+        revisit = client.get("/page", headers={"If-None-Match": etag})
+        assert revisit.status_code == 304
+        assert revisit.headers["etag"] == etag
+        assert revisit.content == b""
+
+        other = client.get("/page?name=blog", headers={"If-None-Match": etag})
+        assert other.status_code == 200 and other.headers["etag"] != etag
+
+    def test_cached_pages_are_hashed_once_per_render(self, monkeypatch):
+        calls = []
+        original = RouteResponse.etag
+        monkeypatch.setattr(RouteResponse, "etag", staticmethod(lambda html: calls.append(1) or original(html)))
+        tagged = RouteResponse.tagged(RouteResponse.collect(Page))
+        client = make_client(RouteResponse.conditional(RouteResponse.revalidate(tagged, 60)))
+
+        etag = client.get("/page").headers["etag"]
+        assert client.get("/page", headers={"If-None-Match": etag}).status_code == 304
+        assert client.get("/page").text == Page()
+        assert len(calls) == 1
+
+    def test_compressed_etag_still_revalidates(self):
+        app = FastAPI()
+        app.add_middleware(CompressionMiddleware)
+        app.get("/page", response_class=HTMLResponse)(RouteResponse.conditional(Page))
+        client = TestClient(app)
+
+        etag = client.get("/page", headers={"Accept-Encoding": "gzip"}).headers["etag"]
+        assert etag.endswith('-gzip"')
+        revisit = client.get("/page", headers={"Accept-Encoding": "gzip", "If-None-Match": etag})
+        assert revisit.status_code == 304
@@ -0,0 +1,74 @@
+import asyncio
+
+from starlette.requests import Request
+
+from nexy.routers.context import current_request, memo
+
+
+def make_request() -> Request:
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": []})
+
+
+def counting_badge(calls):
+    @memo
+    def Badge(status: str = "ok", caller=None) -> str:
+        calls.append(status)
+        return f"<span>{status}{caller() if caller else ''}</span>"
+    return Badge
+
+
+class TestRequestMemo:
+    def test_same_props_render_once_per_request(self):
+        calls = []
+        Badge = counting_badge(calls)
+        token = current_request.set(make_request())
+        try:
+            assert [Badge(status="ok") for _ in range(3)] == ["<span>ok</span>"] * 3
+            Badge(status="ko")
+        finally:
+            current_request.reset(token)
+        assert calls == ["ok", "ko"]
+
+    def test_cache_does_not_outlive_the_request(self):
+        calls = []
+        Badge = counting_badge(calls)
+        for _ in range(2):
+            token = current_request.set(make_request())
+            try:
+                Badge(status="ok")
+            finally:
+                current_request.reset(token)
+        assert calls == ["ok", "ok"]
+
+    def test_unhashable_props_slots_and_no_request_are_not_memoized(self):
+        calls = []
+        Badge = counting_badge(calls)
+        Badge(status="ok")
+        Badge(status="ok")
+        token = current_request.set(make_request())
+        try:
+            Badge(status=["a"])
+            Badge(status=["a"])
+            Badge(status="ok", caller=lambda: "")
+            Badge(status="ok", caller=lambda: "")
+        finally:
+            current_request.reset(token)
+        assert len(calls) == 6
+
+    def test_async_components(self):
+        calls = []
+
+        @memo
+        async def Card(title: str = "") -> str:
+            calls.append(title)
+            return title
+
+        async def render():
+            token = current_request.set(make_request())
+            try:
+                return [await Card(title="a"), await Card(title="a")]
+            finally:
+                current_request.reset(token)
+
+        assert asyncio.run(render()) == ["a", "a"]
+        assert calls == ["a"]
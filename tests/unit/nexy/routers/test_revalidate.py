@@ -0,0 +1,71 @@
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.responses import HTMLResponse
+from fastapi.testclient import TestClient
+
+from nexy.routers.context import current_request
+from nexy.routers.fbrouter.revalidate import RevalidateCache
+from nexy.routers.fbrouter.response import RouteResponse
+
+
+def make_client(handler, seconds=60):
+    app = FastAPI()
+    app.get("/page", response_class=HTMLResponse)(RouteResponse.revalidate(handler, seconds))
+    return TestClient(app)
+
+
+class TestRevalidate:
+    def test_pages_are_cached_per_url(self):
+        calls = []
+
+        def Page(name: str = "home") -> str:
+            calls.append(name)
+            return f"<p>{name}</p>"
+
+        client = make_client(Page)
+        assert client.get("/page").text == "<p>home</p>"
+        assert client.get("/page").text == "<p>home</p>"
+        assert client.get("/page?name=blog").text == "<p>blog</p>"
+        assert calls == ["home", "blog"]
+
+    def test_stale_page_is_served_while_regenerating(self):
+        renders = iter(["<p>1</p>", "<p>2</p>"])
+
+        async def Page() -> str:
+            return next(renders)
+
+        client = make_client(Page, seconds=0.05)
+        assert client.get("/page").text == "<p>1</p>"
+        time.sleep(0.1)
+        # Stale hit: old HTML now, fresh HTML once the background render is done
+        assert client.get("/page").text == "<p>1</p>"
+        assert client.get("/page").text == "<p>2</p>"
+
+    def test_background_render_sees_the_request_context(self):
+        cache = RevalidateCache(0)
+        seen = []
+        done = threading.Event()
+
+        def render() -> str:
+            seen.append(current_request.get())
+            done.set()
+            return "<p>page</p>"
+
+        cache.get("/page", render)
+        done.clear()
+        token = current_request.set("request")
+        try:
+            assert cache.get("/page", render) == "<p>page</p>"
+        finally:
+            current_request.reset(token)
+        assert done.wait(1)
+        assert seen == [None, "request"]
+
+    def test_streaming_component_is_collected(self):
+        def Page() -> str:
+            return iter(["<p>", "chunk", "</p>"])
+
+        client = make_client(RouteResponse.collect(Page))
+        assert client.get("/page").text == "<p>chunk</p>"
@@ -0,0 +1,33 @@
+import gzip
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from nexy.routers.staticfiles import PrecompressedStaticFiles
+
+CSS = ".badge { color: red; }\n" * 200
+
+
+def make_client(tmp_path) -> TestClient:
+    (tmp_path / "app.css").write_text(CSS)
+    (tmp_path / "app.css.gz").write_bytes(gzip.compress(CSS.encode()))
+    app = FastAPI()
+    app.mount("/assets", PrecompressedStaticFiles(directory=tmp_path))
+    return TestClient(app)
+
+
+class TestPrecompressedStaticFiles:
+    def test_serves_the_gzip_variant_when_accepted(self, tmp_path):
+        response = make_client(tmp_path).get("/assets/app.css", headers={"Accept-Encoding": "gzip, br"})
+        assert response.headers["content-encoding"] == "gzip"
+        assert response.headers["content-type"].startswith("text/css")
+        assert response.headers["vary"] == "Accept-Encoding"
+        assert response.text == CSS
+
+    def test_serves_the_original_otherwise(self, tmp_path):
+        client = make_client(tmp_path)
+        for accept in ("identity", "gzip;q=0"):
+            response = client.get("/assets/app.css", headers={"Accept-Encoding": accept})
+            assert "content-encoding" not in response.headers
+            assert response.headers["vary"] == "Accept-Encoding"
+            assert response.text == CSS
@@ -0,0 +1,170 @@
+import pytest
+
+import nexy.template as template_module
+from nexy.core.config import Config
+from nexy.errors import NexyCompileError
+from nexy.template import Template, get_environment
+from nexy.utils.mode import is_prod
+
+
+@pytest.fixture(autouse=True)
+def fresh_environment(monkeypatch):
+    """Each test starts without a process-wide environment."""
+    monkeypatch.setattr(template_module, "_envs", {})
+    is_prod.cache_clear()
+    yield
+    is_prod.cache_clear()
+
+
+class TestSharedEnvironment:
+    def test_templates_share_one_environment(self):
+        assert Template().env is Template().env
+        assert Template().env is get_environment()
+
+    def test_compiled_template_is_cached(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "page.html").write_text("<p>{{ name }}</p>")
+
+        first = get_environment().get_template("page.html")
+        second = get_environment().get_template("page.html")
+
+        assert first is second
+        assert Template().render("page.html", {"name": "Nexy"}) == "<p>Nexy</p>"
+
+    def test_dev_mode_checks_mtime(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        assert get_environment().auto_reload is True
+
+    def test_prod_mode_disables_auto_reload(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "__nexy__").mkdir()
+        (tmp_path / "__nexy__" / "nexy.prod").write_text("1")
+
+        assert get_environment().auto_reload is False
+
+
+class TestPrecompiledTemplates:
+    def test_prod_renders_from_compiled_modules(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        page = tmp_path / "__nexy__" / "page.html"
+        page.parent.mkdir()
+        page.write_text("<p>{{ name }}</p>")
+
+        assert template_module.compile_templates(["__nexy__/page.html"]) == ["__nexy__/page.html"]
+
+        # A fresh production process never reads the template source again
+        page.unlink()
+        (tmp_path / "__nexy__" / "nexy.prod").write_text("1")
+        monkeypatch.setattr(template_module, "_envs", {})
+        is_prod.cache_clear()
+
+        assert Template().render("__nexy__/page.html", {"name": "Nexy"}) == "<p>Nexy</p>"
+
+    def test_failed_precompile_keeps_the_previous_modules(self, tmp_path, monkeypatch):
+        monkeypatch.chdir(tmp_path)
+        page = tmp_path / "__nexy__" / "page.html"
+        page.parent.mkdir()
+        page.write_text("<p>{{ name }}</p>")
+        template_module.compile_templates(["__nexy__/page.html"])
+        modules = sorted(p.name for p in (tmp_path / Config.COMPILED_TEMPLATES_PATH).rglob("*.py"))
+
+        (tmp_path / "__nexy__" / "broken.html").write_text("{% if %}")
+        with pytest.raises(NexyCompileError) as error:
+            template_module.compile_templates(["__nexy__/page.html", "__nexy__/broken.html"])
+        assert error.value.source_path == "__nexy__/broken.html"
+        assert sorted(p.name for p in (tmp_path / Config.COMPILED_TEMPLATES_PATH).rglob("*.py")) == modules
+
+
+class TestAsyncRendering:
+    def test_async_environment_is_separate(self):
+        assert get_environment(is_async=True) is not get_environment()
+        assert get_environment(is_async=True).is_async is True
+
+    def test_render_async_awaits_coroutines(self, tmp_path, monkeypatch):
+        import asyncio
+
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "page.html").write_text("<p>{{ load() }}</p>")
+
+        async def load():
+            return "Nexy"
+
+        rendered = asyncio.run(Template().render_async("page.html", {"load": load}))
+        assert rendered == "<p>Nexy</p>"
+
+
+class TestHighlightCache:
+    def test_code_blocks_are_highlighted_once(self, tmp_path, monkeypatch):
+        from nexy.utils import highlight
+
+        monkeypatch.chdir(tmp_path)
+        highlight.get_highlight_cache.cache_clear()
+        calls = []
+        original = highlight.Highlight.highlight
+        monkeypatch.setattr(highlight.Highlight, "highlight", lambda self, *a, **k: calls.append(a) or original(self, *a, **k))
+
+        source = "```python\nprint('hi')\n```"
+        first = template_module.render_markdown(source)
+        second = template_module.render_markdown(source)
+
+        assert first == second
+        assert len(calls) == 1
+        assert any((tmp_path / "__nexy__" / "cache" / "highlight").iterdir())
+        highlight.get_highlight_cache.cache_clear()
+
+
+class TestFragmentCache:
+    @pytest.fixture(autouse=True)
+    def fresh_cache(self, tmp_path, monkeypatch):
+        from nexy.utils import fragments
+
+        monkeypatch.chdir(tmp_path)
+        fragments.get_fragment_cache.cache_clear()
+        yield
+        fragments.get_fragment_cache.cache_clear()
+
+    def test_fragment_is_rendered_once(self, tmp_path):
+        (tmp_path / "page.html").write_text("{% cache 'sidebar', 60 %}<p>{{ load() }}</p>{% endcache %}")
+        calls = []
+
+        def load():
+            calls.append(1)
+            return len(calls)
+
+        assert Template().render("page.html", {"load": load}) == "<p>1</p>"
+        assert Template().render("page.html", {"load": load}) == "<p>1</p>"
+        assert len(calls) == 1
+
+    def test_keys_are_distinct(self, tmp_path):
+        (tmp_path / "page.html").write_text("{% cache ('user', name) %}{{ name }}{% endcache %}")
+        assert Template().render("page.html", {"name": "a"}) == "a"
+        assert Template().render("page.html", {"name": "b"}) == "b"
+
+    def test_blocks_do_not_share_entries(self, tmp_path):
+        (tmp_path / "a.html").write_text("{% cache 'sidebar' %}<p>a</p>{% endcache %}")
+        (tmp_path / "b.html").write_text("{% cache 'sidebar' %}<p>b</p>{% endcache %}")
+        assert Template().render("a.html", {}) == "<p>a</p>"
+        assert Template().render("b.html", {}) == "<p>b</p>"
+
+    def test_edited_block_is_rendered_again(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(Config, "useFragmentCache", "disk", raising=False)
+        (tmp_path / "page.html").write_text("{% cache 'sidebar' %}<p>old</p>{% endcache %}")
+        assert Template().render("page.html", {}) == "<p>old</p>"
+        # Same template, same line: a new process reading the edited source
+        (tmp_path / "page.html").write_text("{% cache 'sidebar' %}<p>new</p>{% endcache %}")
+        monkeypatch.setattr(template_module, "_envs", {})
+        assert Template().render("page.html", {}) == "<p>new</p>"
+
+    def test_async_environment(self, tmp_path):
+        import asyncio
+
+        (tmp_path / "page.html").write_text("{% cache 'async' %}<p>{{ load() }}</p>{% endcache %}")
+
+        async def load():
+            return "Nexy"
+
+        async def twice():
+            return [await Template().render_async("page.html", {"load": load}) for _ in range(2)]
+
+        assert asyncio.run(twice()) == ["<p>Nexy</p>", "<p>Nexy</p>"]
+